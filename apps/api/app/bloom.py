@@ -0,0 +1,144 @@
+"""사용자별 canonical_url 블룸 필터.
+
+수집 결과 대부분은 이미 저장된 URL 이라, 저장 전 존재 확인 SELECT 의 대부분이 "이미 있음"으로 끝난다.
+필터가 "없음"이라고 하면 확실히 새 URL 이므로 DB 를 보지 않고, "있을 수도 있음"인 URL 만 조회한다.
+
+- 필터는 사용자별로 처음 필요할 때 Article 에서 한 번 만들고, 이후 저장하는 URL 을 더한다.
+- 저장은 INSERT ... ON CONFLICT DO NOTHING RETURNING 이라 새 기사 id 를 다시 조회하지 않는다. 다른 워커가 넣은
+  URL 을 필터가 모르더라도 충돌로 무시된 URL 만 다시 읽으므로 결과가 틀리지 않는다.
+- 원소 수가 용량을 넘으면 거짓 양성률이 오르므로 다음 조회 때 두 배 용량으로 다시 만든다.
+- 프로세스 메모리에만 두고(영속화 안 함), 사용자 수는 LRU 로 제한한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from .settings import settings
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, fp_rate: float) -> None:
+        self.capacity = max(1, capacity)
+        self.fp_rate = min(max(fp_rate, 1e-6), 0.5)
+        # 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = m/n ln 2
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(self.fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str) -> Iterable[int]:
+        # 128비트 해시 하나를 둘로 나눠 double hashing (Kirsch–Mitzenmacher)
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, value: str) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.bits)
+
+    def estimated_fp_rate(self) -> float:
+        """현재 원소 수 기준 거짓 양성률 추정치 (1 - e^(-kn/m))^k."""
+        k, m, n = self.num_hashes, self.num_bits, self.count
+        return (1 - math.exp(-k * n / m)) ** k
+
+
+class UrlFilterRegistry:
+    def __init__(self) -> None:
+        self._filters: OrderedDict[UUID, BloomFilter] = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.probes = 0
+        self.definitely_new = 0
+        self.probable_hits = 0
+        self.false_positives = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.url_bloom_enabled
+
+    def _build(self, session: Session, user_id: UUID, min_capacity: int) -> BloomFilter:
+        from .domains.content.models import Article
+
+        urls = session.exec(select(Article.canonical_url).where(Article.user_id == user_id)).all()
+        capacity = max(settings.url_bloom_min_capacity, min_capacity, 2 * len(urls))
+        flt = BloomFilter(capacity, settings.url_bloom_fp_rate)
+        for url in urls:
+            flt.add(url)
+        self.builds += 1
+        return flt
+
+    def get(self, session: Session, user_id: UUID) -> Optional[BloomFilter]:
+        """사용자 필터(없거나 포화되면 DB 에서 새로 만듦). 비활성이면 None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            flt = self._filters.get(user_id)
+            if flt is not None and not flt.saturated:
+                self._filters.move_to_end(user_id)
+                return flt
+        flt = self._build(session, user_id, 2 * flt.capacity if flt is not None else 0)
+        with self._lock:
+            self._filters[user_id] = flt
+            self._filters.move_to_end(user_id)
+            while len(self._filters) > max(1, settings.url_bloom_max_users):
+                self._filters.popitem(last=False)
+        return flt
+
+    def split(self, flt: Optional[BloomFilter], urls: list[str]) -> list[str]:
+        """DB 확인이 필요한(있을 수도 있는) URL 만 반환."""
+        if flt is None:
+            return urls
+        probable = [u for u in urls if u in flt]
+        self.probes += len(urls)
+        self.probable_hits += len(probable)
+        self.definitely_new += len(urls) - len(probable)
+        return probable
+
+    def record_false_positives(self, count: int) -> None:
+        self.false_positives += count
+
+    def stats(self) -> dict:
+        with self._lock:
+            filters = list(self._filters.values())
+        return {
+            "enabled": self.enabled,
+            "users": len(filters),
+            "max_users": settings.url_bloom_max_users,
+            "target_fp_rate": settings.url_bloom_fp_rate,
+            "memory_bytes": sum(f.size_bytes for f in filters),
+            "max_estimated_fp_rate": round(max((f.estimated_fp_rate() for f in filters), default=0.0), 6),
+            "builds": self.builds,
+            "probes": self.probes,
+            "definitely_new": self.definitely_new,
+            "probable_hits": self.probable_hits,
+            "false_positives": self.false_positives,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._filters.clear()
+        self.builds = self.probes = self.definitely_new = self.probable_hits = self.false_positives = 0
+
+
+url_filters = UrlFilterRegistry()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import re
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Iterable, Optional
+from typing import AsyncIterator, Iterable, Optional, Sequence
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from zoneinfo import ZoneInfo
 
@@ -10,7 +12,12 @@ import feedparser
 import httpx
 from dateutil import parser as dtparser
 
+from .feed_cache import CachedFeed, FeedEntry, feed_cache
+from .fetch_cache import cache_key, fetch_cache
+from .http_clients import http_clients
+from .latency import resilient_get
 from .settings import settings
+from .sources import ConcurrencyLimit, SourceRun, SourceUnavailable, source_registry
 
 try:
     KST = ZoneInfo("Asia/Seoul")
@@ -39,6 +46,10 @@ def canonicalize_url(url: str) -> str:
         return url
 
 
+GDELT_DOC_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+GOOGLE_NEWS_RSS_URL = "https://news.google.com/rss/search"
+
+
 @dataclass(frozen=True)
 class CollectedItem:
     url: str
@@ -51,30 +62,21 @@ class CollectedItem:
     published_at: Optional[datetime]
 
 
-async def search_gdelt(*, keyword: str, day: date, max_records: int = 25) -> list[CollectedItem]:
-    if settings.collector_mode.lower() == "mock":
-        if "force_rss" in keyword.lower():
-            return []
-        now = datetime.now().astimezone()
-        return [
-            CollectedItem(
-                url="https://example.com/mock/search/1",
-                canonical_url="https://example.com/mock/search/1",
-                title=f"[MOCK] {keyword} 검색 결과 1",
-                snippet="Mock snippet",
-                source_name="MockSearch",
-                source_type="search_api",
-                language="en",
-                published_at=now,
-            )
-        ]
+# GDELT doc API 는 긴 query 를 거절한다. 묶음 조회 시 OR 식 전체 길이 상한.
+GDELT_MAX_QUERY_CHARS = 250
+GDELT_MAX_RECORDS = 250
+
+
+async def _gdelt_articles(query: str, day: date, max_records: int, since: Optional[datetime]) -> list[CollectedItem]:
     start_utc, end_utc = kst_day_bounds_utc(day)
+    if since is not None:
+        start_utc = max(start_utc, since.astimezone(timezone.utc) if since.tzinfo else since.replace(tzinfo=timezone.utc))
     # GDELT expects YYYYMMDDHHMMSS in UTC
     start = start_utc.strftime("%Y%m%d%H%M%S")
     end = (end_utc - timedelta(seconds=1)).strftime("%Y%m%d%H%M%S")
 
     params = {
-        "query": keyword,
+        "query": query,
         "mode": "ArtList",
         "format": "json",
         "maxrecords": str(max_records),
@@ -82,13 +84,16 @@ async def search_gdelt(*, keyword: str, day: date, max_records: int = 25) -> lis
         "enddatetime": end,
         "sort": "HybridRel",
     }
-    url = "https://api.gdeltproject.org/api/v2/doc/doc"
-
-    timeout = httpx.Timeout(30.0, connect=30.0)
-    async with httpx.AsyncClient(timeout=timeout, headers={"User-Agent": "touch/0.1"}) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        data = r.json()
+    client = http_clients.async_client(GDELT_DOC_URL)
+    r = await resilient_get(
+        client,
+        GDELT_DOC_URL,
+        params=params,
+        upstream="gdelt",
+        default_timeout=http_clients.config_for(GDELT_DOC_URL).timeout,
+    )
+    r.raise_for_status()
+    data = r.json()
 
     items: list[CollectedItem] = []
     for a in (data.get("articles") or []):
@@ -122,73 +127,182 @@ async def search_gdelt(*, keyword: str, day: date, max_records: int = 25) -> lis
     return items
 
 
+async def search_gdelt(
+    *,
+    keyword: str,
+    day: date,
+    max_records: int = 25,
+    since: Optional[datetime] = None,
+) -> list[CollectedItem]:
+    """GDELT doc API ArtList. since가 있으면 그 시각(UTC) 이후로 조회 구간을 좁힌다."""
+    return await _gdelt_articles(keyword, day, max_records, since)
+
+
+def _gdelt_term(keyword: str) -> str:
+    keyword = " ".join(keyword.replace('"', " ").split())
+    return f'"{keyword}"' if " " in keyword else keyword
+
+
+def gdelt_or_query(keywords: Sequence[str]) -> str:
+    terms = [_gdelt_term(k) for k in keywords]
+    return terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})"
+
+
+def pack_gdelt_batches(
+    keywords: Sequence[str], max_keywords: int, max_chars: int = GDELT_MAX_QUERY_CHARS
+) -> list[list[str]]:
+    """OR 식 길이가 max_chars, 키워드 수가 max_keywords 를 넘지 않도록 순서대로 묶는다."""
+    batches: list[list[str]] = []
+    current: list[str] = []
+    length = 2  # 괄호
+    for kw in keywords:
+        term_len = len(_gdelt_term(kw)) + (len(" OR ") if current else 0)
+        if current and (len(current) >= max_keywords or length + term_len > max_chars):
+            batches.append(current)
+            current, length = [], 2
+            term_len = len(_gdelt_term(kw))
+        current.append(kw)
+        length += term_len
+    if current:
+        batches.append(current)
+    return batches
+
+
+class KeywordMatcher:
+    """제목·요약에서 여러 키워드를 한 번에 찾는 컴파일된 매처.
+
+    키워드는 공백으로 나눈 토큰이 모두 나오면 일치(GDELT 의 기본 AND 검색과 같은 의미).
+    모든 토큰을 긴 것부터 하나의 lookahead 교대식으로 묶어 텍스트를 한 번만 훑고,
+    짧은 토큰이 긴 토큰의 부분 문자열이면 긴 토큰이 나온 것만으로 함께 나온 것으로 본다.
+    """
+
+    def __init__(self, keywords: Sequence[str]) -> None:
+        self.keywords = list(keywords)
+        self._tokens = {kw: {t.casefold() for t in kw.replace('"', " ").split()} for kw in self.keywords}
+        all_tokens = sorted({t for ts in self._tokens.values() for t in ts}, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(t) for t in all_tokens) + "))") if all_tokens else None
+        self._implied = {t: {o for o in all_tokens if o in t} for t in all_tokens}
+
+    def match(self, text: str) -> list[str]:
+        if self._pattern is None:
+            return []
+        found: set[str] = set()
+        for m in self._pattern.finditer(text.casefold()):
+            found |= self._implied[m.group(1)]
+        return [kw for kw in self.keywords if self._tokens[kw] and self._tokens[kw] <= found]
+
+
+async def search_gdelt_batch(
+    *,
+    keywords: Sequence[str],
+    day: date,
+    max_records: int = 25,
+    since: Optional[datetime] = None,
+) -> dict[str, list[CollectedItem]]:
+    """여러 키워드를 OR 식 하나로 조회하고 제목·요약 매칭으로 키워드별 결과를 나눈다.
+
+    GDELT 는 본문까지 검색하므로 제목·요약에 키워드가 없는 기사는 어느 키워드에도 배정되지 않는다.
+    키워드당 결과는 max_records 로 자른다.
+    """
+    if len(keywords) == 1:
+        return {keywords[0]: await search_gdelt(keyword=keywords[0], day=day, max_records=max_records, since=since)}
+    items = await _gdelt_articles(
+        gdelt_or_query(keywords), day, min(GDELT_MAX_RECORDS, max_records * len(keywords)), since
+    )
+    matcher = KeywordMatcher(keywords)
+    out: dict[str, list[CollectedItem]] = {kw: [] for kw in keywords}
+    for it in items:
+        for kw in matcher.match(f"{it.title}\n{it.snippet or ''}"):
+            if len(out[kw]) < max_records:
+                out[kw].append(it)
+    return out
+
+
+def _rss_locales() -> list[tuple[str, str]]:
+    """settings.rss_locales("ko:KR,en:US") → [(hl, gl)]. 잘못된 항목은 무시."""
+    out: list[tuple[str, str]] = []
+    for part in (settings.rss_locales or "").split(","):
+        hl, _, gl = part.strip().partition(":")
+        if hl and gl:
+            out.append((hl, gl.upper()))
+    return out or [("ko", "KR")]
+
+
 def _google_news_rss_urls(keyword: str) -> list[str]:
-    q = httpx.QueryParams({"q": keyword, "hl": "ko", "gl": "KR", "ceid": "KR:ko"}).encode()
-    q2 = httpx.QueryParams({"q": keyword, "hl": "en", "gl": "US", "ceid": "US:en"}).encode()
-    return [
-        f"https://news.google.com/rss/search?{q}",
-        f"https://news.google.com/rss/search?{q2}",
-    ]
+    urls: list[str] = []
+    for hl, gl in _rss_locales():
+        q = str(httpx.QueryParams({"q": keyword, "hl": hl, "gl": gl, "ceid": f"{gl}:{hl}"}))
+        urls.append(f"{GOOGLE_NEWS_RSS_URL}?{q}")
+    return urls
+
+
+def _parse_feed_entries(text: str) -> tuple[FeedEntry, ...]:
+    feed = feedparser.parse(text)
+    out: list[FeedEntry] = []
+    for e in feed.entries:
+        link = getattr(e, "link", None)
+        title = getattr(e, "title", None)
+        if not link or not title:
+            continue
+        published_at = None
+        if getattr(e, "published", None):
+            try:
+                published_at = dtparser.parse(e.published)
+            except Exception:
+                published_at = None
+        out.append(FeedEntry(link=link, title=title, summary=getattr(e, "summary", None), published_at=published_at))
+    return tuple(out)
+
+
+async def _fetch_feed_entries(client: httpx.AsyncClient, url: str) -> tuple[FeedEntry, ...]:
+    """조건부 GET. 304면 캐시된 항목을 재파싱 없이 반환."""
+    cached = feed_cache.get(url)
+    r = await client.get(url, headers=cached.validator_headers() if cached else None)
+    if r.status_code == 304 and cached is not None:
+        feed_cache.not_modified += 1
+        return cached.entries
+    r.raise_for_status()
+    feed_cache.refreshed += 1
+    # feedparser는 CPU 바운드라 이벤트 루프를 막지 않도록 스레드에서 파싱
+    entries = await asyncio.to_thread(_parse_feed_entries, r.text)
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if etag or last_modified:
+        feed_cache.put(url, CachedFeed(etag=etag, last_modified=last_modified, entries=entries))
+    return entries
 
 
 async def rss_google_news(*, keyword: str, day: date, max_records: int = 25) -> list[CollectedItem]:
-    if settings.collector_mode.lower() == "mock":
-        now = datetime.now().astimezone()
-        return [
-            CollectedItem(
-                url="https://example.com/mock/rss/1",
-                canonical_url="https://example.com/mock/rss/1",
-                title=f"[MOCK] {keyword} RSS 결과 1",
-                snippet="Mock RSS summary",
-                source_name="MockRSS",
-                source_type="rss",
-                language="ko",
-                published_at=now,
-            )
-        ]
     start_utc, end_utc = kst_day_bounds_utc(day)
 
     urls = _google_news_rss_urls(keyword)
     out: list[CollectedItem] = []
-    timeout = httpx.Timeout(30.0, connect=30.0)
-    async with httpx.AsyncClient(timeout=timeout, headers={"User-Agent": "touch/0.1"}) as client:
-        for u in urls:
-            try:
-                r = await client.get(u)
-                r.raise_for_status()
-            except Exception:
-                continue
+    client = http_clients.async_client(GOOGLE_NEWS_RSS_URL)
+    # 로케일별 피드를 동시에 받고, 병합은 설정된 로케일 순서대로 (앞선 로케일이 dedup 우선)
+    fetched = await asyncio.gather(*(_fetch_feed_entries(client, u) for u in urls), return_exceptions=True)
+    for entries in fetched:
+        if isinstance(entries, BaseException):
+            continue
 
-            feed = feedparser.parse(r.text)
-            for e in feed.entries[: max_records * 2]:
-                link = getattr(e, "link", None)
-                title = getattr(e, "title", None)
-                if not link or not title:
+        for e in entries[: max_records * 2]:
+            if e.published_at:
+                published_at = e.published_at
+                pub_utc = published_at.astimezone(timezone.utc) if published_at.tzinfo else published_at.replace(tzinfo=timezone.utc)
+                if not (start_utc <= pub_utc < end_utc):
                     continue
 
-                published_at = None
-                if getattr(e, "published", None):
-                    try:
-                        published_at = dtparser.parse(e.published)
-                    except Exception:
-                        published_at = None
-                if published_at:
-                    pub_utc = published_at.astimezone(timezone.utc) if published_at.tzinfo else published_at.replace(tzinfo=timezone.utc)
-                    if not (start_utc <= pub_utc < end_utc):
-                        continue
-
-                out.append(
-                    CollectedItem(
-                        url=link,
-                        canonical_url=canonicalize_url(link),
-                        title=title,
-                        snippet=getattr(e, "summary", None),
-                        source_name="GoogleNewsRSS",
-                        source_type="rss",
-                        language=None,
-                        published_at=published_at,
-                    )
+            out.append(
+                CollectedItem(
+                    url=e.link,
+                    canonical_url=canonicalize_url(e.link),
+                    title=e.title,
+                    snippet=e.summary,
+                    source_name="GoogleNewsRSS",
+                    source_type="rss",
+                    language=None,
+                    published_at=e.published_at,
                 )
+            )
     # Dedup by canonical_url while preserving order
     seen: set[str] = set()
     deduped: list[CollectedItem] = []
@@ -199,3 +313,129 @@ async def rss_google_news(*, keyword: str, day: date, max_records: int = 25) ->
         deduped.append(it)
     return deduped[:max_records]
 
+
+@dataclass(frozen=True)
+class KeywordCollection:
+    keyword: str
+    items: list[CollectedItem]
+    search_items: int
+    rss_items: int
+    used_rss: bool
+    cache_hits: int = 0
+    cache_misses: int = 0
+    failed: bool = False  # 시도한 소스가 모두 실패(빈 결과와 구분)
+    search_ok: bool = False  # 날짜 구간 조회(supports_since)를 지원하는 검색 소스가 응답함
+
+
+# 동시에 수집하는 키워드 수 한도. 요청(사용자)마다가 아니라 프로세스 전체에 적용한다.
+keyword_limit = ConcurrencyLimit(lambda: settings.collect_max_concurrency)
+
+
+async def _collect_keyword(
+    keyword: str,
+    day: date,
+    *,
+    runs: Sequence[SourceRun],
+    gdelt_since: Optional[datetime] = None,
+) -> KeywordCollection:
+    """등록된 소스를 폴백 순서대로 시도(기본: GDELT → Google News RSS). 공유 캐시 적중 시 업스트림 호출 생략.
+
+    gdelt_since(증분 수집)가 있으면 이를 지원하는 소스의 조회 구간을 좁히고, 빈 결과는
+    "새 기사 없음"으로 보고 다음 소스로 폴백하지 않는다.
+    """
+    hits = 0
+    misses = 0
+    counts = {"search_api": 0, "rss": 0}
+    used_rss = False
+    items: list[CollectedItem] = []
+    attempted = 0
+    failures = 0
+    search_ok = False
+
+    for run in runs:
+        source = run.source
+        since = gdelt_since if source.supports_since else None
+        used_rss = used_rss or source.kind == "rss"
+        attempted += 1
+
+        async def _fetch(run: SourceRun = run, since: Optional[datetime] = since) -> list[CollectedItem]:
+            # 브레이커는 run 이 업스트림 요청 단위로 적용한다
+            return await run.fetch(keyword, day, since)
+
+        try:
+            items, hit = await fetch_cache.get_or_fetch(cache_key(keyword, day, run.cache_name(keyword, since)), _fetch)
+            hits, misses = hits + hit, misses + (not hit)
+        except SourceUnavailable:
+            # 브레이커가 열린 소스는 타임아웃을 기다리지 않고 바로 다음 소스로
+            items = []
+            failures += 1
+            continue
+        except Exception:
+            misses += 1
+            items = []
+            failures += 1
+            continue  # 실패는 "새 기사 없음"이 아니므로 폴백
+        counts[source.kind] += len(items)
+        search_ok = search_ok or source.supports_since
+        if items or since is not None:
+            break
+
+    return KeywordCollection(
+        keyword=keyword,
+        items=items,
+        search_items=counts["search_api"],
+        rss_items=counts["rss"],
+        used_rss=used_rss,
+        cache_hits=hits,
+        cache_misses=misses,
+        failed=attempted > 0 and failures == attempted,
+        search_ok=search_ok,
+    )
+
+
+async def collect_keywords(
+    keywords: Sequence[str],
+    day: date,
+    gdelt_since: Sequence[Optional[datetime]] | None = None,
+) -> list[KeywordCollection]:
+    """키워드별 수집을 동시에 실행한다. 결과 순서는 입력 순서와 같다.
+
+    gdelt_since는 keywords와 같은 길이의 증분 수집 시작 시각(없으면 None) 목록.
+
+    전체 소요 시간은 키워드 수의 합이 아니라 가장 느린 키워드에 맞춰진다.
+    동시 키워드 수와 소스별 동시 요청 수는 settings.collect_*_concurrency로 제한한다(동시에 도는 수집 전체 합산).
+    """
+    results: list[Optional[KeywordCollection]] = [None] * len(keywords)
+    async for index, result in iter_collect_keywords(keywords, day, gdelt_since):
+        results[index] = result
+    return [r for r in results if r is not None]
+
+
+async def iter_collect_keywords(
+    keywords: Sequence[str],
+    day: date,
+    gdelt_since: Sequence[Optional[datetime]] | None = None,
+) -> AsyncIterator[tuple[int, KeywordCollection]]:
+    """collect_keywords 와 같지만 끝나는 순서대로 (입력 인덱스, 결과)를 내보낸다 (스트리밍 응답용)."""
+    if not keywords:
+        return
+    since_list = list(gdelt_since) if gdelt_since is not None else [None] * len(keywords)
+    # 소스별 이번 수집 실행 상태(GDELT 묶음 조회 계획). 동시 요청 한도는 소스가 프로세스 전체로 관리
+    runs = [s.start_run(keywords, since_list) for s in source_registry.chain()]
+    # 공유 피드 캐시(db)는 실행 앞뒤로 한 번씩만 읽고 쓴다
+    await feed_cache.preload([u for k in keywords for u in _google_news_rss_urls(k)])
+
+    async def _run(index: int, keyword: str, since: Optional[datetime]) -> tuple[int, KeywordCollection]:
+        async with keyword_limit.slot():
+            result = await _collect_keyword(keyword, day, runs=runs, gdelt_since=since)
+        return index, result
+
+    tasks = [asyncio.ensure_future(_run(i, k, s)) for i, (k, s) in enumerate(zip(keywords, since_list))]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        # 소비자가 중간에 끊으면(클라이언트 연결 종료) 남은 수집을 취소
+        for t in tasks:
+            t.cancel()
+        await feed_cache.flush()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Iterator, Sequence, TypeVar
 
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -26,25 +27,110 @@ def _ensure_sqlite_dir(database_url: str) -> None:
 database_url = _normalize_database_url(settings.database_url)
 _ensure_sqlite_dir(database_url)
 
-engine_kwargs = {}
-if database_url.startswith("sqlite"):
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
-else:
-    engine_kwargs["pool_pre_ping"] = True
-    engine_kwargs["pool_size"] = 1
-    engine_kwargs["max_overflow"] = 0
 
-engine = create_engine(
-    database_url,
-    **engine_kwargs,
-)
+def create_db_engine(pool_size: int = 1):
+    """앱 DB 엔진. Postgres 는 pool_size 개 커넥션만 쓴다(오버플로 없음)."""
+    engine_kwargs = {}
+    if database_url.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        engine_kwargs["pool_pre_ping"] = True
+        engine_kwargs["pool_size"] = pool_size
+        engine_kwargs["max_overflow"] = 0
+    return create_engine(database_url, **engine_kwargs)
+
+
+engine = create_db_engine()
+
+
+def add_missing_columns(bind) -> list[str]:
+    """기존 테이블에 모델에 새로 생긴 nullable 컬럼과 인덱스를 추가. create_all 은 기존 테이블을 바꾸지 않는다.
+
+    추가한 "table.column" 목록 반환.
+    """
+    from sqlalchemy import inspect, text
+
+    insp = inspect(bind)
+    existing_tables = set(insp.get_table_names())
+    added: list[str] = []
+    with bind.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            have = {c["name"] for c in insp.get_columns(table.name)}
+            missing = [c for c in table.columns if c.name not in have and c.nullable]
+            for c in missing:
+                ddl = c.type.compile(dialect=bind.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{c.name}" {ddl}'))
+                added.append(f"{table.name}.{c.name}")
+            if missing:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+    return added
 
 
 def init_db() -> None:
     SQLModel.metadata.create_all(engine)
+    add_missing_columns(engine)
 
 
 def get_session():
     with Session(engine) as session:
         yield session
 
+
+def release_connection(session: Session) -> None:
+    """읽기만 한 트랜잭션을 끝내 커넥션을 풀에 돌려준다. 외부 호출을 기다리기 전에 부른다.
+    불러온 객체는 만료하지 않으므로 기다린 뒤에도 다시 조회하지 않는다."""
+    expire = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.commit()
+    finally:
+        session.expire_on_commit = expire
+
+
+T = TypeVar("T")
+
+# SQLite 바인드 변수 한도(구버전 999)를 넘지 않도록 IN 절을 나눈다.
+IN_CLAUSE_CHUNK = 500
+
+
+def chunked(seq: Sequence[T], size: int = IN_CLAUSE_CHUNK) -> Iterator[Sequence[T]]:
+    for i in range(0, len(seq), size):
+        yield seq[i : i + size]
+
+
+def dialect_insert(session: Session):
+    """세션 DB 방언의 insert 생성자 (ON CONFLICT 지원). Postgres/SQLite 만."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"unsupported dialect for ON CONFLICT: {dialect}")
+    return insert
+
+
+def insert_ignore(
+    session: Session,
+    model: type[SQLModel],
+    rows: Sequence[dict[str, Any]],
+    conflict_cols: list[str],
+    returning: Sequence[Any] = (),
+) -> list[Any]:
+    """INSERT ... ON CONFLICT (conflict_cols) DO NOTHING 일괄 실행 (Postgres/SQLite).
+
+    rows는 모든 컬럼 값을 포함해야 한다(SQLModel default_factory는 Core insert에서 적용되지 않음).
+    returning 컬럼을 주면 실제로 들어간 행(충돌로 무시된 행 제외)의 값을 RETURNING 으로 돌려준다.
+    커밋은 호출자가 한다.
+    """
+    if not rows:
+        return []
+    stmt = dialect_insert(session)(model.__table__).on_conflict_do_nothing(index_elements=conflict_cols)
+    # executemany → SQLAlchemy insertmanyvalues가 다중 VALUES 배치로 묶어 전송
+    if returning:
+        return list(session.exec(stmt.returning(*returning), params=list(rows)).all())
+    session.exec(stmt, params=list(rows))
+    return []
@@ -0,0 +1,222 @@
+"""여러 날짜 과거 수집(backfill).
+
+(키워드, 날짜) 작업 단위를 계획해 완료 장부(CollectLedger)에 있는 것은 건너뛰고,
+날짜 몇 개를 동시에(backfill_day_concurrency) 진행한다. 업스트림 동시 요청·속도 제한은
+수집 소스 레지스트리(app/sources.py)가 그대로 적용한다.
+
+단위가 끝날 때마다 저장·장부 기록·진행 상황을 커밋하므로, 프로세스가 죽어도 resume 하면
+남은 단위만 다시 수집한다. 오늘(KST) 날짜는 아직 기사가 들어오는 중이라 장부에 남기지 않는다.
+실행 중인 작업은 진행 기록(updated_at)이 backfill_stale_sec 보다 오래되기 전까지 resume 할 수 없다.
+
+RSS 는 최근 기사만 돌려주므로, 날짜 구간 조회를 지원하는 검색 소스가 실패해 RSS 로 폴백한 단위는
+완료가 아니라 실패로 센다(저장·워터마크·장부 모두 남기지 않아 resume 때 다시 검색한다).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional, Sequence
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlmodel import Session, and_, col, select
+
+from ...collect import iter_collect_keywords, kst_date_today
+from ...db import chunked, insert_ignore
+from ...settings import settings
+from .models import BackfillRun, CollectLedger, Keyword
+from .service import ArticleIngestService
+from .watermark import WatermarkService
+
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+class BackfillService:
+    @staticmethod
+    def create(
+        session: Session,
+        user_id: UUID,
+        start: date,
+        end: date,
+        keyword_ids: Optional[Sequence[UUID]] = None,
+    ) -> BackfillRun:
+        """작업을 만든다. keyword_ids 가 없으면 활성 키워드 전체."""
+        if start > end:
+            raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+        if end > kst_date_today():
+            raise HTTPException(status_code=400, detail="end_date must not be in the future")
+        if (end - start).days + 1 > settings.backfill_max_days:
+            raise HTTPException(status_code=400, detail=f"range too long (max {settings.backfill_max_days} days)")
+
+        stmt = select(Keyword).where(Keyword.user_id == user_id)
+        if keyword_ids:
+            stmt = stmt.where(col(Keyword.id).in_(list(keyword_ids)))
+        else:
+            stmt = stmt.where(Keyword.is_active == True)  # noqa: E712
+        keywords = session.exec(stmt).all()
+        if keyword_ids and len(keywords) != len(set(keyword_ids)):
+            raise HTTPException(status_code=404, detail="keyword not found")
+        if not keywords:
+            raise HTTPException(status_code=400, detail="no keywords to backfill")
+
+        run = BackfillRun(
+            user_id=user_id,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            keyword_ids_json=json.dumps([str(k.id) for k in keywords]),
+            units_total=len(keywords) * ((end - start).days + 1),
+        )
+        session.add(run)
+        session.commit()
+        session.refresh(run)
+        return run
+
+    @staticmethod
+    def get(session: Session, user_id: UUID, run_id: UUID) -> BackfillRun:
+        run = session.get(BackfillRun, run_id)
+        if not run or run.user_id != user_id:
+            raise HTTPException(status_code=404, detail="backfill not found")
+        return run
+
+    @staticmethod
+    def claim(session: Session, run: BackfillRun) -> None:
+        """재개 전에 작업을 점유한다. 끝났거나 다른 실행이 진행 중이면 409.
+
+        읽은 (status, updated_at) 그대로일 때만 running 으로 바꿔, 동시에 들어온 resume 중 하나만 통과한다.
+        """
+        if run.status == "done":
+            raise HTTPException(status_code=409, detail="backfill already done")
+        now = datetime.now().astimezone()
+        if run.status == "running" and (now - run.updated_at.astimezone()).total_seconds() < settings.backfill_stale_sec:
+            raise HTTPException(status_code=409, detail="backfill already running")
+        res = session.exec(
+            update(BackfillRun)
+            .where(
+                and_(
+                    BackfillRun.id == run.id,
+                    BackfillRun.status == run.status,
+                    BackfillRun.updated_at == run.updated_at,
+                )
+            )
+            .values(status="running", updated_at=now)
+        )
+        session.commit()
+        if res.rowcount != 1:
+            raise HTTPException(status_code=409, detail="backfill already running")
+        session.refresh(run)
+
+    @staticmethod
+    def plan(session: Session, run: BackfillRun) -> dict[date, list[Keyword]]:
+        """날짜별 남은 키워드. 완료 장부에 있는 (키워드, 날짜)는 뺀다."""
+        keyword_ids = [UUID(k) for k in json.loads(run.keyword_ids_json)]
+        keywords: dict[UUID, Keyword] = {}
+        for part in chunked(keyword_ids):
+            keywords.update({k.id: k for k in session.exec(select(Keyword).where(col(Keyword.id).in_(part))).all()})
+        days = _days(date.fromisoformat(run.start_date), date.fromisoformat(run.end_date))
+
+        done: set[tuple[UUID, str]] = set()
+        for part in chunked(list(keywords)):
+            rows = session.exec(
+                select(CollectLedger.keyword_id, CollectLedger.date_kst).where(
+                    and_(
+                        col(CollectLedger.keyword_id).in_(part),
+                        CollectLedger.date_kst >= run.start_date,
+                        CollectLedger.date_kst <= run.end_date,
+                    )
+                )
+            ).all()
+            done.update((kid, d) for kid, d in rows)
+
+        return {
+            day: [k for k in keywords.values() if (k.id, day.isoformat()) not in done]
+            for day in days
+        }
+
+    @staticmethod
+    async def execute(session: Session, run_id: UUID) -> BackfillRun:
+        """남은 단위를 수집. 처음 실행과 재개(resume) 모두 이 함수를 쓴다."""
+        run = session.get(BackfillRun, run_id)
+        if run is None:
+            raise HTTPException(status_code=404, detail="backfill not found")
+        plan = BackfillService.plan(session, run)
+        remaining = sum(len(kws) for kws in plan.values())
+        # 재개 시 이전 실행의 완료·실패 수는 다시 세므로 초기화
+        run.units_skipped = run.units_total - remaining
+        run.units_done = run.units_skipped
+        run.units_failed = 0
+        run.status = "running"
+        run.last_error = None
+        now = datetime.now().astimezone()
+        run.started_at = run.started_at or now
+        run.updated_at = now
+        session.add(run)
+        session.commit()
+
+        started = time.monotonic()
+        elapsed_before = run.elapsed_sec
+        today = kst_date_today()
+        day_sem = asyncio.Semaphore(max(1, settings.backfill_day_concurrency))
+
+        async def _day(day: date, keywords: list[Keyword]) -> None:
+            async with day_sem:
+                date_kst = day.isoformat()
+                marks = WatermarkService.load(session, [k.id for k in keywords], date_kst)
+                # 단위별 DB 작업은 await 없이 끝나므로 같은 세션을 날짜 코루틴끼리 나눠 써도 섞이지 않는다
+                async for index, result in iter_collect_keywords(
+                    [k.text for k in keywords], day, gdelt_since=[marks[k.id].gdelt_since() for k in keywords]
+                ):
+                    kw = keywords[index]
+                    if result.failed or not result.search_ok:
+                        run.units_failed += 1
+                    else:
+                        fresh, _ = WatermarkService.filter_seen(marks[kw.id], result.items)
+                        WatermarkService.advance(session, kw.id, date_kst, marks[kw.id], fresh)
+                        ingest = ArticleIngestService.ingest(session, run.user_id, date_kst, [(kw.id, fresh)])
+                        run.items_found += len(result.items)
+                        run.inserted_articles += ingest.inserted
+                        run.linked_existing_articles += ingest.linked
+                        run.units_done += 1
+                        if day < today:
+                            insert_ignore(
+                                session,
+                                CollectLedger,
+                                [
+                                    {
+                                        "id": uuid4(),
+                                        "keyword_id": kw.id,
+                                        "date_kst": date_kst,
+                                        "items_found": len(result.items),
+                                        "run_id": run.id,
+                                        "completed_at": datetime.now().astimezone(),
+                                    }
+                                ],
+                                ["keyword_id", "date_kst"],
+                            )
+                    run.elapsed_sec = elapsed_before + time.monotonic() - started
+                    run.updated_at = datetime.now().astimezone()
+                    session.add(run)
+                    session.commit()
+
+        results = await asyncio.gather(*(_day(day, kws) for day, kws in plan.items() if kws), return_exceptions=True)
+        error = next((r for r in results if isinstance(r, BaseException)), None)
+        if error is not None:
+            session.rollback()
+            run = session.get(BackfillRun, run_id)
+            run.status = "failed"
+            run.last_error = repr(error)[:500]
+        else:
+            run.status = "failed" if run.units_failed else "done"
+            if run.units_failed:
+                run.last_error = f"{run.units_failed} unit(s) failed; resume to retry"
+        now = datetime.now().astimezone()
+        run.finished_at = now
+        run.updated_at = now
+        session.add(run)
+        session.commit()
+        session.refresh(run)
+        return run
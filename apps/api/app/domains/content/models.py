@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import BigInteger, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 
@@ -39,6 +39,14 @@ class Article(SQLModel, table=True):
     snippet_original: Optional[str] = None
     language_original: Optional[str] = Field(default=None, index=True)
 
+    # 유사 기사 묶기 (domains/content/dedup.py): 제목 SimHash 와 16비트 밴드 4개, 대표 기사 id
+    title_simhash: Optional[int] = Field(default=None, sa_type=BigInteger)
+    simhash_b0: Optional[int] = Field(default=None, index=True)
+    simhash_b1: Optional[int] = Field(default=None, index=True)
+    simhash_b2: Optional[int] = Field(default=None, index=True)
+    simhash_b3: Optional[int] = Field(default=None, index=True)
+    cluster_id: Optional[UUID] = Field(default=None, index=True)
+
 
 class ArticleKeyword(SQLModel, table=True):
     __table_args__ = (UniqueConstraint("article_id", "keyword_id"),)
@@ -67,6 +75,153 @@ class ProcessingResult(SQLModel, table=True):
     created_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
 
 
+class ProcessingCache(SQLModel, table=True):
+    """사용자 공용 처리 결과 캐시 (domains/content/processing_cache.py).
+    content_hash = sha256(처리기·번역기 이름·버전 + canonical_url + 제목 + 요약 + 원문 언어)."""
+    content_hash: str = Field(primary_key=True, max_length=64)
+    processor: str = Field(index=True)  # 이름:버전
+
+    sentiment: str
+    sentiment_confidence: Optional[float] = None
+    summary_original: str
+    summary_ko: str
+    translated_from: Optional[str] = None
+    translation_status: str
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
+
+
+class TranslationMemo(SQLModel, table=True):
+    """번역 메모 (domains/content/translation_memo.py).
+    memo_key = sha256(번역 제공자 이름·버전 + 원문 언어 + 대상 언어 + text_hash)."""
+    memo_key: str = Field(primary_key=True, max_length=64)
+    text_hash: str = Field(index=True, max_length=64)  # sha256(원문)
+    source_lang: str
+    target_lang: str
+    provider: str = Field(index=True)  # 이름:버전
+    translated_text: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
+
+
+class ProviderUsageLog(SQLModel, table=True):
+    """외부 처리 제공자(processor_mode=openai) 처리 실행별 요청·토큰·비용 기록."""
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    user_id: Optional[UUID] = Field(default=None, foreign_key="user.id", index=True)
+    date_kst: str = Field(max_length=10, index=True)  # YYYY-MM-DD
+    processor: str = Field(index=True)  # 이름:버전
+    model: Optional[str] = None
+    articles: int = 0  # 처리기에 넘긴 기사 수
+    requests: int = 0
+    items: int = 0  # 요청에 실어 보낸 기사 수(재시도 포함)
+    retried_items: int = 0
+    failed_items: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    elapsed_sec: float = 0.0
+    created_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
+
+
+class ReportVersion(SQLModel, table=True):
+    """(사용자, 날짜) 리포트 데이터 버전. 수집·처리·키워드 변경 때 올린다 (domains/content/report_snapshot.py)."""
+    __table_args__ = (UniqueConstraint("user_id", "date_kst"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    user_id: UUID = Field(foreign_key="user.id", index=True)
+    date_kst: str = Field(max_length=10, index=True)  # YYYY-MM-DD
+    version: int = 1
+    updated_at: datetime = Field(default_factory=lambda: datetime.now().astimezone())
+
+
+class ReportSnapshot(SQLModel, table=True):
+    """직렬화한 ReportResponse. version 이 ReportVersion 과 같을 때만 쓴다."""
+    __table_args__ = (UniqueConstraint("user_id", "date_kst", "filter_key"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    user_id: UUID = Field(foreign_key="user.id", index=True)
+    date_kst: str = Field(max_length=10, index=True)  # YYYY-MM-DD
+    filter_key: str  # "<keyword_id 또는 빈 값>:<collapse 0|1>"
+    version: int = 0
+    body_json: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now().astimezone())
+
+
+class CollectWatermark(SQLModel, table=True):
+    """키워드·소스·날짜별 증분 수집 기준점. 이미 저장한 URL은 DB 조회 전에 건너뛴다."""
+    __table_args__ = (UniqueConstraint("keyword_id", "source", "date_kst"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    keyword_id: UUID = Field(foreign_key="keyword.id", ondelete="CASCADE", index=True)
+    source: str = Field(index=True)  # gdelt | rss
+    date_kst: str = Field(index=True)  # YYYY-MM-DD
+    latest_published_at: Optional[datetime] = None
+    seen_url_keys_json: str = "[]"  # canonical_url 해시(16 hex) 목록, 최근 것이 뒤
+    updated_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
+
+
+class CollectJob(SQLModel, table=True):
+    """사용자별 일일 수집+처리 사전 작업. 리스(lease)로 여러 워커의 중복 실행을 막는다."""
+    __table_args__ = (UniqueConstraint("user_id", "date_kst"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    user_id: UUID = Field(foreign_key="user.id", index=True)
+    date_kst: str = Field(index=True)  # YYYY-MM-DD
+    run_at: datetime = Field(index=True)  # UTC. 리포트 시각 - 선행 시간
+    status: str = Field(default="pending", index=True)  # pending | running | done | failed
+    attempts: int = Field(default=0)
+    lease_owner: Optional[str] = Field(default=None, index=True)
+    lease_expires_at: Optional[datetime] = Field(default=None, index=True)
+    last_error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
+
+
+class BackfillRun(SQLModel, table=True):
+    """여러 날짜·키워드 과거 수집 작업. (키워드, 날짜) 단위 진행 상황과 처리량을 기록한다."""
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    user_id: UUID = Field(foreign_key="user.id", index=True)
+    start_date: str  # YYYY-MM-DD (KST)
+    end_date: str
+    keyword_ids_json: str = "[]"
+    status: str = Field(default="pending", index=True)  # pending | running | done | failed
+    units_total: int = 0
+    units_done: int = 0
+    units_skipped: int = 0  # 완료 장부에 이미 있어 건너뜀
+    units_failed: int = 0
+    items_found: int = 0
+    inserted_articles: int = 0
+    linked_existing_articles: int = 0
+    elapsed_sec: float = 0.0
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now().astimezone())
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: datetime = Field(default_factory=lambda: datetime.now().astimezone())
+
+
+class CollectLedger(SQLModel, table=True):
+    """(키워드, 날짜) 수집 완료 장부. 지난 날짜만 기록하며, 있으면 과거 수집에서 건너뛴다."""
+    __table_args__ = (UniqueConstraint("keyword_id", "date_kst"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    keyword_id: UUID = Field(index=True)
+    date_kst: str = Field(index=True)  # YYYY-MM-DD
+    items_found: int = 0
+    run_id: Optional[UUID] = Field(default=None, index=True)
+    completed_at: datetime = Field(default_factory=lambda: datetime.now().astimezone())
+
+
+class FeedCacheEntry(SQLModel, table=True):
+    """RSS 조건부 GET 공유 캐시 (FEED_CACHE_BACKEND=db). url_hash = sha256(feed url)."""
+    url_hash: str = Field(primary_key=True, max_length=64)
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    entries_json: str = "[]"
+    updated_at: datetime = Field(default_factory=lambda: datetime.now().astimezone(), index=True)
+
+
 class NotificationSetting(SQLModel, table=True):
     __table_args__ = (UniqueConstraint("user_id"),)
 
@@ -0,0 +1,80 @@
+"""사용자 공용 처리 결과 캐시.
+
+같은 기사는 사용자마다 Article 로 따로 저장되지만 처리 결과(감성·요약·번역)는 내용에만 의존한다.
+(처리기 이름·버전, 번역기 이름·버전, canonical_url, 제목, 요약, 원문 언어)의 해시로 결과를 한 번 저장해 두고, 다른 사용자의 같은 기사는
+처리기를 부르지 않고 복사한다. 실패 결과는 저장하지 않아 다음 처리 때 다시 시도한다.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Sequence
+
+from sqlmodel import Session, col, select
+
+from ...db import chunked, insert_ignore
+from ...process import ArticleInput, Processed, Processor
+from ...settings import settings
+from ...translate import get_translator
+from .models import ProcessingCache
+
+
+def processor_key(processor: Processor) -> str:
+    return f"{processor.name}:{processor.version}"
+
+
+def content_hash(processor: Processor, article: ArticleInput) -> str:
+    # 저장되는 결과에 번역 상태·한국어 요약이 들어가므로 원문 언어와 번역기도 키에 넣는다
+    translator = get_translator()
+    parts = (
+        processor_key(processor),
+        f"{translator.name}:{translator.version}",
+        article.canonical_url or "",
+        article.title_original or "",
+        article.snippet_original or "",
+        article.language_original or "",
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class ProcessingCacheService:
+    @staticmethod
+    def lookup(session: Session, hashes: Sequence[str]) -> dict[str, Processed]:
+        if not settings.processing_cache_enabled or not hashes:
+            return {}
+        found: dict[str, Processed] = {}
+        for part in chunked(list(dict.fromkeys(hashes))):
+            for row in session.exec(select(ProcessingCache).where(col(ProcessingCache.content_hash).in_(part))).all():
+                found[row.content_hash] = Processed(
+                    sentiment=row.sentiment,
+                    sentiment_confidence=row.sentiment_confidence,
+                    summary_original=row.summary_original,
+                    summary_ko=row.summary_ko,
+                    translated_from=row.translated_from,
+                    translation_status=row.translation_status,
+                )
+        return found
+
+    @staticmethod
+    def store(session: Session, processor: Processor, results: dict[str, Processed]) -> None:
+        """성공한 결과만 저장. 커밋은 호출자가 한다."""
+        if not settings.processing_cache_enabled:
+            return
+        now = datetime.now().astimezone()
+        rows = [
+            {
+                "content_hash": h,
+                "processor": processor_key(processor),
+                "sentiment": p.sentiment,
+                "sentiment_confidence": p.sentiment_confidence,
+                "summary_original": p.summary_original,
+                "summary_ko": p.summary_ko,
+                "translated_from": p.translated_from,
+                "translation_status": p.translation_status,
+                "created_at": now,
+            }
+            for h, p in results.items()
+            if p.translation_status != "failed"
+        ]
+        for part in chunked(rows):
+            insert_ignore(session, ProcessingCache, part, ["content_hash"])
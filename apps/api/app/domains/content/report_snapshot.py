@@ -0,0 +1,112 @@
+"""일일 리포트 스냅샷.
+
+GET /report 는 키워드·기사·연결·처리 결과를 모두 읽어 파이썬에서 정렬한다. 지난 날짜는 바뀌지 않고
+오늘도 수집·처리 뒤에만 바뀌므로, (사용자, 날짜, 키워드 필터)별 직렬화 응답을 저장해 두고 다시 쓴다.
+
+- ReportVersion: (사용자, 날짜)의 데이터 버전. 기사 저장(수집·과거 수집), 처리 결과 커밋, 키워드 고정·활성·삭제 때
+  해당 날짜만 올린다(키워드는 그 키워드 기사가 있는 날짜). 데이터 변경과 같은 트랜잭션에서 커밋된다.
+- ReportSnapshot: 만든 시점 버전과 함께 저장. 현재 버전과 다르면 쓰지 않고 다시 만들어 덮어쓴다.
+  리포트를 만드는 중에 버전이 올라가도 옛 버전으로 저장되므로 다음 조회 때 다시 만든다.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Iterable, Optional
+from uuid import UUID, uuid4
+
+from sqlmodel import Session, and_, select
+
+from ...db import dialect_insert
+from .models import Article, ArticleKeyword, ReportSnapshot, ReportVersion
+
+
+def filter_key(keyword_id: Optional[UUID], collapse: bool) -> str:
+    return f"{keyword_id or ''}:{int(collapse)}"
+
+
+def etag(user_id: UUID, date_kst: str, key: str, version: int) -> str:
+    digest = hashlib.sha256(f"{user_id}\x1f{date_kst}\x1f{key}".encode()).hexdigest()[:16]
+    return f'W/"{version}-{digest}"'
+
+
+class ReportSnapshotService:
+    @staticmethod
+    def current_version(session: Session, user_id: UUID, date_kst: str) -> int:
+        version = session.exec(
+            select(ReportVersion.version).where(
+                and_(ReportVersion.user_id == user_id, ReportVersion.date_kst == date_kst)
+            )
+        ).first()
+        return version or 0
+
+    @staticmethod
+    def get(session: Session, user_id: UUID, date_kst: str, key: str, version: int) -> Optional[str]:
+        """현재 버전의 스냅샷 본문(JSON). 없거나 옛 버전이면 None."""
+        return session.exec(
+            select(ReportSnapshot.body_json).where(
+                and_(
+                    ReportSnapshot.user_id == user_id,
+                    ReportSnapshot.date_kst == date_kst,
+                    ReportSnapshot.filter_key == key,
+                    ReportSnapshot.version == version,
+                )
+            )
+        ).first()
+
+    @staticmethod
+    def put(session: Session, user_id: UUID, date_kst: str, key: str, version: int, body_json: str) -> None:
+        """스냅샷 저장. 저장된 것보다 옛 버전이면(늦게 끝난 느린 요청) 덮어쓰지 않는다. 커밋은 호출자가 한다."""
+        table = ReportSnapshot.__table__
+        stmt = dialect_insert(session)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "date_kst", "filter_key"],
+            set_={"version": stmt.excluded.version, "body_json": stmt.excluded.body_json, "created_at": stmt.excluded.created_at},
+            where=table.c.version <= stmt.excluded.version,
+        )
+        session.exec(
+            stmt,
+            params=[
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "date_kst": date_kst,
+                    "filter_key": key,
+                    "version": version,
+                    "body_json": body_json,
+                    "created_at": datetime.now().astimezone(),
+                }
+            ],
+        )
+
+    @staticmethod
+    def invalidate(session: Session, user_id: UUID, dates: Iterable[str]) -> None:
+        """날짜별 리포트 버전을 올린다(UPSERT 1번). 커밋은 데이터 변경과 함께 호출자가 한다.
+
+        스냅샷을 꺼 둔 동안에도 올려야, 다시 켰을 때 그 사이 바뀐 날짜의 옛 스냅샷·ETag 를 쓰지 않는다.
+        """
+        now = datetime.now().astimezone()
+        rows = [
+            {"id": uuid4(), "user_id": user_id, "date_kst": d, "version": 1, "updated_at": now}
+            for d in sorted(set(dates))
+        ]
+        if not rows:
+            return
+        table = ReportVersion.__table__
+        stmt = dialect_insert(session)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "date_kst"],
+            set_={"version": table.c.version + 1, "updated_at": stmt.excluded.updated_at},
+        )
+        session.exec(stmt, params=rows)
+
+    @staticmethod
+    def invalidate_keyword(session: Session, user_id: UUID, keyword_id: UUID) -> None:
+        """키워드 변경: 그 키워드에 연결된 기사가 있는 날짜만."""
+        dates = session.exec(
+            select(Article.date_kst)
+            .join(ArticleKeyword, ArticleKeyword.article_id == Article.id)
+            .where(and_(Article.user_id == user_id, ArticleKeyword.keyword_id == keyword_id))
+            .distinct()
+        ).all()
+        ReportSnapshotService.invalidate(session, user_id, dates)
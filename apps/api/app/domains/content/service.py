@@ -1,15 +1,30 @@
 """뉴스 키워드 Application Service."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Literal
-from uuid import UUID
+import time
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import AsyncIterator, Literal, Sequence
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException
-from sqlmodel import Session, and_, col, select
+from sqlalchemy import case, exists, func
+from sqlmodel import Session, and_, col, or_, select
 
-from .models import Keyword
+from ...bloom import url_filters
+from ...collect import CollectedItem, KeywordCollection, collect_keywords, iter_collect_keywords
+from ...db import chunked, insert_ignore, release_connection
+from ...langid import detect_languages
+from ...process import ArticleInput, Processed, Processor, ProcessUsage, get_processor
+from ...process_engine import process_engine
+from ...settings import settings
+from .dedup import BANDS, MAX_DISTANCE, bands, fingerprint_columns, from_signed, hamming
+from .models import Article, ArticleKeyword, Keyword, ProcessingResult, ProviderUsageLog
+from .processing_cache import ProcessingCacheService, content_hash, processor_key
+from .report_snapshot import ReportSnapshotService
 from .schemas import KeywordPublic
+from .translation_memo import TranslationMemoService
+from .watermark import KeywordWatermarks, WatermarkService
 
 
 def _normalize(text: str) -> str:
@@ -82,6 +97,7 @@ class KeywordService:
         if changed:
             kw.updated_at = now
             session.add(kw)
+            ReportSnapshotService.invalidate_keyword(session, user_id, kw.id)
             session.commit()
             session.refresh(kw)
         return KeywordPublic.model_validate(kw), changed, before_snapshot
@@ -94,6 +110,509 @@ class KeywordService:
             raise HTTPException(status_code=404, detail="keyword not found")
         deleted_id = kw.id
         deleted_text = kw.text
+        ReportSnapshotService.invalidate_keyword(session, user_id, kw.id)
+        WatermarkService.delete_for_keyword(session, kw.id)
         session.delete(kw)
         session.commit()
         return deleted_id, deleted_text
+
+
+@dataclass
+class IngestResult:
+    inserted: int = 0
+    linked: int = 0
+    near_duplicates: int = 0
+    new_article_ids: list[UUID] = field(default_factory=list)
+
+
+# 밴드 4개 IN 절 × 행 수가 SQLite 바인드 변수 한도를 넘지 않도록
+_CLUSTER_LOOKUP_CHUNK = 200
+
+
+class ArticleIngestService:
+    @staticmethod
+    def assign_clusters(session: Session, user_id: UUID, date_kst: str, rows: Sequence[dict]) -> int:
+        """새 Article 행(dict)에 SimHash 지문과 cluster_id 를 채운다. 유사 기사로 묶인 행 수 반환.
+
+        같은 사용자·같은 날짜 기사 중 밴드가 하나라도 같은 후보만 조회해 해밍 거리를 검사한다.
+        묶이지 않은 기사는 자기 id 가 cluster_id(대표)다.
+        """
+        max_distance = min(settings.near_dup_max_distance, MAX_DISTANCE)
+        band_cols = [getattr(Article, f"simhash_b{i}") for i in range(BANDS)]
+        # (밴드 번호, 밴드 값) → [(지문, cluster_id)]
+        index: dict[tuple[int, int], list[tuple[int, UUID]]] = {}
+
+        fingerprinted: list[dict] = []
+        for row in rows:
+            row.update(fingerprint_columns(row["title_original"], row["snippet_original"]))
+            row["cluster_id"] = row["id"]
+            if row["title_simhash"] is not None:
+                fingerprinted.append(row)
+        if not fingerprinted or max_distance < 0:
+            return 0
+
+        for part in chunked(fingerprinted, _CLUSTER_LOOKUP_CHUNK):
+            cond = or_(*(col(c).in_({r[f"simhash_b{i}"] for r in part}) for i, c in enumerate(band_cols)))
+            candidates = session.exec(
+                select(Article.id, Article.cluster_id, Article.title_simhash, *band_cols).where(
+                    and_(Article.user_id == user_id, Article.date_kst == date_kst, cond)
+                )
+            ).all()
+            for a_id, cluster_id, fp, *band_vals in candidates:
+                for i, b in enumerate(band_vals):
+                    index.setdefault((i, b), []).append((from_signed(fp), cluster_id or a_id))
+
+        clustered = 0
+        for row in fingerprinted:
+            fp = from_signed(row["title_simhash"])
+            fp_bands = bands(fp)
+            match = next(
+                (
+                    cluster_id
+                    for i, b in enumerate(fp_bands)
+                    for other_fp, cluster_id in index.get((i, b), ())
+                    if hamming(fp, other_fp) <= max_distance
+                ),
+                None,
+            )
+            if match is not None:
+                row["cluster_id"] = match
+                clustered += 1
+            for i, b in enumerate(fp_bands):
+                index.setdefault((i, b), []).append((fp, row["cluster_id"]))
+        return clustered
+
+    @staticmethod
+    def ingest(
+        session: Session,
+        user_id: UUID,
+        date_kst: str,
+        batches: Sequence[tuple[UUID, Sequence[CollectedItem]]],
+    ) -> IngestResult:
+        """키워드별 수집 결과를 일괄 저장하고 한 번만 커밋한다.
+
+        batches: [(keyword_id, items)]. 기존 canonical_url 조회 1회(블룸 필터가 "확실히 없음"이라 하면 생략),
+        Article 일괄 INSERT ... RETURNING, ArticleKeyword 일괄 INSERT(중복 무시)로 처리한다. 집계는 기존 항목 단위 처리와 같다:
+        이미 있던(또는 앞선 키워드에서 방금 저장된) URL은 linked, 처음 보는 URL은 inserted.
+        """
+        urls = list(dict.fromkeys(it.canonical_url for _kw_id, items in batches for it in items))
+        result = IngestResult()
+        if not urls:
+            return result
+
+        # 블룸 필터가 "확실히 없음"이라고 한 URL 은 존재 확인 조회를 생략
+        url_filter = url_filters.get(session, user_id)
+        probable = url_filters.split(url_filter, urls)
+        ids_by_url: dict[str, UUID] = {}
+        for part in chunked(probable):
+            rows = session.exec(
+                select(Article.id, Article.canonical_url).where(
+                    and_(Article.user_id == user_id, col(Article.canonical_url).in_(part))
+                )
+            ).all()
+            ids_by_url.update({url: article_id for article_id, url in rows})
+        if url_filter is not None:
+            url_filters.record_false_positives(len(probable) - len(ids_by_url))
+
+        now = datetime.now().astimezone()
+        new_rows: dict[str, dict] = {}
+        known: set[str] = set(ids_by_url)
+        for _kw_id, items in batches:
+            for it in items:
+                if it.canonical_url in known:
+                    result.linked += 1
+                    continue
+                known.add(it.canonical_url)
+                new_rows[it.canonical_url] = {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "date_kst": date_kst,
+                    "canonical_url": it.canonical_url,
+                    "original_url": it.url,
+                    "source_type": it.source_type,
+                    "source_name": it.source_name,
+                    "published_at": it.published_at,
+                    "fetched_at": now,
+                    "title_original": it.title,
+                    "snippet_original": it.snippet,
+                    "language_original": it.language,
+                }
+
+        if new_rows:
+            # RSS 등 언어 정보가 없는 항목은 제목·요약으로 한 번에 판별 (한국어 기사를 번역하지 않도록)
+            unlabeled = [row for row in new_rows.values() if not row["language_original"]]
+            if unlabeled and settings.langid_enabled:
+                texts = [f"{row['title_original']} {row['snippet_original'] or ''}" for row in unlabeled]
+                for row, lang in zip(unlabeled, detect_languages(texts)):
+                    row["language_original"] = lang
+            result.near_duplicates = ArticleIngestService.assign_clusters(
+                session, user_id, date_kst, list(new_rows.values())
+            )
+            inserted = insert_ignore(
+                session,
+                Article,
+                list(new_rows.values()),
+                ["user_id", "canonical_url"],
+                returning=[col(Article.id), col(Article.canonical_url)],
+            )
+            ids_by_url.update({url: article_id for article_id, url in inserted})
+            # 동시 요청이 먼저 넣어 무시된 URL 만 실제 id 를 다시 읽는다.
+            lost = [url for url in new_rows if url not in ids_by_url]
+            for part in chunked(lost):
+                rows = session.exec(
+                    select(Article.id, Article.canonical_url).where(
+                        and_(Article.user_id == user_id, col(Article.canonical_url).in_(part))
+                    )
+                ).all()
+                ids_by_url.update({url: article_id for article_id, url in rows})
+            for url, row in new_rows.items():
+                if url_filter is not None:
+                    url_filter.add(url)
+                if ids_by_url.get(url) == row["id"]:
+                    result.inserted += 1
+                    result.new_article_ids.append(row["id"])
+                else:
+                    result.linked += 1
+
+        links = {
+            (ids_by_url[it.canonical_url], kw_id)
+            for kw_id, items in batches
+            for it in items
+            if it.canonical_url in ids_by_url
+        }
+        insert_ignore(
+            session,
+            ArticleKeyword,
+            [{"id": uuid4(), "article_id": a_id, "keyword_id": kw_id} for a_id, kw_id in links],
+            ["article_id", "keyword_id"],
+        )
+        ReportSnapshotService.invalidate(session, user_id, [date_kst])
+        session.commit()
+        return result
+
+
+@dataclass
+class CollectSummary:
+    date_kst: str
+    keywords_processed: int = 0
+    search_items: int = 0
+    rss_items: int = 0
+    inserted_articles: int = 0
+    linked_existing_articles: int = 0
+    fetch_cache_hits: int = 0
+    fetch_cache_misses: int = 0
+    skipped_seen: int = 0
+    near_duplicates: int = 0
+
+
+@dataclass
+class KeywordProgress:
+    """스트리밍 수집에서 키워드 하나가 끝났을 때의 결과."""
+
+    keyword_id: UUID
+    keyword: str
+    source: Literal["gdelt", "rss", "none"]
+    items_found: int = 0
+    inserted: int = 0
+    linked: int = 0
+    skipped_seen: int = 0
+    near_duplicates: int = 0
+    cache_hit: bool = False
+
+
+class CollectService:
+    @staticmethod
+    def active_keywords(session: Session, user_id: UUID) -> list[Keyword]:
+        return list(
+            session.exec(
+                select(Keyword).where(and_(Keyword.user_id == user_id, Keyword.is_active == True))  # noqa: E712
+            ).all()
+        )
+
+    @staticmethod
+    async def collect_day(session: Session, user_id: UUID, day: date) -> CollectSummary:
+        """활성 키워드 전체를 수집해 저장. POST /collect 와 백그라운드 스케줄러가 공용으로 사용."""
+        keywords = CollectService.active_keywords(session, user_id)
+        keyword_ids = [kw.id for kw in keywords]
+        summary = CollectSummary(date_kst=day.isoformat(), keywords_processed=len(keywords))
+        marks = WatermarkService.load(session, keyword_ids, summary.date_kst)
+        # 외부 수집을 기다리는 동안 커넥션을 잡고 있지 않는다 (풀이 작은 Postgres 에서 다른 요청이 막힘)
+        release_connection(session)
+
+        # 외부 수집은 키워드별로 동시에 실행하고, DB 반영은 결과를 모아 한 번에 처리
+        results = await collect_keywords(
+            [kw.text for kw in keywords], day, gdelt_since=[marks[kid].gdelt_since() for kid in keyword_ids]
+        )
+        batches: list[tuple[UUID, list[CollectedItem]]] = []
+        for kid, result in zip(keyword_ids, results):
+            fresh, _ = CollectService._accept(session, summary, marks[kid], kid, result)
+            batches.append((kid, fresh))
+
+        ingest = ArticleIngestService.ingest(session, user_id, summary.date_kst, batches)
+        summary.inserted_articles = ingest.inserted
+        summary.linked_existing_articles = ingest.linked
+        summary.near_duplicates = ingest.near_duplicates
+        return summary
+
+    @staticmethod
+    async def collect_day_stream(
+        session: Session, user_id: UUID, day: date
+    ) -> AsyncIterator[KeywordProgress | CollectSummary]:
+        """collect_day 의 스트리밍 버전. 키워드가 끝나는 대로 저장·커밋하고 KeywordProgress 를 내보낸 뒤,
+        마지막에 CollectSummary 를 내보낸다. 결과를 키워드 단위로 흘려보내 전체를 메모리에 모으지 않는다.
+        """
+        keywords = [(kw.id, kw.text) for kw in CollectService.active_keywords(session, user_id)]
+        summary = CollectSummary(date_kst=day.isoformat(), keywords_processed=len(keywords))
+        marks = WatermarkService.load(session, [kid for kid, _ in keywords], summary.date_kst)
+        release_connection(session)
+
+        # 키워드마다 저장이 커밋으로 끝나므로 다음 키워드를 기다리는 동안에도 커넥션을 잡고 있지 않다
+        async for index, result in iter_collect_keywords(
+            [text for _, text in keywords], day, gdelt_since=[marks[kid].gdelt_since() for kid, _ in keywords]
+        ):
+            kid, text = keywords[index]
+            fresh, skipped = CollectService._accept(session, summary, marks[kid], kid, result)
+            ingest = ArticleIngestService.ingest(session, user_id, summary.date_kst, [(kid, fresh)])
+            summary.inserted_articles += ingest.inserted
+            summary.linked_existing_articles += ingest.linked
+            summary.near_duplicates += ingest.near_duplicates
+            yield KeywordProgress(
+                keyword_id=kid,
+                keyword=text,
+                source="rss" if result.used_rss else ("gdelt" if result.search_items else "none"),
+                items_found=len(result.items),
+                inserted=ingest.inserted,
+                linked=ingest.linked,
+                skipped_seen=skipped,
+                near_duplicates=ingest.near_duplicates,
+                cache_hit=result.cache_hits > 0 and result.cache_misses == 0,
+            )
+        yield summary
+
+    @staticmethod
+    def _accept(
+        session: Session,
+        summary: CollectSummary,
+        marks: KeywordWatermarks,
+        keyword_id: UUID,
+        result: KeywordCollection,
+    ) -> tuple[list[CollectedItem], int]:
+        """수집 결과를 요약에 더하고 기준점으로 걸러 (새 항목, 건너뛴 수) 반환. 기준점 전진은 커밋 전 상태."""
+        summary.search_items += result.search_items
+        summary.rss_items += result.rss_items
+        summary.fetch_cache_hits += result.cache_hits
+        summary.fetch_cache_misses += result.cache_misses
+        # 이 키워드로 이미 저장·연결한 URL은 DB 조회 없이 건너뜀
+        fresh, skipped = WatermarkService.filter_seen(marks, result.items)
+        summary.skipped_seen += skipped
+        WatermarkService.advance(session, keyword_id, summary.date_kst, marks, fresh)
+        return fresh, skipped
+
+
+@dataclass
+class ProcessSummary:
+    date_kst: str
+    articles_total: int = 0
+    processed_new: int = 0
+    skipped_existing: int = 0
+    skipped_near_duplicates: int = 0
+    failed: int = 0
+    cache_hits: int = 0
+    translation_memo_hits: int = 0
+    translated_new: int = 0
+    provider_requests: int = 0
+    provider_cost_usd: float = 0.0
+    queued: int = 0  # 처리 시작 시 대기열 길이
+
+
+@dataclass
+class ProcessQueueDepth:
+    date_kst: str
+    articles_total: int = 0
+    pending: int = 0
+    pending_pinned: int = 0  # 고정 키워드 기사 중 대기
+    processed: int = 0
+    skipped_near_duplicates: int = 0
+
+
+_PROCESS_INSERT_CHUNK = 200
+
+
+class ProcessService:
+    @staticmethod
+    def _translate(session: Session, results: dict[str, Processed], summary: ProcessSummary) -> dict[str, Processed]:
+        """번역 대기(pending) 결과의 요약을 번역 메모를 거쳐 한 번에 번역. 실패하면 원문을 두고 failed."""
+        pending = [h for h, p in results.items() if p.translation_status == "pending"]
+        if not pending:
+            return results
+        stats: dict[str, int] = {}
+        translated = TranslationMemoService.translate_many(
+            session,
+            [(results[h].summary_original, results[h].translated_from or "unknown") for h in pending],
+            stats=stats,
+        )
+        summary.translation_memo_hits += stats["lru"] + stats["db"]
+        summary.translated_new += stats["translated"]
+        out = dict(results)
+        for h, text in zip(pending, translated):
+            p = results[h]
+            if text is None:
+                out[h] = replace(p, summary_ko=p.summary_original, translation_status="failed")
+            else:
+                out[h] = replace(p, summary_ko=text, translation_status="completed")
+        return out
+
+    @staticmethod
+    def _log_usage(
+        session: Session,
+        user_id: UUID,
+        date_kst: str,
+        processor: Processor,
+        articles: int,
+        usage: ProcessUsage,
+        started: float,
+    ) -> None:
+        """외부 제공자 사용량 기록. 커밋은 호출자가 한다."""
+        session.add(
+            ProviderUsageLog(
+                user_id=user_id,
+                date_kst=date_kst,
+                processor=processor_key(processor),
+                model=settings.openai_model if processor.name == "openai" else None,
+                articles=articles,
+                requests=usage.requests,
+                items=usage.items,
+                retried_items=usage.retried_items,
+                failed_items=usage.failed_items,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                cost_usd=usage.cost_usd,
+                elapsed_sec=round(time.perf_counter() - started, 3),
+            )
+        )
+
+    @staticmethod
+    def _day_filters(user_id: UUID, date_kst: str):
+        day_articles = and_(Article.user_id == user_id, Article.date_kst == date_kst)
+        # 유사 기사 묶음은 대표 기사만 처리하고, 리포트에서 대표 결과를 함께 쓴다
+        is_member = and_(col(Article.cluster_id).is_not(None), Article.cluster_id != Article.id)
+        has_result = exists().where(ProcessingResult.article_id == Article.id)
+        is_pinned = (
+            exists()
+            .where(ArticleKeyword.article_id == Article.id, ArticleKeyword.keyword_id == Keyword.id)
+            .where(col(Keyword.is_pinned).is_(True))
+        )
+        return day_articles, is_member, has_result, is_pinned
+
+    @staticmethod
+    def queue_depth(session: Session, user_id: UUID, date_kst: str) -> ProcessQueueDepth:
+        """처리 대기열 길이. 결과를 묶음마다 커밋하므로 처리 중에도 줄어드는 것이 보인다."""
+        day_articles, is_member, has_result, is_pinned = ProcessService._day_filters(user_id, date_kst)
+        waiting = and_(~is_member, ~has_result)
+        total, members, pending, pinned = session.exec(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case((is_member, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((waiting, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((and_(waiting, is_pinned), 1), else_=0)), 0),
+            ).where(day_articles)
+        ).one()
+        return ProcessQueueDepth(
+            date_kst=date_kst,
+            articles_total=total,
+            pending=pending,
+            pending_pinned=pinned,
+            processed=total - members - pending,
+            skipped_near_duplicates=members,
+        )
+
+    @staticmethod
+    def _process_chunk(
+        session: Session,
+        user_id: UUID,
+        date_kst: str,
+        processor: Processor,
+        inputs: Sequence[ArticleInput],
+        summary: ProcessSummary,
+        usage: ProcessUsage,
+    ) -> None:
+        """대기열 묶음 하나를 처리해 저장·커밋."""
+        # 다른 사용자가 이미 처리한 같은 내용은 공용 캐시에서 복사하고, 나머지 고유 내용만 처리기에 보낸다
+        hashes = [content_hash(processor, a) for a in inputs]
+        results = ProcessingCacheService.lookup(session, hashes)
+        summary.cache_hits += sum(h in results for h in hashes)
+        misses = {h: a for h, a in zip(hashes, inputs) if h not in results}
+        fresh = dict(zip(misses, process_engine.run(list(misses.values()), processor.name, usage)))
+        fresh = ProcessService._translate(session, fresh, summary)
+        ProcessingCacheService.store(session, processor, fresh)
+        results.update(fresh)
+
+        rows = []
+        for a, h in zip(inputs, hashes):
+            p = results[h]
+            summary.failed += p.translation_status == "failed"
+            rows.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "article_id": a.id,
+                    "sentiment": p.sentiment,
+                    "sentiment_confidence": p.sentiment_confidence,
+                    "summary_original": p.summary_original,
+                    "summary_ko": p.summary_ko,
+                    "translated_from": p.translated_from,
+                    "translation_status": p.translation_status,
+                    "created_at": datetime.now().astimezone(),
+                }
+            )
+        for part in chunked(rows, _PROCESS_INSERT_CHUNK):
+            insert_ignore(session, ProcessingResult, part, ["article_id"])
+        ReportSnapshotService.invalidate(session, user_id, [date_kst])
+        session.commit()
+        summary.processed_new += len(rows)
+
+    @staticmethod
+    def process_day(session: Session, user_id: UUID, date_kst: str) -> ProcessSummary:
+        """해당 날짜 기사 중 처리 결과가 없는 것을 처리. POST /process 와 스케줄러 공용.
+
+        집계 1번 + 미처리 기사 anti-join 1번으로 대기열을 만든다. 고정(is_pinned) 키워드 기사, 최신 published_at
+        순으로 정렬해 process_queue_chunk 건씩 처리·저장·커밋하므로, 처리 중에도 리포트 상단 기사부터 결과가 보인다.
+        묶음마다 공용 처리 캐시에 없는 것만 process_engine 으로 병렬 처리하고
+        ON CONFLICT(article_id) DO NOTHING 으로 일괄 저장한다(동시에 처리한 워커와 겹쳐도 안전).
+        한국어가 아닌 요약은 번역 메모에 없는 문장만 번역하고, 처리·번역에 실패한 기사는 translation_status="failed" 로 저장한다.
+        """
+        day_articles, is_member, has_result, is_pinned = ProcessService._day_filters(user_id, date_kst)
+        total, members, existing = session.exec(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case((is_member, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((and_(~is_member, has_result), 1), else_=0)), 0),
+            ).where(day_articles)
+        ).one()
+        summary = ProcessSummary(
+            date_kst=date_kst,
+            articles_total=total,
+            skipped_near_duplicates=members,
+            skipped_existing=existing,
+        )
+
+        pending = session.exec(
+            select(Article)
+            .where(day_articles, ~is_member, ~has_result)
+            .order_by(case((is_pinned, 0), else_=1), col(Article.published_at).desc().nulls_last(), Article.id)
+        ).all()
+        summary.queued = len(pending)
+        # 커밋하면 Article 이 만료돼 다시 조회되므로 입력을 먼저 모두 만든다
+        inputs = [ArticleInput.from_article(a) for a in pending]
+        processor = get_processor()
+        usage = ProcessUsage()
+        started = time.perf_counter()
+        for part in chunked(inputs, max(1, settings.process_queue_chunk)):
+            ProcessService._process_chunk(session, user_id, date_kst, processor, part, summary, usage)
+
+        if usage.requests:
+            ProcessService._log_usage(session, user_id, date_kst, processor, len(inputs), usage, started)
+            session.commit()
+            summary.provider_requests = usage.requests
+            summary.provider_cost_usd = round(usage.cost_usd, 6)
+        return summary
@@ -0,0 +1,134 @@
+"""번역 메모: (원문 해시, 원문 언어, 대상 언어, 번역 제공자 버전) → 번역문.
+
+같은 영문 요약이 사용자·날짜를 넘어 반복되므로 번역은 한 번만 한다.
+프로세스 내 LRU → DB(TranslationMemo) 순으로 찾고, 둘 다 없는 문장만 언어별로 묶어 제공자에 한 번씩 보낸다.
+번역에 실패한 묶음은 메모에 남기지 않는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlmodel import Session, col, select
+
+from ...db import chunked, insert_ignore
+from ...settings import settings
+from ...translate import Translator, get_translator
+from .models import TranslationMemo
+
+logger = logging.getLogger(__name__)
+
+TARGET_LANG = "ko"
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def memo_key(translator: Translator, source_lang: str, target_lang: str, text: str) -> str:
+    raw = f"{translator.name}:{translator.version}\x1f{source_lang}\x1f{target_lang}\x1f{text_hash(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Lru:
+    def __init__(self) -> None:
+        self._items: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        size = settings.translation_memo_lru_size
+        if size <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+translation_lru = _Lru()
+
+
+class TranslationMemoService:
+    @staticmethod
+    def translate_many(
+        session: Session,
+        items: Sequence[tuple[str, str]],
+        target_lang: str = TARGET_LANG,
+        stats: Optional[dict[str, int]] = None,
+    ) -> list[Optional[str]]:
+        """(원문, 원문 언어) 목록의 번역문. 실패한 항목은 None. 커밋은 호출자가 한다.
+
+        stats 를 넘기면 lru·db·translated 건수를 더한다.
+        """
+        translator = get_translator()
+        keys = [memo_key(translator, lang, target_lang, text) for text, lang in items]
+        found: dict[str, str] = {}
+        for k in dict.fromkeys(keys):
+            value = translation_lru.get(k)
+            if value is not None:
+                found[k] = value
+        lru_hits = len(found)
+
+        missing = [k for k in dict.fromkeys(keys) if k not in found]
+        for part in chunked(missing):
+            rows = session.exec(
+                select(TranslationMemo.memo_key, TranslationMemo.translated_text).where(
+                    col(TranslationMemo.memo_key).in_(part)
+                )
+            ).all()
+            for k, value in rows:
+                found[k] = value
+                translation_lru.put(k, value)
+        db_hits = len(found) - lru_hits
+
+        # 메모에 없는 고유 문장만 원문 언어별로 묶어 번역
+        pending: dict[str, dict[str, str]] = {}  # lang → key → text
+        for k, (text, lang) in zip(keys, items):
+            if k not in found:
+                pending.setdefault(lang, {})[k] = text
+        now = datetime.now().astimezone()
+        new_rows = []
+        for lang, by_key in pending.items():
+            try:
+                translated = translator.translate(list(by_key.values()), lang, target_lang)
+            except Exception:
+                logger.exception("translation failed for %d texts (%s → %s)", len(by_key), lang, target_lang)
+                continue
+            for (k, text), value in zip(by_key.items(), translated):
+                found[k] = value
+                translation_lru.put(k, value)
+                new_rows.append(
+                    {
+                        "memo_key": k,
+                        "text_hash": text_hash(text),
+                        "source_lang": lang,
+                        "target_lang": target_lang,
+                        "provider": f"{translator.name}:{translator.version}",
+                        "translated_text": value,
+                        "created_at": now,
+                    }
+                )
+        for part in chunked(new_rows):
+            insert_ignore(session, TranslationMemo, part, ["memo_key"])
+
+        if stats is not None:
+            stats["lru"] = stats.get("lru", 0) + lru_hits
+            stats["db"] = stats.get("db", 0) + db_hits
+            stats["translated"] = stats.get("translated", 0) + len(new_rows)
+        return [found.get(k) for k in keys]
@@ -0,0 +1,119 @@
+"""키워드별 증분 수집 기준점(high-water mark).
+
+(keyword_id, source, date_kst) 마다 가장 최근 published_at 과 이미 저장한 canonical_url 해시를 남긴다.
+같은 날 다시 수집할 때 본 URL은 DB 조회 전에 걸러내고, GDELT 는 조회 시작 시각을 좁힌다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlmodel import Session, and_, col, delete, select
+
+from ...collect import CollectedItem
+from ...db import chunked
+from ...settings import settings
+from .models import CollectWatermark
+
+# GDELT 증분 조회 시작 시각 버킷. 비슷한 기준점을 가진 사용자끼리 공유 수집 캐시를 함께 쓰도록 내림.
+SINCE_BUCKET_MINUTES = 15
+
+
+def url_key(canonical_url: str) -> str:
+    return hashlib.blake2b(canonical_url.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _source_of(item: CollectedItem) -> str:
+    return "rss" if item.source_type == "rss" else "gdelt"
+
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+@dataclass
+class KeywordWatermarks:
+    rows: dict[str, CollectWatermark] = field(default_factory=dict)  # source → row
+    _seen: set[str] | None = None
+
+    @property
+    def seen(self) -> set[str]:
+        if self._seen is None:
+            self._seen = set()
+            for row in self.rows.values():
+                self._seen.update(json.loads(row.seen_url_keys_json or "[]"))
+        return self._seen
+
+    def gdelt_since(self) -> Optional[datetime]:
+        row = self.rows.get("gdelt")
+        if row is None or row.latest_published_at is None:
+            return None
+        since = _as_utc(row.latest_published_at) - timedelta(minutes=settings.watermark_overlap_minutes)
+        return since.replace(minute=since.minute - since.minute % SINCE_BUCKET_MINUTES, second=0, microsecond=0)
+
+
+class WatermarkService:
+    @staticmethod
+    def load(session: Session, keyword_ids: Sequence[UUID], date_kst: str) -> dict[UUID, KeywordWatermarks]:
+        out: dict[UUID, KeywordWatermarks] = {kid: KeywordWatermarks() for kid in keyword_ids}
+        if not settings.watermark_enabled:
+            return out
+        for part in chunked(list(keyword_ids)):
+            rows = session.exec(
+                select(CollectWatermark).where(
+                    and_(col(CollectWatermark.keyword_id).in_(part), CollectWatermark.date_kst == date_kst)
+                )
+            ).all()
+            for row in rows:
+                out[row.keyword_id].rows[row.source] = row
+        return out
+
+    @staticmethod
+    def filter_seen(marks: KeywordWatermarks, items: Sequence[CollectedItem]) -> tuple[list[CollectedItem], int]:
+        """(처음 보는 항목, 건너뛴 수)."""
+        if not settings.watermark_enabled or not marks.rows:
+            return list(items), 0
+        seen = marks.seen
+        fresh = [it for it in items if url_key(it.canonical_url) not in seen]
+        return fresh, len(items) - len(fresh)
+
+    @staticmethod
+    def advance(
+        session: Session,
+        keyword_id: UUID,
+        date_kst: str,
+        marks: KeywordWatermarks,
+        items: Sequence[CollectedItem],
+    ) -> None:
+        """새로 저장한 항목으로 기준점을 전진. 커밋은 호출자(일괄 저장)가 한다."""
+        if not settings.watermark_enabled or not items:
+            return
+        now = datetime.now().astimezone()
+        by_source: dict[str, list[CollectedItem]] = {}
+        for it in items:
+            by_source.setdefault(_source_of(it), []).append(it)
+        for source, source_items in by_source.items():
+            row = marks.rows.get(source)
+            if row is None:
+                row = CollectWatermark(keyword_id=keyword_id, source=source, date_kst=date_kst)
+                marks.rows[source] = row
+            keys = json.loads(row.seen_url_keys_json or "[]")
+            keys.extend(url_key(it.canonical_url) for it in source_items)
+            row.seen_url_keys_json = json.dumps(list(dict.fromkeys(keys))[-settings.watermark_max_seen_urls :])
+            published = [_as_utc(it.published_at) for it in source_items if it.published_at]
+            if published:
+                latest = max(published)
+                if row.latest_published_at is None or latest > _as_utc(row.latest_published_at):
+                    row.latest_published_at = latest
+            row.updated_at = now
+            session.add(row)
+        marks._seen = None
+
+    @staticmethod
+    def delete_for_keyword(session: Session, keyword_id: UUID) -> None:
+        """키워드 삭제 전에 부른다. SQLite 는 FK(ON DELETE CASCADE)를 강제하지 않으므로 직접 지운다. 커밋은 호출자가 한다."""
+        session.exec(delete(CollectWatermark).where(CollectWatermark.keyword_id == keyword_id))
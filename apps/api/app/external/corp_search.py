@@ -7,11 +7,11 @@ import zipfile
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import httpx
 from sqlmodel import Session, col, delete, select
 
 from ..domains.admin.models import AppSetting
 from ..domains.stock.models import CorpCodeCache
+from ..http_clients import http_clients
 from ..settings import settings
 
 CORPCODE_URL = "https://opendart.fss.or.kr/api/corpCode.xml"
@@ -29,13 +29,13 @@ def _fetch_zip() -> bytes | None:
     if not key:
         return None
     try:
-        with httpx.Client(timeout=30.0) as client:
-            r = client.get(CORPCODE_URL, params={"crtfc_key": key})
-            r.raise_for_status()
-            raw = r.content
-            if not raw or raw[:1] == b"{" or (len(raw) < 100 and b"<" not in raw):
-                return None
-            return raw
+        # ZIP 전체 다운로드라 호스트 기본값보다 긴 타임아웃 사용
+        r = http_clients.sync_client(CORPCODE_URL).get(CORPCODE_URL, params={"crtfc_key": key}, timeout=30.0)
+        r.raise_for_status()
+        raw = r.content
+        if not raw or raw[:1] == b"{" or (len(raw) < 100 and b"<" not in raw):
+            return None
+        return raw
     except Exception:
         return None
 
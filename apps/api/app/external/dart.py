@@ -4,8 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-import httpx
-
+from ..http_clients import http_clients
 from ..settings import settings
 
 LIST_URL = "https://opendart.fss.or.kr/api/list.json"
@@ -62,9 +61,8 @@ class DartClient:
             "page_count": min(page_count, 100),
         }
         try:
-            with httpx.Client(timeout=15.0) as client:
-                r = client.get(LIST_URL, params=params)
-                r.raise_for_status()
+            r = http_clients.sync_client(LIST_URL).get(LIST_URL, params=params)
+            r.raise_for_status()
         except Exception:
             return []
 
@@ -6,8 +6,7 @@ from datetime import datetime, timedelta
 from typing import Any
 from urllib.parse import unquote
 
-import httpx
-
+from ..http_clients import http_clients
 from ..settings import settings
 
 BASE_URL = "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getStockPriceInfo"
@@ -101,9 +100,8 @@ class StockPriceClient:
             "endBasDt": end_str,
         }
         try:
-            with httpx.Client(timeout=15.0) as client:
-                r = client.get(BASE_URL, params=params)
-                r.raise_for_status()
+            r = http_clients.sync_client(BASE_URL).get(BASE_URL, params=params)
+            r.raise_for_status()
         except Exception:
             return []
 
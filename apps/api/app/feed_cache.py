@@ -0,0 +1,238 @@
+"""RSS 피드 조건부 GET(HTTP validator) 캐시.
+
+피드 URL별로 ETag/Last-Modified와 마지막으로 파싱한 항목을 보관하고,
+다음 요청에 If-None-Match/If-Modified-Since를 보낸다. 304 응답이면 보관한 항목을
+다시 파싱하지 않고 그대로 쓴다. 프로세스 내 LRU가 기본이며,
+FEED_CACHE_BACKEND=db 이면 여러 워커가 FeedCacheEntry 테이블을 공유한다.
+
+db 백엔드는 피드 요청마다 조회하지 않는다. 수집 실행 시작 때 필요한 피드 URL 을 한 번에 읽어 LRU 에 채우고(preload),
+실행 중 바뀐 항목은 모았다가 끝날 때 한 번에 저장한다(flush). 둘 다 별도 커넥션 풀로 스레드에서 돌려
+이벤트 루프와 요청 세션의 커넥션을 막지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Protocol, Sequence
+
+from dateutil import parser as dtparser
+from sqlmodel import Session, col, select
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    link: str
+    title: str
+    summary: Optional[str]
+    published_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class CachedFeed:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    entries: tuple[FeedEntry, ...]
+
+    def validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class FeedCacheBackend(Protocol):
+    def get_many(self, urls: Sequence[str]) -> dict[str, CachedFeed]: ...
+
+    def put_many(self, feeds: dict[str, CachedFeed]) -> None: ...
+
+
+class MemoryFeedCache:
+    """피드 URL 기준 LRU."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedFeed] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CachedFeed | None:
+        with self._lock:
+            feed = self._entries.get(url)
+            if feed is not None:
+                self._entries.move_to_end(url)
+            return feed
+
+    def put(self, url: str, feed: CachedFeed) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[url] = feed
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _dump_entries(entries: tuple[FeedEntry, ...]) -> str:
+    return json.dumps(
+        [
+            [e.link, e.title, e.summary, e.published_at.isoformat() if e.published_at else None]
+            for e in entries
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _load_entries(raw: str) -> tuple[FeedEntry, ...]:
+    return tuple(
+        FeedEntry(link=link, title=title, summary=summary, published_at=dtparser.isoparse(pub) if pub else None)
+        for link, title, summary, pub in json.loads(raw)
+    )
+
+
+class DbFeedCache:
+    """FeedCacheEntry 테이블 기반 공유 캐시 (워커 간 공유). 요청 세션과 따로 커넥션 1개짜리 풀을 쓴다."""
+
+    def __init__(self, engine=None) -> None:
+        self._engine = engine
+
+    def _session(self) -> Session:
+        if self._engine is None:
+            from .db import create_db_engine
+
+            self._engine = create_db_engine(pool_size=1)
+        return Session(self._engine)
+
+    def get_many(self, urls: Sequence[str]) -> dict[str, CachedFeed]:
+        from .db import chunked
+        from .models import FeedCacheEntry
+
+        by_hash = {_url_hash(u): u for u in urls}
+        out: dict[str, CachedFeed] = {}
+        with self._session() as session:
+            for part in chunked(list(by_hash)):
+                for row in session.exec(select(FeedCacheEntry).where(col(FeedCacheEntry.url_hash).in_(part))).all():
+                    out[by_hash[row.url_hash]] = CachedFeed(
+                        etag=row.etag, last_modified=row.last_modified, entries=_load_entries(row.entries_json)
+                    )
+        return out
+
+    def put_many(self, feeds: dict[str, CachedFeed]) -> None:
+        from .db import chunked
+        from .models import FeedCacheEntry
+
+        if not feeds:
+            return
+        by_hash = {_url_hash(u): u for u in feeds}
+        now = datetime.now().astimezone()
+        with self._session() as session:
+            existing: dict[str, FeedCacheEntry] = {}
+            for part in chunked(list(by_hash)):
+                for row in session.exec(select(FeedCacheEntry).where(col(FeedCacheEntry.url_hash).in_(part))).all():
+                    existing[row.url_hash] = row
+            for key, url in by_hash.items():
+                feed = feeds[url]
+                row = existing.get(key) or FeedCacheEntry(url_hash=key, url=url)
+                row.etag = feed.etag
+                row.last_modified = feed.last_modified
+                row.entries_json = _dump_entries(feed.entries)
+                row.updated_at = now
+                session.add(row)
+            session.commit()
+
+
+class FeedCache:
+    """메모리 LRU 앞단 + 선택적 공유 백엔드. 적중(304)/미스 통계를 집계한다.
+
+    get/put 은 메모리만 본다. 공유 백엔드는 수집 실행 앞뒤의 preload/flush 로만 읽고 쓴다.
+    """
+
+    def __init__(self, max_entries: int, shared: FeedCacheBackend | None = None) -> None:
+        self.memory = MemoryFeedCache(max_entries)
+        self.shared = shared
+        self.not_modified = 0
+        self.refreshed = 0
+        self._dirty: dict[str, CachedFeed] = {}
+        self._dirty_lock = threading.Lock()
+
+    def get(self, url: str) -> CachedFeed | None:
+        return self.memory.get(url)
+
+    def put(self, url: str, feed: CachedFeed) -> None:
+        self.memory.put(url, feed)
+        if self.shared is not None:
+            with self._dirty_lock:
+                self._dirty[url] = feed
+
+    async def preload(self, urls: Sequence[str]) -> None:
+        """메모리에 없는 피드를 공유 백엔드에서 한 번에 읽어 채운다."""
+        if self.shared is None:
+            return
+        missing = [u for u in dict.fromkeys(urls) if self.memory.get(u) is None]
+        if not missing:
+            return
+        try:
+            found = await asyncio.to_thread(self.shared.get_many, missing)
+        except Exception:
+            logger.warning("feed cache preload failed for %d feeds", len(missing), exc_info=True)
+            return
+        for url, feed in found.items():
+            self.memory.put(url, feed)
+
+    async def flush(self) -> None:
+        """실행 중 바뀐 피드를 공유 백엔드에 한 번에 저장."""
+        if self.shared is None:
+            return
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        try:
+            await asyncio.to_thread(self.shared.put_many, dirty)
+        except Exception:
+            logger.warning("feed cache flush failed for %d feeds", len(dirty), exc_info=True)
+
+    def stats(self) -> dict:
+        total = self.not_modified + self.refreshed
+        return {
+            "backend": "db" if self.shared is not None else "memory",
+            "entries": len(self.memory),
+            "max_entries": self.memory.max_entries,
+            "not_modified": self.not_modified,
+            "refreshed": self.refreshed,
+            "not_modified_rate": round(self.not_modified / total, 4) if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        self.memory.clear()
+        with self._dirty_lock:
+            self._dirty.clear()
+        self.not_modified = 0
+        self.refreshed = 0
+
+
+feed_cache = FeedCache(
+    max_entries=settings.feed_cache_max_entries,
+    shared=DbFeedCache() if settings.feed_cache_backend.lower() == "db" else None,
+)
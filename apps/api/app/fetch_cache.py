@@ -0,0 +1,114 @@
+"""사용자 간 공유되는 외부 수집 결과 캐시.
+
+같은 키워드를 추적하는 사용자가 많으므로 (정규화 키워드, KST 날짜, 소스) 단위로
+수집 결과(CollectedItem 목록)를 TTL 동안 재사용한다. 동시에 들어온 같은 키 요청은
+하나의 업스트림 호출을 공유한다(single-flight). 프로세스 내 메모리 캐시.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Awaitable, Callable, TypeVar
+
+from .settings import settings
+
+T = TypeVar("T")
+
+CacheKey = tuple[str, str, str]  # (normalized keyword, YYYY-MM-DD, source)
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.split()).casefold()
+
+
+def cache_key(keyword: str, day: date, source: str) -> CacheKey:
+    return normalize_keyword(keyword), day.isoformat(), source
+
+
+class FetchCache:
+    def __init__(self, ttl_sec: float, max_entries: int) -> None:
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, list]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0 and self.max_entries > 0
+
+    def _get(self, key: CacheKey) -> list | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: CacheKey, value: list) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, key: CacheKey, fetch: Callable[[], Awaitable[list[T]]]) -> tuple[list[T], bool]:
+        """(결과, 캐시 적중 여부). 예외는 캐시하지 않고 그대로 전파한다."""
+        if not self.enabled:
+            self.misses += 1
+            return await fetch(), False
+
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return list(cached), True
+
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            self.hits += 1
+            return list(await asyncio.shield(pending)), True
+
+        self.misses += 1
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await fetch()
+        except BaseException as e:
+            # 취소는 대기자에게 일반 실패로 전달 (대기자 태스크까지 취소되지 않도록)
+            fut.set_exception(e if isinstance(e, Exception) else RuntimeError("fetch cancelled"))
+            # 대기자가 없을 때 'exception was never retrieved' 경고 방지
+            fut.exception()
+            raise
+        else:
+            self._put(key, value)
+            fut.set_result(value)
+            return list(value), False
+        finally:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_sec": self.ttl_sec,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+fetch_cache = FetchCache(ttl_sec=settings.fetch_cache_ttl_sec, max_entries=settings.fetch_cache_max_entries)
@@ -0,0 +1,137 @@
+"""외부 연동용 공용 HTTP 클라이언트 레지스트리.
+
+호출마다 httpx.Client/AsyncClient를 새로 만들면 매번 TCP+TLS 핸드셰이크가 발생한다.
+업스트림 호스트별로 sync/async 클라이언트를 하나씩 두고 keep-alive 커넥션을 재사용한다.
+수명은 FastAPI lifespan이 관리하며(종료 시 aclose), lifespan 밖(스크립트 등)에서는 지연 생성된다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import httpx
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "touch/0.1"
+
+
+@dataclass(frozen=True)
+class HostConfig:
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+
+DEFAULT_HOST_CONFIG = HostConfig()
+
+# 호스트별 타임아웃·커넥션 한도. 미등록 호스트는 DEFAULT_HOST_CONFIG 사용.
+HOST_CONFIGS: dict[str, HostConfig] = {
+    "api.gdeltproject.org": HostConfig(timeout=30.0, connect_timeout=30.0, max_connections=16, max_keepalive_connections=8),
+    "news.google.com": HostConfig(timeout=30.0, connect_timeout=10.0, max_connections=16, max_keepalive_connections=8),
+    # 공공데이터포털 30 TPS 제한
+    "apis.data.go.kr": HostConfig(timeout=15.0, connect_timeout=10.0, max_connections=5, max_keepalive_connections=5),
+    "opendart.fss.or.kr": HostConfig(timeout=15.0, connect_timeout=10.0, max_connections=5, max_keepalive_connections=5),
+    # 기사 묶음 처리는 응답이 느리다 (openai_concurrency 개 동시 요청)
+    "api.openai.com": HostConfig(timeout=120.0, connect_timeout=10.0, max_connections=8, max_keepalive_connections=8),
+}
+
+
+def _host_of(url_or_host: str) -> str:
+    if "://" not in url_or_host:
+        return url_or_host.lower()
+    return (urlparse(url_or_host).netloc or url_or_host).lower()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientRegistry:
+    def __init__(self, host_configs: dict[str, HostConfig] | None = None) -> None:
+        self._host_configs = dict(HOST_CONFIGS if host_configs is None else host_configs)
+        self._sync: dict[str, httpx.Client] = {}
+        self._async: dict[str, httpx.AsyncClient] = {}
+        # AsyncClient 커넥션 풀은 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._http2: bool | None = None
+
+    def config_for(self, url_or_host: str) -> HostConfig:
+        return self._host_configs.get(_host_of(url_or_host), DEFAULT_HOST_CONFIG)
+
+    def _use_http2(self) -> bool:
+        if self._http2 is None:
+            self._http2 = bool(settings.http2_enabled) and _http2_available()
+            if settings.http2_enabled and not self._http2:
+                logger.warning("HTTP2_ENABLED=true 이지만 h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install httpx[http2]).")
+        return self._http2
+
+    def _client_kwargs(self, host: str) -> dict:
+        cfg = self.config_for(host)
+        return {
+            "timeout": httpx.Timeout(cfg.timeout, connect=cfg.connect_timeout),
+            "limits": httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
+                keepalive_expiry=cfg.keepalive_expiry,
+            ),
+            "headers": {"User-Agent": USER_AGENT},
+            "http2": self._use_http2(),
+        }
+
+    def sync_client(self, url_or_host: str) -> httpx.Client:
+        """호스트 전용 동기 클라이언트(스레드 간 공유 가능)."""
+        host = _host_of(url_or_host)
+        client = self._sync.get(host)
+        if client is not None and not client.is_closed:
+            return client
+        with self._lock:
+            client = self._sync.get(host)
+            if client is None or client.is_closed:
+                client = httpx.Client(**self._client_kwargs(host))
+                self._sync[host] = client
+            return client
+
+    def async_client(self, url_or_host: str) -> httpx.AsyncClient:
+        """호스트 전용 비동기 클라이언트. 실행 중인 이벤트 루프 안에서 호출해야 한다."""
+        host = _host_of(url_or_host)
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # 다른 루프에 묶인 클라이언트는 이 루프에서 닫을 수 없으므로 버리고 새로 만든다.
+            self._async = {}
+            self._async_loop = loop
+        client = self._async.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**self._client_kwargs(host))
+            self._async[host] = client
+        return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._sync.values())
+            self._sync = {}
+        for c in clients:
+            c.close()
+
+    async def aclose(self) -> None:
+        clients = list(self._async.values())
+        self._async = {}
+        self._async_loop = None
+        for c in clients:
+            await c.aclose()
+        self.close()
+
+
+http_clients = HttpClientRegistry()
@@ -0,0 +1,146 @@
+"""오프라인 언어 판별 (문자 n-gram 나이브 베이즈).
+
+RSS 항목은 언어 정보가 없어 한국어 제목도 번역 대상이 되므로, 저장 시 제목·요약으로 language_original 을 채운다.
+
+- 특징: 소문자 문자 1~3-gram(단어 앞뒤 공백 포함)과 문자 체계 표지(한글·가나·한자·라틴)를
+  crc32 로 N_BUCKETS 칸에 해싱.
+- 모델: 언어별 칸 로그 확률 [언어 × 칸] float16 배열 (app/data/langid.npz, 수십 KB).
+  scripts/build_langid_model.py 로 다시 만든다.
+- 글자의 HANGUL_SHARE 이상이 한글이면 ko, 가나가 있으면 ja 로 바로 정하고 나머지만 모델로 판별.
+- 묶음 판별: (문장, 칸) 희소 좌표를 한 번에 모아 언어마다 np.bincount 로 점수 합산.
+"""
+from __future__ import annotations
+
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+MODEL_PATH = Path(__file__).resolve().parent / "data" / "langid.npz"
+N_BUCKETS = 4096
+MAX_CHARS = 200  # 제목·요약 앞부분이면 충분
+SCRIPT_WEIGHT = 4  # 문자 체계 표지는 글자마다 이만큼 센다
+# 한글·가나는 그 언어에만 쓰이므로, 글자 중 이 비율 이상이면 모델 없이 정한다.
+# "OpenAI CEO 방한" 같은 혼합 제목은 학습 문장이 적은 라틴 n-gram 에 밀리기 쉽다.
+HANGUL_SHARE = 0.1
+
+_SCRIPT_TOKENS = {"hangul": "\x01H", "kana": "\x01K", "han": "\x01C", "latin": "\x01L"}
+# n-gram → 칸 번호 캐시 (제목에 나오는 n-gram 은 대부분 반복된다)
+_BUCKETS: dict[str, int] = {}
+_BUCKET_CACHE_MAX = 200_000
+_SCRIPT_BUCKETS = {name: zlib.crc32(tok.encode()) % N_BUCKETS for name, tok in _SCRIPT_TOKENS.items()}
+
+
+def _script(ch: str) -> Optional[str]:
+    o = ord(ch)
+    if 0xAC00 <= o <= 0xD7A3 or 0x1100 <= o <= 0x11FF or 0x3130 <= o <= 0x318F:
+        return "hangul"
+    if 0x3040 <= o <= 0x30FF:
+        return "kana"
+    if 0x4E00 <= o <= 0x9FFF:
+        return "han"
+    if ch.isalpha() and o < 0x250:
+        return "latin"
+    return None
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower()[:MAX_CHARS].split())
+
+
+def _scripts(text: str) -> list[str]:
+    return [s for s in map(_script, text) if s is not None]
+
+
+def features(text: str, scripts: Optional[list[str]] = None) -> list[int]:
+    """정규화된 문장의 특징 칸 번호 목록(중복 포함). 글자(문자 체계 표지)가 없으면 빈 목록."""
+    scripts = _scripts(text) if scripts is None else scripts
+    if not scripts:
+        return []
+    out = [_SCRIPT_BUCKETS[s] for s in scripts] * SCRIPT_WEIGHT
+    padded = f" {text} "
+    grams = [padded[i : i + n] for n in (1, 2, 3) for i in range(len(padded) - n + 1)]
+    buckets = _BUCKETS
+    for gram in grams:
+        b = buckets.get(gram)
+        if b is None:
+            b = buckets[gram] = -1 if gram.isspace() else zlib.crc32(gram.encode("utf-8")) % N_BUCKETS
+            if len(buckets) > _BUCKET_CACHE_MAX:
+                buckets.clear()
+        if b >= 0:
+            out.append(b)
+    return out
+
+
+def script_language(scripts: list[str]) -> Optional[str]:
+    """문자 체계만으로 정해지는 언어(ko·ja). 아니면 None."""
+    if "kana" in scripts:
+        return "ja"
+    if scripts and scripts.count("hangul") >= HANGUL_SHARE * len(scripts):
+        return "ko"
+    return None
+
+
+class LanguageIdentifier:
+    def __init__(self, langs: Sequence[str], log_probs: np.ndarray) -> None:
+        self.langs = list(langs)
+        self.log_probs = log_probs.astype(np.float32)  # [언어 × 칸]
+
+    @classmethod
+    def load(cls, path: Path = MODEL_PATH) -> "LanguageIdentifier":
+        with np.load(path) as data:
+            return cls([str(x) for x in data["langs"]], data["log_probs"])
+
+    def detect_many(self, texts: Sequence[Optional[str]]) -> list[Optional[str]]:
+        """문장마다 언어 코드. 글자가 없는 문장은 None."""
+        out: list[Optional[str]] = [None] * len(texts)
+        rows: list[int] = []
+        cols: list[int] = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            text = normalize(text)
+            scripts = _scripts(text)
+            out[i] = script_language(scripts)
+            if out[i] is not None or not scripts:
+                continue
+            feats = features(text, scripts)
+            rows.extend([i] * len(feats))
+            cols.extend(feats)
+        if not rows:
+            return out
+        row_idx = np.asarray(rows, dtype=np.int64)
+        col_idx = np.asarray(cols, dtype=np.int64)
+        scores = np.stack(
+            [np.bincount(row_idx, weights=self.log_probs[k, col_idx], minlength=len(texts)) for k in range(len(self.langs))],
+            axis=1,
+        )
+        has_feats = np.bincount(row_idx, minlength=len(texts)) > 0
+        best = scores.argmax(axis=1)
+        for i, (b, ok) in enumerate(zip(best.tolist(), has_feats.tolist())):
+            if ok:
+                out[i] = self.langs[b]
+        return out
+
+    def detect(self, text: Optional[str]) -> Optional[str]:
+        return self.detect_many([text])[0]
+
+
+_model: Optional[LanguageIdentifier] = None
+_model_lock = threading.Lock()
+
+
+def get_identifier() -> LanguageIdentifier:
+    """번들 모델(처음 쓸 때 한 번 로드)."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = LanguageIdentifier.load()
+    return _model
+
+
+def detect_languages(texts: Sequence[Optional[str]]) -> list[Optional[str]]:
+    return get_identifier().detect_many(texts)
@@ -0,0 +1,182 @@
+"""업스트림 지연 인지 요청 계층 (GDELT 등 꼬리 지연이 큰 외부 API).
+
+- 업스트림별 최근 응답 시간 창에서 p50/p95 를 계산하고, 타임아웃을 p95 × 배수로 정한다
+  (표본이 부족하면 호스트 기본 타임아웃). 타임아웃된 요청도 타임아웃 값으로 기록해, 업스트림이 느려질 때
+  빠른 응답만 남아 타임아웃이 계속 줄어들지 않게 한다.
+- 첫 요청이 p95 안에 끝나지 않으면 같은 요청을 한 번 더 보내(hedge) 먼저 온 응답을 쓴다.
+- 429/5xx·전송 오류는 지수 백오프 + full jitter 로 재시도한다 (429 의 Retry-After 우선).
+  재시도·대기를 합친 전체 시간은 latency_total_budget_sec 를 넘지 않는다.
+
+GET 처럼 멱등인 요청에만 사용한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Optional
+
+import httpx
+
+from .settings import settings
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class LatencyTracker:
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        # upstream → {"hedged", "hedge_wins", "retries", "timeouts"} 횟수
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def record(self, upstream: str, seconds: float) -> None:
+        samples = self._samples.get(upstream)
+        if samples is None:
+            samples = self._samples[upstream] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def bump(self, upstream: str, counter: str) -> None:
+        counters = self._counters.setdefault(upstream, {})
+        counters[counter] = counters.get(counter, 0) + 1
+
+    def percentile(self, upstream: str, q: float) -> Optional[float]:
+        """표본이 latency_min_samples 미만이면 None."""
+        samples = self._samples.get(upstream)
+        if not samples or len(samples) < settings.latency_min_samples:
+            return None
+        return _percentile(sorted(samples), q)
+
+    def timeout_for(self, upstream: str, default: float) -> float:
+        p95 = self.percentile(upstream, 0.95)
+        if p95 is None:
+            return default
+        timeout = p95 * settings.latency_timeout_multiplier
+        return min(default, max(settings.latency_min_timeout_sec, timeout))
+
+    def hedge_delay(self, upstream: str) -> Optional[float]:
+        if not settings.latency_hedge_enabled:
+            return None
+        return self.percentile(upstream, 0.95)
+
+    def stats(self) -> dict:
+        out: dict[str, dict[str, Any]] = {}
+        for upstream, samples in self._samples.items():
+            ordered = sorted(samples)
+            out[upstream] = {
+                "samples": len(ordered),
+                "p50_ms": round(_percentile(ordered, 0.5) * 1000, 1),
+                "p95_ms": round(_percentile(ordered, 0.95) * 1000, 1),
+                **{k: self._counters.get(upstream, {}).get(k, 0) for k in ("hedged", "hedge_wins", "retries", "timeouts")},
+            }
+        return out
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._counters.clear()
+
+
+latency_tracker = LatencyTracker(window=settings.latency_window)
+
+
+def backoff_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """attempt(1부터)번째 실패 후 대기 시간. 429 의 Retry-After(초)가 있으면 상한 안에서 따른다."""
+    cap = settings.latency_backoff_max_sec
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(cap, float(retry_after))
+    return random.uniform(0, min(cap, settings.latency_backoff_base_sec * 2 ** (attempt - 1)))
+
+
+async def _timed_get(
+    client: httpx.AsyncClient, url: str, params: Optional[dict], timeout: float
+) -> tuple[httpx.Response, float]:
+    started = time.perf_counter()
+    resp = await client.get(url, params=params, timeout=timeout)
+    return resp, time.perf_counter() - started
+
+
+async def _hedged_get(
+    client: httpx.AsyncClient, url: str, params: Optional[dict], upstream: str, timeout: float
+) -> httpx.Response:
+    """첫 요청이 hedge 지연(p95) 안에 끝나지 않으면 두 번째 요청을 보내 먼저 끝난 쪽을 쓴다."""
+    tracker = latency_tracker
+    primary = asyncio.ensure_future(_timed_get(client, url, params, timeout))
+    tasks = [primary]
+    try:
+        delay = tracker.hedge_delay(upstream)
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                tracker.bump(upstream, "hedged")
+                tasks.append(asyncio.ensure_future(_timed_get(client, url, params, timeout)))
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    error = task.exception()
+                    if isinstance(error, httpx.TimeoutException):
+                        tracker.record(upstream, timeout)
+                    continue
+                resp, elapsed = task.result()
+                tracker.record(upstream, elapsed)
+                if task is not primary:
+                    tracker.bump(upstream, "hedge_wins")
+                return resp
+        assert error is not None
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def resilient_get(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    upstream: Optional[str] = None,
+    default_timeout: float = 30.0,
+) -> httpx.Response:
+    """지연 인지 GET. 재시도 대상이 아닌 응답을 반환한다.
+
+    재시도를 다 쓰면 마지막 429/5xx 응답을 그대로 반환하고(호출자가 raise_for_status), 전송 오류는 다시 던진다.
+    """
+    upstream = upstream or httpx.URL(url).host
+    attempts = max(1, settings.latency_max_attempts)
+    deadline = time.monotonic() + settings.latency_total_budget_sec
+    for attempt in range(1, attempts + 1):
+        remaining = max(0.0, deadline - time.monotonic())
+        timeout = min(latency_tracker.timeout_for(upstream, default_timeout), remaining)
+        error: Optional[httpx.TransportError] = None
+        try:
+            resp = await _hedged_get(client, url, params, upstream, timeout)
+        except httpx.TimeoutException as e:
+            latency_tracker.bump(upstream, "timeouts")
+            resp, error = None, e
+        except httpx.TransportError as e:
+            resp, error = None, e
+        if resp is not None and resp.status_code not in RETRY_STATUS:
+            return resp
+        delay = backoff_delay(attempt, resp)
+        # 대기 뒤 최소 타임아웃만큼의 시간도 남지 않으면 재시도하지 않는다
+        out_of_budget = time.monotonic() + delay + settings.latency_min_timeout_sec > deadline
+        if attempt == attempts or out_of_budget:
+            if resp is not None:
+                return resp
+            assert error is not None
+            raise error
+        latency_tracker.bump(upstream, "retries")
+        await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
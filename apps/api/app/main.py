@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import warnings
 from contextlib import asynccontextmanager
@@ -8,6 +9,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .db import init_db
+from .http_clients import http_clients
+from .process_engine import process_engine
 from .routers import admin, admin_auth, articles, auth, collect, keywords, me, process, report, settings, stocks
 from .settings import settings as app_settings
 
@@ -24,7 +27,22 @@ async def lifespan(app: FastAPI):
         )
         logger.warning("JWT_SECRET is using the default value — NOT safe for production!")
     init_db()
-    yield
+    scheduler_task: asyncio.Task | None = None
+    if app_settings.scheduler_enabled:
+        from .scheduler import CollectScheduler
+
+        scheduler_task = asyncio.create_task(CollectScheduler().run_forever())
+    try:
+        yield
+    finally:
+        if scheduler_task is not None:
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                pass
+        await http_clients.aclose()
+        process_engine.shutdown()
 
 
 app = FastAPI(title="touch API", version="0.1.0", lifespan=lifespan)
@@ -11,9 +11,19 @@ from .domains.admin.models import (
 from .domains.content.models import (
     Article,
     ArticleKeyword,
+    BackfillRun,
+    CollectJob,
+    CollectLedger,
+    CollectWatermark,
+    FeedCacheEntry,
     Keyword,
     NotificationSetting,
+    ProcessingCache,
     ProcessingResult,
+    ProviderUsageLog,
+    ReportSnapshot,
+    ReportVersion,
+    TranslationMemo,
 )
 from .domains.identity.models import (
     MemberAccessLog,
@@ -36,7 +46,9 @@ __all__ = [
     "MemberProfile", "MemberAccessLog", "MemberActionLog",
     # content
     "Keyword",
-    "Article", "ArticleKeyword", "ProcessingResult", "NotificationSetting",
+    "Article", "ArticleKeyword", "ProcessingResult", "ProcessingCache", "NotificationSetting",
+    "FeedCacheEntry", "CollectJob", "CollectWatermark", "BackfillRun", "CollectLedger", "TranslationMemo",
+    "ProviderUsageLog", "ReportVersion", "ReportSnapshot",
     # stock
     "WatchItem", "SignalRuleConfig", "StockApiUsageLog",
     "PushToken", "SignalEventLog", "CorpCodeCache",
@@ -0,0 +1,184 @@
+"""OpenAI 호환 chat completions 묶음 처리 제공자 (processor_mode=openai).
+
+기사마다 한 번씩 부르면 느리고 분당 요청 한도에 걸리므로 여러 기사를 한 프롬프트에 묶는다.
+
+- 묶기: 기사별 추정 토큰을 앞에서부터 쌓아 openai_batch_max_tokens·openai_batch_max_articles 를 넘기 전에 자른다.
+- 전송: 묶음을 스레드 openai_concurrency 개로 동시에 보낸다(공용 동기 클라이언트, keep-alive 재사용).
+- 재시도: 응답에서 빠졌거나 형식이 잘못된 기사, 전송 실패(연결 오류·429·5xx) 묶음의 기사만 다시 묶어
+  openai_max_retries 번까지 보낸다. 그 밖의 4xx(키·요청 오류)는 재시도하지 않는다.
+- 사용량: 요청·토큰(응답 usage, 없으면 추정치)·비용을 ProcessUsage 에 더한다.
+
+응답 형식: 본문 content 가 {"results": [{"id", "sentiment", "confidence", "summary"}]} JSON.
+id 는 묶음 안 순번이다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
+
+import httpx
+
+from .http_clients import http_clients
+from .process import ArticleText, Processed, ProcessUsage, make_processed
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+SENTIMENTS = ("positive", "neutral", "negative")
+MAX_TEXT_CHARS = 1000  # 기사 요약은 앞부분만 보낸다
+ITEM_OVERHEAD_TOKENS = 16  # id·키 이름·구분자
+OUTPUT_TOKENS_PER_ITEM = 120  # 응답 max_tokens 산정용
+
+SYSTEM_PROMPT = (
+    "You label news articles. For each article in the user JSON, return its sentiment toward the "
+    "subject (positive, neutral or negative), a confidence between 0 and 1, and a one-sentence summary "
+    "in the article's original language. Reply with JSON only: "
+    '{"results": [{"id": <id>, "sentiment": "...", "confidence": 0.0, "summary": "..."}]}'
+)
+SYSTEM_PROMPT_TOKENS = 80
+
+
+class _NoRetry(Exception):
+    """다시 보내도 같은 결과인 오류(인증·요청 형식)."""
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 보수적으로 추정. 라틴 문자는 4글자당 1, 그 밖(한글 등)은 글자당 1."""
+    ascii_chars = sum(1 for ch in text if ch < "\x80")
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def _payload(article: ArticleText) -> dict:
+    return {
+        "title": (article.title_original or "").strip(),
+        "text": (article.snippet_original or "").strip()[:MAX_TEXT_CHARS],
+        "lang": article.language_original or "",
+    }
+
+
+def pack_batches(
+    token_counts: Sequence[int], max_tokens: int, max_items: int
+) -> list[list[int]]:
+    """입력 순서를 지키며 토큰 예산 안에서 묶은 인덱스 목록. 예산보다 큰 기사는 혼자 묶는다."""
+    budget = max(1, max_tokens - SYSTEM_PROMPT_TOKENS)
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+    for i, n in enumerate(token_counts):
+        if current and (used + n > budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += n
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _parse_item(article: ArticleText, item: dict) -> Optional[Processed]:
+    sentiment = str(item.get("sentiment") or "").lower()
+    summary = item.get("summary")
+    if sentiment not in SENTIMENTS or not isinstance(summary, str) or not summary.strip():
+        return None
+    try:
+        confidence: Optional[float] = min(1.0, max(0.0, float(item["confidence"])))
+    except (KeyError, TypeError, ValueError):
+        confidence = None
+    return make_processed(article, sentiment, confidence, summary.strip())
+
+
+def _send(articles: Sequence[ArticleText], payloads: list[dict]) -> tuple[dict[int, Processed], int, int]:
+    """묶음 하나를 보낸다. (묶음 안 순번 → 결과, prompt 토큰, completion 토큰)."""
+    url = settings.openai_base_url.rstrip("/") + "/chat/completions"
+    user_content = json.dumps({"articles": [{"id": i, **p} for i, p in enumerate(payloads)]}, ensure_ascii=False)
+    body = {
+        "model": settings.openai_model,
+        "temperature": 0,
+        "response_format": {"type": "json_object"},
+        "max_tokens": OUTPUT_TOKENS_PER_ITEM * len(payloads),
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ],
+    }
+    resp = http_clients.sync_client(url).post(
+        url, json=body, headers={"Authorization": f"Bearer {settings.openai_api_key}"}
+    )
+    if resp.status_code != 429 and 400 <= resp.status_code < 500:
+        raise _NoRetry(f"HTTP {resp.status_code}: {resp.text[:200]}")
+    resp.raise_for_status()
+    data = resp.json()
+    usage = data.get("usage") or {}
+    prompt_tokens = int(usage.get("prompt_tokens") or estimate_tokens(SYSTEM_PROMPT + user_content))
+    completion_tokens = int(usage.get("completion_tokens") or 0)
+
+    parsed: dict[int, Processed] = {}
+    try:
+        content = json.loads(data["choices"][0]["message"]["content"])
+        items = content.get("results") or []
+    except (KeyError, IndexError, TypeError, ValueError):
+        logger.warning("openai response is not the expected JSON; %d articles will be retried", len(payloads))
+        return parsed, prompt_tokens, completion_tokens
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        i = item.get("id")
+        if isinstance(i, int) and 0 <= i < len(articles) and i not in parsed:
+            result = _parse_item(articles[i], item)
+            if result is not None:
+                parsed[i] = result
+    return parsed, prompt_tokens, completion_tokens
+
+
+def process_batch(articles: Sequence[ArticleText], usage: ProcessUsage) -> list[Optional[Processed]]:
+    """기사 순서대로 결과. 재시도 후에도 실패한 기사는 None."""
+    results: list[Optional[Processed]] = [None] * len(articles)
+    payloads = [_payload(a) for a in articles]
+    tokens = [estimate_tokens(json.dumps(p, ensure_ascii=False)) + ITEM_OVERHEAD_TOKENS for p in payloads]
+    pending = list(range(len(articles)))
+    give_up: set[int] = set()
+
+    for attempt in range(max(0, settings.openai_max_retries) + 1):
+        if not pending:
+            break
+        if attempt:
+            usage.retried_items += len(pending)
+            time.sleep(settings.openai_retry_backoff_sec * 2 ** (attempt - 1))
+        batches = [
+            [pending[j] for j in batch]
+            for batch in pack_batches(
+                [tokens[i] for i in pending], settings.openai_batch_max_tokens, settings.openai_batch_max_articles
+            )
+        ]
+        workers = max(1, min(settings.openai_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="openai") as pool:
+            futures = [
+                pool.submit(_send, [articles[i] for i in batch], [payloads[i] for i in batch]) for batch in batches
+            ]
+            for batch, fut in zip(batches, futures):
+                usage.requests += 1
+                usage.items += len(batch)
+                try:
+                    parsed, prompt_tokens, completion_tokens = fut.result()
+                except _NoRetry as e:
+                    logger.error("openai request rejected for %d articles: %s", len(batch), e)
+                    give_up.update(batch)
+                    continue
+                except (httpx.HTTPError, ValueError):
+                    logger.warning("openai request failed for %d articles", len(batch), exc_info=True)
+                    continue
+                usage.prompt_tokens += prompt_tokens
+                usage.completion_tokens += completion_tokens
+                usage.cost_usd += (
+                    prompt_tokens * settings.openai_input_usd_per_mtok
+                    + completion_tokens * settings.openai_output_usd_per_mtok
+                ) / 1_000_000
+                for j, result in parsed.items():
+                    results[batch[j]] = result
+        pending = [i for i in pending if results[i] is None and i not in give_up]
+
+    usage.failed_items += sum(r is None for r in results)
+    return results
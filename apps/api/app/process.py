@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields, replace
+from typing import Awaitable, Callable, Optional, Protocol, Sequence
 
 from .models import Article
 from .settings import settings
@@ -14,41 +14,152 @@ class Processed:
     summary_original: str
     summary_ko: str
     translated_from: Optional[str]
-    translation_status: str
+    translation_status: str  # not_needed | pending(번역 전) | completed | failed
 
 
-def process_article_mock(article: Article) -> Processed:
+class ArticleText(Protocol):
+    title_original: str
+    snippet_original: Optional[str]
+    language_original: Optional[str]
+
+
+@dataclass(frozen=True)
+class ArticleInput:
+    """처리기에 넘기는 기사 텍스트. 세션과 무관하고 프로세스 풀로 보낼 수 있다(pickle)."""
+
+    id: object
+    title_original: str
+    snippet_original: Optional[str]
+    language_original: Optional[str]
+    canonical_url: Optional[str] = None
+
+    @classmethod
+    def from_article(cls, article: Article) -> "ArticleInput":
+        return cls(
+            article.id,
+            article.title_original,
+            article.snippet_original,
+            article.language_original,
+            article.canonical_url,
+        )
+
+
+@dataclass
+class ProcessUsage:
+    """한 번의 처리 실행에서 외부 제공자 사용량(요청·토큰·비용). 로컬 처리기는 0 으로 남는다."""
+
+    requests: int = 0
+    items: int = 0  # 요청에 실어 보낸 기사 수(재시도 포함)
+    retried_items: int = 0
+    failed_items: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, other: "ProcessUsage") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+def make_processed(
+    article: ArticleText, sentiment: str, confidence: Optional[float], summary_original: str
+) -> Processed:
+    """원문 요약으로 결과를 만든다. 한국어가 아니면 번역 대기(pending)로 두고,
+    한국어 번역은 process_day 가 번역 메모를 거쳐 채운다(app/translate.py)."""
+    lang = (article.language_original or "").lower()
+    if lang and lang.startswith("ko"):
+        return Processed(sentiment, confidence, summary_original, summary_original, None, "not_needed")
+    return Processed(sentiment, confidence, summary_original, "", article.language_original or "unknown", "pending")
+
+
+def process_article_mock(article: ArticleText) -> Processed:
     title = article.title_original.strip()
     summary_original = article.snippet_original.strip() if article.snippet_original else f"Summary: {title}"
-    lang = (article.language_original or "").lower()
+    return make_processed(article, "neutral", 0.5, summary_original)
 
-    if lang and lang.startswith("ko"):
-        return Processed(
-            sentiment="neutral",
-            sentiment_confidence=0.5,
-            summary_original=summary_original,
-            summary_ko=summary_original,
-            translated_from=None,
-            translation_status="not_needed",
-        )
 
-    # 원문 기준(영문 등) 처리 후 한국어 번역 표시라는 형태만 유지
+def failed_result(article: ArticleText) -> Processed:
+    """처리 실패 기사의 결과. 원문을 그대로 두고 translation_status 로 실패를 남긴다."""
+    title = (article.title_original or "").strip()
+    summary_original = article.snippet_original.strip() if article.snippet_original else title
     return Processed(
         sentiment="neutral",
-        sentiment_confidence=0.5,
+        sentiment_confidence=None,
         summary_original=summary_original,
-        summary_ko=f"(번역) {summary_original}",
-        translated_from=article.language_original or "unknown",
-        translation_status="completed",
+        summary_ko=summary_original,
+        translated_from=article.language_original,
+        translation_status="failed",
     )
 
 
-def process_article(article: Article) -> Processed:
-    mode = (settings.processor_mode or "mock").lower()
-    if mode == "mock":
-        return process_article_mock(article)
+def process_articles_lexicon(articles: Sequence[ArticleText], usage: Optional[ProcessUsage] = None) -> list[Processed]:
+    """요약·번역은 mock 과 같고, 감성은 오프라인 사전 점수(app/sentiment.py)로 묶음 단위 계산."""
+    from .sentiment import score_texts  # numpy 는 이 처리기를 쓸 때만 필요
+
+    scores = score_texts([f"{a.title_original} {a.snippet_original or ''}" for a in articles])
+    return [
+        replace(process_article_mock(a), sentiment=s.label, sentiment_confidence=s.confidence)
+        for a, s in zip(articles, scores)
+    ]
+
+
+def process_article_lexicon(article: ArticleText) -> Processed:
+    return process_articles_lexicon([article])[0]
+
+
+@dataclass(frozen=True)
+class Processor:
+    """처리기. executor 는 기본 실행 방식(app/process_engine.py):
+    thread(IO 대기형) | process(CPU 사용 로컬 모델) | async(HTTP 제공자, afunc 필요) | inline.
+    version 은 출력이 바뀌면(프롬프트·모델 변경 등) 올린다. 사용자 공용 처리 캐시 키에 들어간다.
+    batch_func 가 있으면 기사 묶음을 한 번에 넘긴다(벡터화 모델, 묶음 요청 제공자).
+    batch_func(articles, usage) 는 입력 순서대로 결과를 돌려주고, 실패한 기사는 None 으로 둔다.
+    외부 제공자는 usage 에 요청·토큰·비용을 더한다."""
+
+    name: str
+    executor: str
+    version: str = "1"
+    func: Optional[Callable[[ArticleText], Processed]] = None
+    afunc: Optional[Callable[[ArticleText], Awaitable[Processed]]] = None
+    batch_func: Optional[Callable[[Sequence[ArticleText], ProcessUsage], list[Optional[Processed]]]] = None
+
+
+def process_articles_openai(articles: Sequence[ArticleText], usage: Optional[ProcessUsage] = None) -> list[Optional[Processed]]:
+    from .openai_provider import process_batch  # httpx 클라이언트는 이 처리기를 쓸 때만 필요
+
+    return process_batch(articles, usage if usage is not None else ProcessUsage())
+
+
+def process_article_openai(article: ArticleText) -> Processed:
+    result = process_articles_openai([article])[0]
+    if result is None:
+        raise RuntimeError("openai provider returned no result")
+    return result
+
+
+PROCESSORS: dict[str, Processor] = {
+    "mock": Processor("mock", "thread", func=process_article_mock),
+    "lexicon": Processor(
+        "lexicon", "inline", func=process_article_lexicon, batch_func=process_articles_lexicon
+    ),
+    # 묶음 요청·동시 전송·재시도는 제공자(app/openai_provider.py)가 한다
+    "openai": Processor(
+        "openai", "inline", func=process_article_openai, batch_func=process_articles_openai
+    ),
+}
+
+
+def get_processor(mode: Optional[str] = None) -> Processor:
+    # 외부 키가 없어도 개발이 진행되도록 미등록 모드와 키 없는 openai 는 mock 으로 처리한다.
+    mode = (mode or settings.processor_mode or "mock").lower()
+    if mode == "openai" and not settings.openai_api_key:
+        mode = "mock"
+    return PROCESSORS.get(mode) or PROCESSORS["mock"]
+
 
-    # Step 11에서는 외부 키가 없어도 개발이 진행되도록 mock을 기본 제공한다.
-    # openai 등 실서비스 모드는 다음 단계에서 키 주입 시 확장한다.
-    return process_article_mock(article)
+def process_article(article: ArticleText) -> Processed:
+    processor = get_processor()
+    if processor.func is None:
+        raise RuntimeError(f"processor {processor.name} has no sync implementation")
+    return processor.func(article)
 
@@ -0,0 +1,193 @@
+"""기사 처리 실행기.
+
+처리기(app/process.py 의 PROCESSORS)를 기사 묶음에 병렬로 적용한다. 실행 방식은 settings.processor_executor
+(비우면 처리기 기본값)로 고른다.
+
+- thread: IO 대기형 처리기. 스레드 풀 processor_concurrency 개
+- process: CPU 를 쓰는 로컬 모델. 프로세스 풀 processor_concurrency 개 (처리기는 모듈 수준 함수여야 함)
+- async: HTTP 제공자. 처리기의 afunc 를 세마포어로 processor_concurrency 개까지 동시에
+- inline: 요청 스레드에서 하나씩 (디버깅용)
+
+처리기에 batch_func(벡터화 모델·묶음 요청 제공자)가 있으면 inline·thread 는 묶음 전체를 한 번에, process 는
+작업자 수만큼 나눠 넘긴다. 묶음 호출이 예외로 끝나면 그 묶음만 기사별로 다시 처리하고, 묶음 결과 중 None 인
+기사(제공자가 재시도까지 실패)는 실패로 남긴다. 제공자 사용량은 run(usage=...) 으로 모은다.
+
+결과는 입력 순서대로 돌려주고, 기사 하나가 실패해도 묶음을 멈추지 않고 그 기사만
+translation_status="failed" 결과로 남긴다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Sequence
+
+from .process import ArticleInput, Processed, Processor, ProcessUsage, failed_result, get_processor
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("inline", "thread", "process", "async")
+
+
+def _run_batch(
+    mode: str, articles: Sequence[ArticleInput]
+) -> tuple[Optional[list[Optional[Processed]]], ProcessUsage]:
+    """batch_func 작업 단위. 실패하면 결과가 None 이고, 호출자가 기사별로 다시 처리해 실패를 격리한다.
+    사용량은 프로세스 경계를 넘어 돌려받도록 작업마다 따로 센다."""
+    usage = ProcessUsage()
+    try:
+        return get_processor(mode).batch_func(articles, usage), usage
+    except Exception:
+        logger.exception("batch processing failed for %d articles; retrying one by one", len(articles))
+        return None, usage
+
+
+def _run_one(mode: str, article: ArticleInput) -> Optional[Processed]:
+    """풀 작업 단위. 실패는 None (예외·트레이스백을 프로세스 경계 너머로 보내지 않음)."""
+    try:
+        return get_processor(mode).func(article)
+    except Exception:
+        logger.exception("processing failed for article %s", article.id)
+        return None
+
+
+class ProcessEngine:
+    def __init__(self) -> None:
+        self._pools: dict[str, tuple[int, Executor]] = {}
+        self._lock = threading.Lock()
+
+    def _executor_kind(self, processor: Processor) -> str:
+        kind = (settings.processor_executor or processor.executor).lower()
+        if kind not in EXECUTORS:
+            raise ValueError(f"unknown processor_executor: {kind}")
+        if kind == "async" and processor.afunc is None and processor.func is None:
+            raise ValueError(f"processor {processor.name} has no implementation")
+        if kind != "async" and processor.func is None:
+            return "async"  # 비동기 구현만 있는 처리기
+        return kind
+
+    def _pool(self, kind: str) -> Executor:
+        workers = max(1, settings.processor_concurrency)
+        with self._lock:
+            current = self._pools.get(kind)
+            if current is not None and current[0] == workers:
+                return current[1]
+            pool: Executor = (
+                ProcessPoolExecutor(max_workers=workers)
+                if kind == "process"
+                else ThreadPoolExecutor(max_workers=workers, thread_name_prefix="process")
+            )
+            self._pools[kind] = (workers, pool)
+        if current is not None:
+            current[1].shutdown(wait=False)
+        return pool
+
+    def _run_pool(self, kind: str, mode: str, articles: Sequence[ArticleInput]) -> list[Optional[Processed]]:
+        pool = self._pool(kind)
+        futures = [pool.submit(_run_one, mode, a) for a in articles]
+        results: list[Optional[Processed]] = []
+        for a, fut in zip(articles, futures):
+            try:
+                results.append(fut.result())
+            except Exception:
+                # 작업자 프로세스가 죽은 경우 등
+                logger.exception("processing worker failed for article %s", a.id)
+                results.append(None)
+        return results
+
+    def _run_batches(
+        self, kind: str, processor: Processor, articles: Sequence[ArticleInput], usage: ProcessUsage
+    ) -> list[Processed]:
+        if kind == "process":
+            workers = max(1, settings.processor_concurrency)
+            size = -(-len(articles) // workers)
+            chunks = [articles[i : i + size] for i in range(0, len(articles), size)]
+            pool = self._pool(kind)
+            futures = [pool.submit(_run_batch, processor.name, chunk) for chunk in chunks]
+            batches = []
+            for fut in futures:
+                try:
+                    batches.append(fut.result())
+                except Exception:
+                    logger.exception("processing worker failed")
+                    batches.append((None, ProcessUsage()))
+        else:
+            chunks = [articles]
+            batches = [_run_batch(processor.name, articles)]
+
+        out: list[Processed] = []
+        for chunk, (batch, batch_usage) in zip(chunks, batches):
+            usage.add(batch_usage)
+            if batch is None:
+                batch = [_run_one(processor.name, a) for a in chunk]
+            out.extend(r if r is not None else failed_result(a) for a, r in zip(chunk, batch))
+        return out
+
+    async def _run_async(self, processor: Processor, articles: Sequence[ArticleInput]) -> list[Optional[Processed]]:
+        sem = asyncio.Semaphore(max(1, settings.processor_concurrency))
+
+        async def _one(a: ArticleInput) -> Optional[Processed]:
+            async with sem:
+                try:
+                    if processor.afunc is not None:
+                        return await processor.afunc(a)
+                    return await asyncio.to_thread(processor.func, a)
+                except Exception:
+                    logger.exception("processing failed for article %s", a.id)
+                    return None
+
+        return list(await asyncio.gather(*(_one(a) for a in articles)))
+
+    def run(
+        self, articles: Sequence[ArticleInput], mode: Optional[str] = None, usage: Optional[ProcessUsage] = None
+    ) -> list[Processed]:
+        """기사 순서대로 처리 결과. 실패한 기사는 failed_result. usage 를 넘기면 제공자 사용량을 더한다."""
+        if not articles:
+            return []
+        processor = get_processor(mode)
+        kind = self._executor_kind(processor)
+        if processor.batch_func is not None and kind != "async":
+            return self._run_batches(kind, processor, articles, usage if usage is not None else ProcessUsage())
+        if kind == "inline":
+            results = [_run_one(processor.name, a) for a in articles]
+        elif kind == "async":
+            results = _run_coroutine(self._run_async(processor, articles))
+        else:
+            results = self._run_pool(kind, processor.name, articles)
+
+        return [r if r is not None else failed_result(a) for a, r in zip(articles, results)]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pools = [pool for _, pool in self._pools.values()]
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_coroutine(coro):
+    """동기 코드에서 코루틴 실행. 이미 이벤트 루프가 도는 스레드면 별도 스레드에서 돌린다."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    result: list = []
+    error: list[BaseException] = []
+
+    def _target() -> None:
+        try:
+            result.append(asyncio.run(coro))
+        except BaseException as e:  # noqa: BLE001
+            error.append(e)
+
+    t = threading.Thread(target=_target, name="process-async")
+    t.start()
+    t.join()
+    if error:
+        raise error[0]
+    return result[0]
+
+
+process_engine = ProcessEngine()
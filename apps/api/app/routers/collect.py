@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Optional
+import json
+from dataclasses import asdict
+from datetime import date
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, and_, select
+from sqlmodel import Session
 
-from ..collect import kst_date_today, rss_google_news, search_gdelt
+from ..bloom import url_filters
+from ..collect import kst_date_today
 from ..db import get_session
 from ..deps import get_current_user
-from ..models import Article, ArticleKeyword, Keyword, User
+from ..domains.content.backfill import BackfillService
+from ..domains.content.models import BackfillRun
+from ..domains.content.service import CollectService, CollectSummary
+from ..feed_cache import feed_cache
+from ..fetch_cache import fetch_cache
+from ..latency import latency_tracker
+from ..models import User
+from ..sources import source_registry
 
 
 router = APIRouter(prefix="/collect", tags=["collect"])
@@ -25,6 +36,41 @@ class CollectResponse(BaseModel):
     rss_items: int
     inserted_articles: int
     linked_existing_articles: int
+    fetch_cache_hits: int = 0
+    fetch_cache_misses: int = 0
+    skipped_seen: int = 0
+    near_duplicates: int = 0
+
+
+class BackfillRequest(BaseModel):
+    start_date: date
+    end_date: date
+    keyword_ids: Optional[list[UUID]] = None  # 없으면 활성 키워드 전체
+
+
+class BackfillResponse(BaseModel):
+    id: UUID
+    status: str
+    start_date: str
+    end_date: str
+    units_total: int
+    units_done: int
+    units_skipped: int
+    units_failed: int
+    items_found: int
+    inserted_articles: int
+    linked_existing_articles: int
+    elapsed_sec: float
+    units_per_sec: float
+    last_error: Optional[str]
+
+    @classmethod
+    def from_run(cls, run: BackfillRun) -> "BackfillResponse":
+        executed = run.units_done - run.units_skipped + run.units_failed
+        return cls(
+            **run.model_dump(exclude={"user_id", "keyword_ids_json", "created_at", "started_at", "finished_at", "updated_at"}),
+            units_per_sec=round(executed / run.elapsed_sec, 3) if run.elapsed_sec > 0 else 0.0,
+        )
 
 
 def _parse_date(d: Optional[str]) -> date:
@@ -43,75 +89,82 @@ async def collect_today(
     session: Session = Depends(get_session),
 ) -> CollectResponse:
     day = _parse_date(date_kst)
-    day_str = day.isoformat()
-
-    keywords = session.exec(
-        select(Keyword).where(and_(Keyword.user_id == user.id, Keyword.is_active == True))  # noqa: E712
-    ).all()
-
-    inserted = 0
-    linked = 0
-    search_count = 0
-    rss_count = 0
-
-    for kw in keywords:
-        used_rss = False
-        items = []
-        try:
-            items = await search_gdelt(keyword=kw.text, day=day)
-            search_count += len(items)
-        except Exception:
-            items = []
-
-        if not items:
-            used_rss = True
-            try:
-                rss_items = await rss_google_news(keyword=kw.text, day=day)
-                rss_count += len(rss_items)
-                items = rss_items
-            except Exception:
-                items = []
-
-        for it in items:
-            existing = session.exec(
-                select(Article).where(and_(Article.user_id == user.id, Article.canonical_url == it.canonical_url))
-            ).first()
-            if existing:
-                article = existing
-                linked += 1
-            else:
-                article = Article(
-                    user_id=user.id,
-                    date_kst=day_str,
-                    canonical_url=it.canonical_url,
-                    original_url=it.url,
-                    source_type=it.source_type,
-                    source_name=it.source_name,
-                    published_at=it.published_at,
-                    fetched_at=datetime.now().astimezone(),
-                    title_original=it.title,
-                    snippet_original=it.snippet,
-                    language_original=it.language,
-                )
-                session.add(article)
-                session.commit()
-                session.refresh(article)
-                inserted += 1
-
-            # Link article ↔ keyword (deduped by unique constraint)
-            try:
-                link_row = ArticleKeyword(article_id=article.id, keyword_id=kw.id)
-                session.add(link_row)
-                session.commit()
-            except IntegrityError:
-                session.rollback()
-
-    return CollectResponse(
-        date_kst=day_str,
-        keywords_processed=len(keywords),
-        search_items=search_count,
-        rss_items=rss_count,
-        inserted_articles=inserted,
-        linked_existing_articles=linked,
-    )
+    summary = await CollectService.collect_day(session, user.id, day)
+    return CollectResponse(**asdict(summary))
+
+
+@router.post("/stream")
+async def collect_today_stream(
+    date_kst: str | None = Query(default=None),
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """POST /collect 의 NDJSON 스트리밍 버전.
+
+    키워드가 끝나는 대로 {"type": "keyword", ...} 한 줄씩, 마지막에 {"type": "summary", ...}
+    (CollectResponse 필드)를 보낸다. 키워드별로 저장·커밋하므로 중간에 끊겨도 끝난 키워드는 반영된다.
+    """
+    day = _parse_date(date_kst)
+
+    async def lines() -> AsyncIterator[str]:
+        async for record in CollectService.collect_day_stream(session, user.id, day):
+            kind = "summary" if isinstance(record, CollectSummary) else "keyword"
+            yield json.dumps({"type": kind, **jsonable_encoder(asdict(record))}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def _run_backfill(bind, run_id: UUID) -> None:
+    # 요청 세션은 응답과 함께 닫히므로 같은 엔진으로 새 세션을 연다
+    with Session(bind) as session:
+        await BackfillService.execute(session, run_id)
+
+
+@router.post("/backfill", response_model=BackfillResponse, status_code=202)
+def create_backfill(
+    body: BackfillRequest,
+    background: BackgroundTasks,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> BackfillResponse:
+    """날짜 범위 × 키워드 과거 수집을 백그라운드로 시작. 진행 상황은 GET /collect/backfill/{id}."""
+    run = BackfillService.create(session, user.id, body.start_date, body.end_date, body.keyword_ids)
+    background.add_task(_run_backfill, session.get_bind(), run.id)
+    return BackfillResponse.from_run(run)
+
+
+@router.get("/backfill/{run_id}", response_model=BackfillResponse)
+def get_backfill(
+    run_id: UUID,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> BackfillResponse:
+    return BackfillResponse.from_run(BackfillService.get(session, user.id, run_id))
+
+
+@router.post("/backfill/{run_id}/resume", response_model=BackfillResponse, status_code=202)
+def resume_backfill(
+    run_id: UUID,
+    background: BackgroundTasks,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> BackfillResponse:
+    """중단·실패한 작업을 이어서 실행. 완료 장부에 있는 (키워드, 날짜)는 다시 수집하지 않는다.
+    이미 끝났거나 실행 중이면 409."""
+    run = BackfillService.get(session, user.id, run_id)
+    BackfillService.claim(session, run)
+    background.add_task(_run_backfill, session.get_bind(), run.id)
+    return BackfillResponse.from_run(run)
+
+
+@router.get("/metrics")
+def collect_metrics(user: User = Depends(get_current_user)) -> dict:
+    """공유 수집 캐시·RSS 조건부 GET 캐시·업스트림 지연·소스 상태·URL 블룸 필터 (프로세스 단위)."""
+    return {
+        "fetch_cache": fetch_cache.stats(),
+        "feed_cache": feed_cache.stats(),
+        "upstream_latency": latency_tracker.stats(),
+        "sources": source_registry.stats(),
+        "url_filter": url_filters.stats(),
+    }
 
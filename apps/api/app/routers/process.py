@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlmodel import Session, and_, select
+from sqlmodel import Session
 
 from ..collect import kst_date_today
 from ..db import get_session
 from ..deps import get_current_user
-from ..models import Article, ProcessingResult, User
-from ..process import process_article
+from ..domains.content.service import ProcessService
+from ..models import User
 
 
 router = APIRouter(prefix="/process", tags=["process"])
@@ -21,6 +22,23 @@ class ProcessResponse(BaseModel):
     articles_total: int
     processed_new: int
     skipped_existing: int
+    skipped_near_duplicates: int = 0
+    failed: int = 0
+    cache_hits: int = 0
+    translation_memo_hits: int = 0
+    translated_new: int = 0
+    provider_requests: int = 0
+    provider_cost_usd: float = 0.0
+    queued: int = 0
+
+
+class ProcessQueueResponse(BaseModel):
+    date_kst: str
+    articles_total: int
+    pending: int
+    pending_pinned: int = 0
+    processed: int = 0
+    skipped_near_duplicates: int = 0
 
 
 def _parse_date(d: str | None) -> date:
@@ -39,41 +57,17 @@ def process_day(
     session: Session = Depends(get_session),
 ) -> ProcessResponse:
     day = _parse_date(date_kst)
-    day_str = day.isoformat()
-
-    articles = session.exec(
-        select(Article).where(and_(Article.user_id == user.id, Article.date_kst == day_str))
-    ).all()
-
-    processed_new = 0
-    skipped = 0
-    for a in articles:
-        existing = session.exec(
-            select(ProcessingResult).where(and_(ProcessingResult.user_id == user.id, ProcessingResult.article_id == a.id))
-        ).first()
-        if existing:
-            skipped += 1
-            continue
+    summary = ProcessService.process_day(session, user.id, day.isoformat())
+    return ProcessResponse(**asdict(summary))
 
-        p = process_article(a)
-        row = ProcessingResult(
-            user_id=user.id,
-            article_id=a.id,
-            sentiment=p.sentiment,
-            sentiment_confidence=p.sentiment_confidence,
-            summary_original=p.summary_original,
-            summary_ko=p.summary_ko,
-            translated_from=p.translated_from,
-            translation_status=p.translation_status,
-        )
-        session.add(row)
-        session.commit()
-        processed_new += 1
-
-    return ProcessResponse(
-        date_kst=day_str,
-        articles_total=len(articles),
-        processed_new=processed_new,
-        skipped_existing=skipped,
-    )
 
+@router.get("/queue", response_model=ProcessQueueResponse)
+def process_queue(
+    date_kst: str | None = Query(default=None),
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> ProcessQueueResponse:
+    """처리 대기열 길이. 처리 중에도 묶음이 커밋될 때마다 줄어든다."""
+    day = _parse_date(date_kst)
+    depth = ProcessService.queue_depth(session, user.id, day.isoformat())
+    return ProcessQueueResponse(**asdict(depth))
@@ -4,14 +4,16 @@ from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlmodel import Session, and_, select
 
 from ..collect import kst_date_today
 from ..db import get_session
 from ..deps import get_current_user
+from ..domains.content.report_snapshot import ReportSnapshotService, etag, filter_key
 from ..models import Article, ArticleKeyword, Keyword, ProcessingResult, User
+from ..settings import settings
 
 
 router = APIRouter(prefix="/report", tags=["report"])
@@ -35,6 +37,7 @@ class ReportItem(BaseModel):
     summary_ko: Optional[str]
     translation_status: Optional[str]
     original_url: str
+    similar_count: int = 0
 
 
 class ReportResponse(BaseModel):
@@ -42,6 +45,7 @@ class ReportResponse(BaseModel):
     keywords: list[KeywordCount]
     total_articles: int
     items: list[ReportItem]
+    version: int = 0  # 리포트 데이터 버전. 수집·처리·키워드 변경 때 오른다 (ETag 에도 들어감)
 
 
 def _parse_date(d: str | None) -> date:
@@ -53,16 +57,47 @@ def _parse_date(d: str | None) -> date:
         raise HTTPException(status_code=400, detail="invalid date (expected YYYY-MM-DD)")
 
 
+def _etag_matches(if_none_match: str | None, tag: str) -> bool:
+    """If-None-Match(콤마 구분 목록 또는 *)에 tag 가 있는지. 약한 비교라 W/ 접두사는 무시한다."""
+    if not if_none_match:
+        return False
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return "*" in candidates or tag.removeprefix("W/") in {t.removeprefix("W/") for t in candidates}
+
+
 @router.get("", response_model=ReportResponse)
 def get_report(
+    request: Request,
     date_kst: str | None = Query(default=None),
     keyword_id: UUID | None = Query(default=None),
+    collapse: bool = Query(default=True, description="유사 기사 묶음을 한 항목으로 표시"),
     user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
+):
+    day_str = _parse_date(date_kst).isoformat()
+    if not settings.report_snapshot_enabled:
+        return build_report(session, user, day_str, keyword_id, collapse)
+
+    # 저장된 스냅샷이 현재 버전이면 그대로, 클라이언트가 같은 버전을 갖고 있으면 304
+    key = filter_key(keyword_id, collapse)
+    version = ReportSnapshotService.current_version(session, user.id, day_str)
+    tag = etag(user.id, day_str, key, version)
+    if _etag_matches(request.headers.get("if-none-match"), tag):
+        return Response(status_code=304, headers={"ETag": tag})
+    body = ReportSnapshotService.get(session, user.id, day_str, key, version)
+    if body is None:
+        report = build_report(session, user, day_str, keyword_id, collapse)
+        report.version = version
+        body = report.model_dump_json()
+        ReportSnapshotService.put(session, user.id, day_str, key, version, body)
+        session.commit()
+    return Response(content=body, media_type="application/json", headers={"ETag": tag})
+
+
+def build_report(
+    session: Session, user: User, day_str: str, keyword_id: UUID | None, collapse: bool
 ) -> ReportResponse:
-    day = _parse_date(date_kst)
-    day_str = day.isoformat()
-
+    """DB 에서 리포트를 새로 만든다. GET /report 는 스냅샷이 없거나 옛 버전일 때만 부른다."""
     # keyword chip counts (for this date)
     kw_rows = session.exec(select(Keyword).where(Keyword.user_id == user.id)).all()
     counts: dict[UUID, int] = {k.id: 0 for k in kw_rows}
@@ -96,12 +131,26 @@ def get_report(
     if not articles:
         return ReportResponse(date_kst=day_str, keywords=kw_counts, total_articles=0, items=[])
 
+    # 유사 기사 묶음(cluster_id)은 정렬상 첫 기사만 남기고 나머지는 similar_count 로 센다
+    similar: dict[UUID, int] = {}
+    if collapse:
+        shown: dict[UUID, Article] = {}
+        for a in articles:
+            cid = a.cluster_id or a.id
+            if cid in shown:
+                similar[shown[cid].id] = similar.get(shown[cid].id, 0) + 1
+            else:
+                shown[cid] = a
+        articles = list(shown.values())
+
     article_ids = [a.id for a in articles]
+    # 처리 결과는 묶음 대표 기사에만 있으므로 대표 id 도 함께 조회
+    lookup_ids = set(article_ids) | {a.cluster_id for a in articles if a.cluster_id}
 
     # Batch: ProcessingResult for all articles at once (replaces N+1)
     pr_rows = session.exec(
         select(ProcessingResult).where(
-            and_(ProcessingResult.user_id == user.id, ProcessingResult.article_id.in_(article_ids))
+            and_(ProcessingResult.user_id == user.id, ProcessingResult.article_id.in_(lookup_ids))
         )
     ).all()
     pr_by_article: dict[UUID, ProcessingResult] = {pr.article_id: pr for pr in pr_rows}
@@ -130,7 +179,7 @@ def get_report(
 
     items: list[ReportItem] = []
     for a in articles:
-        pr = pr_by_article.get(a.id)
+        pr = pr_by_article.get(a.id) or (pr_by_article.get(a.cluster_id) if a.cluster_id else None)
         kw = primary_kw_map.get(a.id)
         items.append(
             ReportItem(
@@ -144,6 +193,7 @@ def get_report(
                 summary_ko=pr.summary_ko if pr else None,
                 translation_status=pr.translation_status if pr else None,
                 original_url=a.original_url,
+                similar_count=similar.get(a.id, 0),
             )
         )
 
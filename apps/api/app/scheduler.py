@@ -0,0 +1,292 @@
+r"""
+백그라운드 수집 스케줄러.
+
+사용자별 NotificationSetting.daily_report_time_hhmm(KST, 설정이 없으면 09:00) 보다
+scheduler_lead_minutes 앞서 collect+process 를 미리 실행해 둔다. 리포트 조회(GET /report)는
+저장된 결과만 읽으므로 클라이언트가 POST /collect 를 기다릴 필요가 없다.
+
+- 작업은 CollectJob 테이블에 (user_id, date_kst) 단위로 영속화된다.
+- 워커는 조건부 UPDATE 로 리스를 잡아 같은 사용자를 중복 실행하지 않는다.
+  리스가 만료된 running 작업은 다른 워커가 다시 가져간다.
+- 작업이 scheduler_slow_job_sec 보다 느리면 동시 실행 수를 절반으로 줄이고(백프레셔),
+  빠르게 끝나면 하나씩 늘린다.
+- 스케줄러는 API 와 따로 동시 실행 수에 맞춘 커넥션 풀을 쓰고, 외부 수집을 기다리는 동안에는 커넥션을
+  잡지 않는다. 처리(process)는 스레드에서 돌려 이벤트 루프를 막지 않는다.
+- 실행 중인 작업의 리스는 수집·처리 내내 scheduler_lease_sec 의 1/3 마다 연장한다.
+
+사용법:
+  cd apps/api
+  python -m app.scheduler          # 상시 워커
+  python -m app.scheduler --once   # 한 번만 계획·실행 (cron 용)
+또는 SCHEDULER_ENABLED=true 로 API 프로세스 안에서 실행.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import update
+from sqlmodel import Session, and_, col, or_, select
+
+from .collect import KST
+from .db import chunked, insert_ignore
+from .domains.content.service import CollectService, ProcessService
+from .models import CollectJob, Keyword, NotificationSetting
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPORT_TIME = "09:00"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(dt: datetime) -> datetime:
+    # SQLite 는 tz 정보를 버리고 저장하므로 naive 값은 UTC 로 간주
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def report_run_at(day: date, hhmm: str) -> datetime:
+    """리포트 시각(KST) - 선행 시간 → UTC 실행 시각."""
+    hh, mm = (int(x) for x in hhmm.split(":"))
+    report_at = datetime(day.year, day.month, day.day, hh, mm, tzinfo=KST)
+    return (report_at - timedelta(minutes=settings.scheduler_lead_minutes)).astimezone(timezone.utc)
+
+
+class CollectScheduler:
+    def __init__(self, engine=None, *, worker_id: str | None = None) -> None:
+        self.max_concurrency = max(1, settings.scheduler_max_concurrent_jobs)
+        self.concurrency = self.max_concurrency
+        if engine is None:
+            # 작업마다 수집 저장(이벤트 루프)·처리(스레드)·리스 연장이 커넥션을 하나씩 쓸 수 있다
+            from .db import create_db_engine
+
+            engine = create_db_engine(pool_size=2 * self.max_concurrency + 1)
+        self.engine = engine
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+    # ----- 계획 -----
+
+    def plan(self, now: datetime | None = None) -> int:
+        """오늘(KST) 작업을 만든다. 활성 키워드가 있고 알림이 꺼지지 않은 사용자 대상. 새 작업 수 반환."""
+        now = now or _utcnow()
+        day_str = now.astimezone(KST).date().isoformat()
+        day = date.fromisoformat(day_str)
+        with Session(self.engine) as session:
+            user_ids = list(
+                session.exec(select(Keyword.user_id).where(Keyword.is_active == True).distinct()).all()  # noqa: E712
+            )
+            if not user_ids:
+                return 0
+            ns_by_user: dict[UUID, NotificationSetting] = {}
+            for part in chunked(user_ids):
+                for ns in session.exec(
+                    select(NotificationSetting).where(col(NotificationSetting.user_id).in_(part))
+                ).all():
+                    ns_by_user[ns.user_id] = ns
+
+            desired: dict[UUID, datetime] = {}
+            for uid in user_ids:
+                ns = ns_by_user.get(uid)
+                if ns is not None and not ns.is_enabled:
+                    continue
+                desired[uid] = report_run_at(day, ns.daily_report_time_hhmm if ns else DEFAULT_REPORT_TIME)
+
+            existing = {j.user_id: j for j in session.exec(select(CollectJob).where(CollectJob.date_kst == day_str)).all()}
+            new_rows = [
+                {
+                    "id": uuid4(),
+                    "user_id": uid,
+                    "date_kst": day_str,
+                    "run_at": run_at,
+                    "status": "pending",
+                    "attempts": 0,
+                    "updated_at": now,
+                }
+                for uid, run_at in desired.items()
+                if uid not in existing
+            ]
+            insert_ignore(session, CollectJob, new_rows, ["user_id", "date_kst"])
+            # 아직 실행 전인 작업은 바뀐 리포트 시각을 따라간다
+            for uid, job in existing.items():
+                run_at = desired.get(uid)
+                if job.status == "pending" and run_at is not None and _as_utc(job.run_at) != run_at:
+                    job.run_at = run_at
+                    job.updated_at = now
+                    session.add(job)
+            session.commit()
+            return len(new_rows)
+
+    # ----- 리스 -----
+
+    def _claimable(self, now: datetime):
+        return and_(
+            CollectJob.run_at <= now,
+            CollectJob.attempts < settings.scheduler_max_attempts,
+            or_(
+                col(CollectJob.status).in_(["pending", "failed"]),
+                and_(CollectJob.status == "running", CollectJob.lease_expires_at < now),
+            ),
+        )
+
+    def claim(self, limit: int, now: datetime | None = None) -> list[UUID]:
+        """실행 시각이 된 작업을 최대 limit 개 리스. 다른 워커와 경합 시 조건부 UPDATE 로 한쪽만 성공."""
+        if limit <= 0:
+            return []
+        now = now or _utcnow()
+        lease_until = now + timedelta(seconds=settings.scheduler_lease_sec)
+        claimed: list[UUID] = []
+        with Session(self.engine) as session:
+            candidates = session.exec(
+                select(CollectJob.id).where(self._claimable(now)).order_by(CollectJob.run_at).limit(limit * 2)
+            ).all()
+            for job_id in candidates:
+                if len(claimed) >= limit:
+                    break
+                res = session.exec(
+                    update(CollectJob)
+                    .where(and_(CollectJob.id == job_id, self._claimable(now)))
+                    .values(
+                        status="running",
+                        lease_owner=self.worker_id,
+                        lease_expires_at=lease_until,
+                        attempts=CollectJob.attempts + 1,
+                        started_at=now,
+                        updated_at=now,
+                    )
+                )
+                session.commit()
+                if res.rowcount == 1:
+                    claimed.append(job_id)
+        return claimed
+
+    def _renew(self, job_id: UUID) -> bool:
+        """리스 연장. 다른 워커가 가져간 뒤면 False."""
+        now = _utcnow()
+        with Session(self.engine) as session:
+            res = session.exec(
+                update(CollectJob)
+                .where(and_(CollectJob.id == job_id, CollectJob.lease_owner == self.worker_id))
+                .values(lease_expires_at=now + timedelta(seconds=settings.scheduler_lease_sec), updated_at=now)
+            )
+            session.commit()
+            return res.rowcount == 1
+
+    def _finish(self, job_id: UUID, error: str | None = None) -> None:
+        now = _utcnow()
+        values: dict = {"lease_owner": None, "lease_expires_at": None, "finished_at": now, "updated_at": now}
+        if error is None:
+            values.update(status="done", last_error=None)
+        else:
+            with Session(self.engine) as session:
+                job = session.get(CollectJob, job_id)
+                attempts = job.attempts if job else 1
+            # 재시도 간격: 1, 4, 9 ... 분
+            values.update(status="failed", last_error=error[:500], run_at=now + timedelta(minutes=attempts**2))
+        with Session(self.engine) as session:
+            session.exec(
+                update(CollectJob)
+                .where(and_(CollectJob.id == job_id, CollectJob.lease_owner == self.worker_id))
+                .values(**values)
+            )
+            session.commit()
+
+    # ----- 실행 -----
+
+    def _process(self, user_id: UUID, date_kst: str) -> None:
+        with Session(self.engine) as session:
+            ProcessService.process_day(session, user_id, date_kst)
+
+    async def _keep_lease(self, job_id: UUID) -> None:
+        interval = settings.scheduler_lease_sec / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await asyncio.to_thread(self._renew, job_id):
+                    logger.warning("collect job %s lease was taken over by another worker", job_id)
+                    return
+            except Exception:
+                logger.exception("lease renewal failed for collect job %s", job_id)
+
+    async def run_job(self, job_id: UUID) -> float:
+        """collect → process 실행 후 소요 시간(초) 반환. 실패는 작업에 기록하고 삼킨다."""
+        started = time.monotonic()
+        error: str | None = None
+        keeper = asyncio.create_task(self._keep_lease(job_id))
+        try:
+            with Session(self.engine) as session:
+                job = session.get(CollectJob, job_id)
+                if job is None:
+                    return 0.0
+                user_id, date_kst = job.user_id, job.date_kst
+                # collect_day 는 외부 수집 전에 커넥션을 돌려주고, 저장은 수집이 끝난 뒤 한 번에 한다
+                await CollectService.collect_day(session, user_id, date.fromisoformat(date_kst))
+            await asyncio.to_thread(self._process, user_id, date_kst)
+        except Exception as e:
+            logger.exception("collect job %s failed", job_id)
+            error = repr(e)
+        finally:
+            keeper.cancel()
+        await asyncio.to_thread(self._finish, job_id, error)
+        return time.monotonic() - started
+
+    def _adjust_concurrency(self, durations: list[float]) -> None:
+        if not durations:
+            return
+        if max(durations) > settings.scheduler_slow_job_sec:
+            self.concurrency = max(1, self.concurrency // 2)
+        elif self.concurrency < self.max_concurrency:
+            self.concurrency += 1
+
+    async def tick(self) -> int:
+        """계획 → 리스 → 실행 1회. 실행한 작업 수 반환."""
+        await asyncio.to_thread(self.plan)
+        job_ids = await asyncio.to_thread(self.claim, self.concurrency)
+        if not job_ids:
+            return 0
+        durations = await asyncio.gather(*(self.run_job(j) for j in job_ids))
+        self._adjust_concurrency(list(durations))
+        return len(job_ids)
+
+    async def run_forever(self) -> None:
+        logger.info("collect scheduler started (worker=%s)", self.worker_id)
+        while True:
+            try:
+                ran = await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("collect scheduler tick failed")
+                ran = 0
+            # 처리할 작업이 남아 있으면 바로 다음 배치, 아니면 폴링 간격만큼 대기
+            if ran < self.concurrency:
+                await asyncio.sleep(settings.scheduler_poll_sec)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="touch 백그라운드 수집 스케줄러")
+    ap.add_argument("--once", action="store_true", help="한 번만 계획·실행하고 종료")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from .db import init_db
+
+    init_db()
+    scheduler = CollectScheduler()
+    if args.once:
+        ran = asyncio.run(scheduler.tick())
+        logger.info("ran %d job(s)", ran)
+        return
+    asyncio.run(scheduler.run_forever())
+
+
+if __name__ == "__main__":
+    main()
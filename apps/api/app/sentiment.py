@@ -0,0 +1,130 @@
+"""오프라인 사전(lexicon) 기반 감성 분석. 한국어·영어 제목/요약용 (processor_mode=lexicon).
+
+- 토큰화: 한글 연속·영문 단어 단위. 묶음 안의 고유 토큰만 한 번씩 사전과 맞춘다(토큰 → 가중치 캐시).
+  한국어는 조사·어미가 붙으므로 토큰 앞부분이 사전 어간과 같으면 그 가중치를 쓴다("급등했다" → "급등").
+- 점수: 기사 × 고유 토큰 희소 행렬(COO: 행·열 인덱스)과 가중치 벡터의 곱을 np.bincount 로 한 번에 계산.
+- 부정어(not, 안, 못 …) 바로 뒤 토큰, 부정 보조용언(않다, 못하다 …) 바로 앞 토큰은 부호를 뒤집는다.
+"""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+# 어간(한국어)·단어(영어) → 가중치. 양수 긍정, 음수 부정.
+LEXICON_KO: dict[str, float] = {
+    "급등": 2.0, "상승": 1.0, "강세": 1.0, "반등": 1.0, "호실적": 2.0, "최대": 0.5, "사상최대": 2.0, "흑자": 1.5,
+    "흑자전환": 2.0, "증가": 0.8, "성장": 1.0, "호조": 1.5, "개선": 1.0, "회복": 1.0, "수주": 1.2, "신기록": 1.5,
+    "돌파": 1.0, "확대": 0.6, "기대": 0.6, "호재": 1.5, "순항": 1.0, "승인": 0.8, "출시": 0.4, "인상": 0.3,
+    "배당": 0.6, "선정": 0.6, "수상": 1.0, "협력": 0.5, "투자유치": 1.2, "유치": 0.6, "안정": 0.5, "최고": 0.8,
+    "급락": -2.0, "하락": -1.0, "약세": -1.0, "폭락": -2.5, "적자": -1.5, "적자전환": -2.0, "감소": -0.8,
+    "부진": -1.5, "악화": -1.5, "둔화": -1.0, "우려": -1.0, "위기": -1.5, "리콜": -1.5, "소송": -1.2, "제재": -1.2,
+    "규제": -0.6, "조사": -0.5, "압수수색": -2.0, "횡령": -2.0, "사기": -2.0, "파산": -2.5, "부도": -2.5,
+    "해킹": -1.5, "유출": -1.2, "사고": -1.5, "화재": -1.5, "사망": -2.0, "중단": -1.0, "지연": -0.8, "철회": -1.0,
+    "손실": -1.5, "감원": -1.2, "구조조정": -1.0, "파업": -1.2, "경고": -0.8, "불안": -1.0, "충격": -1.2,
+    "최저": -1.0, "악재": -1.5, "부실": -1.5, "논란": -1.0, "벌금": -1.2, "과징금": -1.2, "침체": -1.5,
+}
+LEXICON_EN: dict[str, float] = {
+    "surge": 2.0, "surges": 2.0, "soar": 2.0, "soars": 2.0, "jump": 1.2, "jumps": 1.2, "rise": 0.8, "rises": 0.8,
+    "gain": 1.0, "gains": 1.0, "rally": 1.5, "rallies": 1.5, "record": 0.8, "profit": 1.0, "profits": 1.0,
+    "growth": 1.0, "grow": 0.8, "grows": 0.8, "beat": 1.2, "beats": 1.2, "strong": 1.0, "stronger": 1.0,
+    "boost": 1.0, "boosts": 1.0, "win": 1.0, "wins": 1.0, "approve": 0.8, "approves": 0.8, "approved": 0.8,
+    "upgrade": 1.2, "upgraded": 1.2, "recover": 1.0, "recovers": 1.0, "recovery": 1.0, "expand": 0.6,
+    "expands": 0.6, "success": 1.2, "successful": 1.2, "optimism": 1.2, "optimistic": 1.2, "breakthrough": 1.5,
+    "improve": 1.0, "improves": 1.0, "improved": 1.0, "best": 0.8, "launch": 0.3, "launches": 0.3,
+    "plunge": -2.0, "plunges": -2.0, "tumble": -1.8, "tumbles": -1.8, "slump": -1.5, "slumps": -1.5,
+    "fall": -0.8, "falls": -0.8, "drop": -1.0, "drops": -1.0, "decline": -1.0, "declines": -1.0, "loss": -1.2,
+    "losses": -1.2, "weak": -1.0, "weaker": -1.0, "miss": -1.2, "misses": -1.2, "cut": -0.6, "cuts": -0.6,
+    "layoff": -1.5, "layoffs": -1.5, "lawsuit": -1.2, "sued": -1.2, "fine": -0.8, "fined": -1.2, "probe": -1.0,
+    "recall": -1.5, "recalls": -1.5, "fraud": -2.0, "bankrupt": -2.5, "bankruptcy": -2.5, "crash": -2.0,
+    "crisis": -1.5, "fear": -1.0, "fears": -1.0, "concern": -0.8, "concerns": -0.8, "warn": -1.0, "warns": -1.0,
+    "warning": -1.0, "downgrade": -1.2, "downgraded": -1.2, "hack": -1.5, "breach": -1.5, "delay": -0.8,
+    "delays": -0.8, "strike": -1.0, "halt": -1.0, "halts": -1.0, "worst": -1.5, "slowdown": -1.0, "recession": -1.5,
+}
+NEGATORS = frozenset({"not", "no", "never", "without", "안", "못"})
+POST_NEGATOR_PREFIXES = ("않", "못하", "못했", "못한")  # "오르지 않았다", "개선되지 못했다"
+
+POSITIVE_THRESHOLD = 0.5
+NEGATIVE_THRESHOLD = -0.5
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z]+")
+_KO_STEM_MAX = max(len(k) for k in LEXICON_KO)
+
+
+@dataclass(frozen=True)
+class SentimentScore:
+    label: str  # positive | neutral | negative
+    score: float
+    confidence: float
+
+
+@lru_cache(maxsize=65536)
+def token_weight(token: str) -> float:
+    """토큰 가중치. 한국어는 가장 긴 일치 어간, 영어는 단어 그대로."""
+    if token in LEXICON_EN:
+        return LEXICON_EN[token]
+    if "가" <= token[0] <= "힣":
+        for n in range(min(len(token), _KO_STEM_MAX), 1, -1):
+            w = LEXICON_KO.get(token[:n])
+            if w is not None:
+                return w
+    return 0.0
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _label(score: float) -> SentimentScore:
+    if score >= POSITIVE_THRESHOLD:
+        label = "positive"
+    elif score <= NEGATIVE_THRESHOLD:
+        label = "negative"
+    else:
+        return SentimentScore("neutral", score, round(1.0 - 0.5 * math.tanh(abs(score)), 3))
+    return SentimentScore(label, score, round(0.5 + 0.5 * math.tanh(abs(score)), 3))
+
+
+def score_texts(texts: Sequence[str]) -> list[SentimentScore]:
+    """텍스트 묶음 감성 점수. 입력 순서대로."""
+    if not texts:
+        return []
+    vocab: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    signs: list[float] = []
+    for i, text in enumerate(texts):
+        negate = False
+        start = len(rows)
+        for tok in tokenize(text):
+            if tok in NEGATORS:
+                negate = True
+                continue
+            if tok.startswith(POST_NEGATOR_PREFIXES):
+                if len(rows) > start:
+                    signs[-1] = -signs[-1]
+                continue
+            j = vocab.get(tok)
+            if j is None:
+                j = vocab[tok] = len(vocab)
+            rows.append(i)
+            cols.append(j)
+            signs.append(-1.0 if negate else 1.0)
+            negate = False
+
+    weights = np.fromiter((token_weight(t) for t in vocab), dtype=np.float64, count=len(vocab))
+    row_idx = np.asarray(rows, dtype=np.int64)
+    contrib = weights[np.asarray(cols, dtype=np.int64)] * np.asarray(signs, dtype=np.float64)
+    scores = np.bincount(row_idx, weights=contrib, minlength=len(texts))
+    # 문장이 길수록 단어 하나의 영향이 작아지도록 감성 단어 수의 제곱근으로 나눔
+    hits = np.bincount(row_idx, weights=(contrib != 0).astype(np.float64), minlength=len(texts))
+    scores = scores / np.sqrt(np.maximum(hits, 1.0))
+    return [_label(float(s)) for s in scores]
+
+
+def score_text(text: str) -> SentimentScore:
+    return score_texts([text])[0]
@@ -24,10 +24,102 @@ class Settings(BaseSettings):
     # CORS 허용 origins (콤마 구분). 비어있으면 개발 모드로 전체 허용.
     allowed_origins: str = ""
 
-    collector_mode: str = "live"  # live | mock
+    collector_mode: str = "live"  # live | mock (app/sources.py 에 등록된 소스 묶음)
+    # POST /collect 동시 수집 한도: 동시에 진행할 키워드 수, 소스별 동시 요청 수
+    collect_max_concurrency: int = 8
+    collect_gdelt_concurrency: int = 4
+    collect_rss_concurrency: int = 4
+    # GDELT 묶음 조회: 짧은 키워드 여러 개를 OR 식 한 요청으로 받고 제목·요약 매칭으로 나눈다.
+    # 본문에만 키워드가 있는 기사는 배정되지 않으므로 기본은 끔.
+    gdelt_batch_enabled: bool = False
+    gdelt_batch_max_keywords: int = 10
+    gdelt_batch_max_keyword_chars: int = 30
+    # 소스별 초당 요청 수(0 이면 무제한)와 순간 허용량(토큰 버킷 크기). 캐시 적중은 세지 않음.
+    collect_gdelt_rate_per_sec: float = 5.0
+    collect_rss_rate_per_sec: float = 10.0
+    collect_rate_burst: int = 20
+    # 소스 서킷 브레이커: 연속 실패 횟수 초과 시 쿨다운 동안 호출 중단 후 요청 하나로 시험
+    source_breaker_failures: int = 5
+    source_breaker_cooldown_sec: float = 30.0
+    # 사용자 간 공유 수집 결과 캐시 (키워드·날짜·소스 단위). ttl 0이면 비활성.
+    fetch_cache_ttl_sec: int = 600
+    fetch_cache_max_entries: int = 4096
+    # 증분 수집 기준점: GDELT 조회 시작을 마지막 기사 시각 - overlap 으로 좁히고, 본 URL은 건너뜀
+    watermark_enabled: bool = True
+    watermark_overlap_minutes: int = 30
+    watermark_max_seen_urls: int = 2000
+    # 사용자별 canonical_url 블룸 필터: "확실히 새 URL"은 저장 전 존재 확인 조회 생략
+    url_bloom_enabled: bool = True
+    url_bloom_fp_rate: float = 0.01
+    url_bloom_min_capacity: int = 1024  # 사용자당 최소 원소 수 (1% 기준 약 1.2KB)
+    url_bloom_max_users: int = 10000
+    # 유사 기사 묶기: 제목 SimHash 해밍 거리 한도 (최대 3, 음수면 비활성)
+    near_dup_max_distance: int = 3
+    # RSS 조건부 GET 캐시 (ETag/Last-Modified). db 이면 FeedCacheEntry 테이블을 워커 간 공유.
+    feed_cache_max_entries: int = 1024
+    feed_cache_backend: str = "memory"  # memory | db
+    # Google News RSS 로케일 (hl:gl, 콤마 구분). 피드는 동시에 받으므로 로케일 수에 지연이 비례하지 않음.
+    rss_locales: str = "ko:KR,en:US"
 
-    processor_mode: str = "mock"  # mock | openai
+    # GDELT 지연 인지 요청 (app/latency.py): 최근 응답 시간 p95 × 배수를 타임아웃으로,
+    # p95 까지 응답이 없으면 같은 요청을 한 번 더(hedge), 429/5xx 는 지수 백오프 + jitter 로 재시도.
+    # 재시도·대기를 합친 요청 하나의 전체 시간 한도는 latency_total_budget_sec
+    latency_window: int = 200
+    latency_min_samples: int = 20
+    latency_timeout_multiplier: float = 3.0
+    latency_min_timeout_sec: float = 2.0
+    latency_hedge_enabled: bool = True
+    latency_max_attempts: int = 3
+    latency_backoff_base_sec: float = 0.5
+    latency_backoff_max_sec: float = 8.0
+    latency_total_budget_sec: float = 45.0
+
+    # 외부 연동 공용 HTTP 클라이언트 (app/http_clients.py). HTTP/2는 h2 패키지 설치 시에만 적용.
+    http2_enabled: bool = False
+
+    # 과거 수집(backfill): 한 번에 요청할 수 있는 최대 일수, 동시에 진행할 날짜 수,
+    # 실행 중(running) 작업이 이 시간 동안 진행 기록이 없으면 죽은 것으로 보고 resume 허용
+    backfill_max_days: int = 31
+    backfill_day_concurrency: int = 2
+    backfill_stale_sec: float = 900.0
+
+    # 백그라운드 수집 스케줄러 (app/scheduler.py). 리포트 시각 전에 collect+process 를 미리 실행.
+    # 별도 워커: python -m app.scheduler / 앱 프로세스 내 실행: SCHEDULER_ENABLED=true
+    scheduler_enabled: bool = False
+    scheduler_poll_sec: float = 60.0
+    scheduler_lead_minutes: int = 30
+    scheduler_lease_sec: int = 600
+    scheduler_max_concurrent_jobs: int = 4
+    scheduler_max_attempts: int = 3
+    scheduler_slow_job_sec: float = 120.0  # 작업이 이보다 느리면 동시 실행 수를 줄임(백프레셔)
+
+    processor_mode: str = "mock"  # mock | lexicon(오프라인 감성 사전, numpy 필요) | openai
+    # 처리 실행기 (app/process_engine.py): inline | thread | process | async. 비우면 처리기 기본값
+    processor_executor: str = ""
+    processor_concurrency: int = 4
+    # 처리 대기열(고정 키워드·최신 기사 순)을 이 건수씩 처리·커밋한다. 작을수록 리포트에 결과가 빨리 보인다
+    process_queue_chunk: int = 50
+    # 사용자 공용 처리 결과 캐시 (domains/content/processing_cache.py)
+    processing_cache_enabled: bool = True
+    # 리포트 스냅샷: (사용자, 날짜, 키워드 필터)별 응답을 저장해 두고 수집·처리·키워드 변경 때만 다시 만든다
+    report_snapshot_enabled: bool = True
+    # 언어 정보가 없는 수집 항목(RSS)의 언어를 저장 시 판별 (app/langid.py)
+    langid_enabled: bool = True
+    # 번역 제공자 (app/translate.py)와 번역 메모 프로세스 내 LRU 크기 (0 이면 DB 만)
+    translator_mode: str = "mock"
+    translation_memo_lru_size: int = 10000
     openai_api_key: str | None = None
+    # processor_mode=openai 묶음 요청 제공자 (app/openai_provider.py). OpenAI 호환 chat completions
+    openai_base_url: str = "https://api.openai.com/v1"
+    openai_model: str = "gpt-4o-mini"
+    openai_batch_max_tokens: int = 6000  # 묶음 하나의 입력 토큰 예산(추정)
+    openai_batch_max_articles: int = 40
+    openai_concurrency: int = 4  # 동시에 보내는 묶음 수
+    openai_max_retries: int = 2  # 응답에서 빠진 기사만 다시 보내는 횟수
+    openai_retry_backoff_sec: float = 1.0
+    # 사용량 기록(ProviderUsageLog)의 비용 계산 단가 (USD / 100만 토큰)
+    openai_input_usd_per_mtok: float = 0.15
+    openai_output_usd_per_mtok: float = 0.60
 
     # 주식 시세·공시 (PRD-stock-signal-notification)
     stock_price_api_key: str = ""  # 공공데이터포털 serviceKey (getStockPriceInfo)
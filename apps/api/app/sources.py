@@ -0,0 +1,402 @@
+"""수집 소스 플러그인 레지스트리.
+
+소스(GDELT, Google News RSS, mock)마다 동시 요청 수·초당 요청 수·폴백 순서를 선언하고,
+app/collect.py 는 settings.collector_mode 에 해당하는 소스를 order 순으로 시도한다.
+
+- 동시 요청 수·초당 요청 수는 요청(사용자)마다가 아니라 소스별로 프로세스 전체에 적용된다.
+- 앞 소스가 결과를 내면 멈추고, 비었거나 실패하면 다음 소스로 폴백한다.
+  증분 조회(since)를 지원하는 소스의 빈 결과는 "새 기사 없음"이므로 폴백하지 않는다.
+- 서킷 브레이커: 소스가 연속 source_breaker_failures 번 실패하면 (모든 사용자에 대해) 호출을 멈추고
+  source_breaker_cooldown_sec 뒤 요청 하나만 시험(half-open)해 성공하면 다시 연다.
+  성공·실패는 업스트림 요청 단위로 센다(GDELT 묶음 요청 하나가 실패하면 실패 1번).
+  실패는 소스 장애(전송 오류·타임아웃·429·5xx)만 센다. 응답 파싱·쿼리 오류(짧거나 잘못된 키워드에
+  대한 오류 문구 등)는 그 키워드만의 문제이므로 브레이커에 반영하지 않고 그대로 던진다.
+  열린 동안에도 공유 수집 캐시 적중은 그대로 쓴다.
+
+새 소스는 CollectorSource 를 상속해 source_registry.register() 로 등록한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Literal, Optional, Sequence, TypeVar
+
+import httpx
+
+from .settings import settings
+
+if TYPE_CHECKING:
+    from .collect import CollectedItem
+
+T = TypeVar("T")
+
+
+class SourceUnavailable(Exception):
+    """서킷 브레이커가 열려 있어 소스를 호출하지 않음."""
+
+
+def is_source_failure(exc: BaseException) -> bool:
+    """소스 자체의 장애인지(전송 오류·타임아웃·429·5xx). 그 밖의 HTTP 4xx·파싱 오류는 요청 단위 오류."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+class RateLimiter:
+    """토큰 버킷. 이벤트 루프에 묶이지 않도록 시각 계산만으로 대기 시간을 정한다."""
+
+    def __init__(self, rate_per_sec: float, burst: int) -> None:
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        if self.rate_per_sec <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
+        # 토큰을 먼저 차감(음수 허용)해 동시 호출자끼리 대기 순번을 나눈다
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate_per_sec)
+
+
+class ConcurrencyLimit:
+    """프로세스 전체 동시 실행 한도. 요청·수집 실행마다가 아니라 모듈 수준에 하나만 둔다.
+
+    asyncio.Semaphore 는 이벤트 루프에 묶이므로 루프마다 하나씩 만든다(스케줄러·테스트의 asyncio.run).
+    한도는 limit() 으로 매번 읽어, 바뀌면 이후 요청부터 새 세마포어를 쓴다.
+    """
+
+    def __init__(self, limit: Callable[[], int]) -> None:
+        self._limit = limit
+        self._sems: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[int, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        size = max(1, self._limit())
+        current = self._sems.get(loop)
+        if current is None or current[0] != size:
+            current = self._sems[loop] = (size, asyncio.Semaphore(size))
+        return current[1]
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        # 얻은 세마포어에 그대로 돌려주도록 한 번만 고른다
+        async with self._semaphore():
+            yield
+
+
+class CircuitBreaker:
+    def __init__(self) -> None:
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opened_count = 0
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= settings.source_breaker_cooldown_sec:
+            self.state = "half_open"  # 이 호출 하나만 시험 요청
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= settings.source_breaker_failures:
+            if self.state != "open":
+                self.opened_count += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def record_abandoned(self) -> None:
+        """결과 없이 끝난 요청(취소 등). 시험 요청이었으면 다시 열어 쿨다운 뒤 새로 시험한다."""
+        if self.state == "half_open":
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def record_ignored(self) -> None:
+        """소스 상태와 무관한 오류(쿼리·파싱). 시험 요청이었으면 쿨다운 없이 다음 요청이 다시 시험한다."""
+        if self.state == "half_open":
+            self.state = "open"
+
+    async def call(self, name: str, func: Callable[[], Awaitable[T]]) -> T:
+        """업스트림 요청 하나를 브레이커로 감싼다. 닫혀 있지 않으면 SourceUnavailable."""
+        if not self.allow():
+            raise SourceUnavailable(name)
+        try:
+            result = await func()
+        except Exception as e:
+            if is_source_failure(e):
+                self.record_failure()
+            else:
+                self.record_ignored()
+            raise
+        except BaseException:
+            # CancelledError 등: 실패로 세지 않되 half_open 에 머물러 소스가 영영 막히지 않도록
+            self.record_abandoned()
+            raise
+        self.record_success()
+        return result
+
+
+class CollectorSource:
+    name: str = ""
+    kind: Literal["search_api", "rss"] = "search_api"
+    mode: str = "live"  # settings.collector_mode 중 어디에 속하는지
+    order: int = 100  # 폴백 순서 (작을수록 먼저)
+    supports_since: bool = False
+
+    def __init__(self) -> None:
+        self.breaker = CircuitBreaker()
+        self.limiter = RateLimiter(self.rate_per_sec, settings.collect_rate_burst)
+        # 동시 요청 한도도 속도 제한처럼 소스 단위로 프로세스 전체에 공유한다
+        self.slots = ConcurrencyLimit(lambda: self.concurrency)
+
+    @property
+    def concurrency(self) -> int:
+        return settings.collect_max_concurrency
+
+    @property
+    def rate_per_sec(self) -> float:
+        return 0.0
+
+    def start_run(self, keywords: Sequence[str], since_list: Sequence[Optional[datetime]]) -> SourceRun:
+        """collect_keywords 한 번 동안 쓸 실행 상태. keywords·since_list 는 같은 길이."""
+        return SourceRun(self)
+
+    def cache_name(self, since: Optional[datetime]) -> str:
+        """공유 수집 캐시 키의 소스 부분. 조회 구간이 다르면 다른 키."""
+        if since is None or not self.supports_since:
+            return self.name
+        return f"{self.name}>{since.astimezone(timezone.utc):%Y%m%d%H%M}"
+
+    async def fetch(self, keyword: str, day: date, *, since: Optional[datetime] = None) -> list[CollectedItem]:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "mode": self.mode,
+            "order": self.order,
+            "concurrency": self.concurrency,
+            "rate_per_sec": self.limiter.rate_per_sec,
+            "breaker": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "opened_count": self.breaker.opened_count,
+        }
+
+
+class SourceRun:
+    """collect_keywords 한 번 동안의 소스 실행 상태. 동시 요청 한도·속도 제한·브레이커는 소스의 것을 함께 쓴다."""
+
+    def __init__(self, source: CollectorSource) -> None:
+        self.source = source
+
+    def cache_name(self, keyword: str, since: Optional[datetime]) -> str:
+        """이 실행에서 keyword 결과를 담을 공유 수집 캐시 키의 소스 부분."""
+        return self.source.cache_name(since)
+
+    async def fetch(self, keyword: str, day: date, since: Optional[datetime]) -> list[CollectedItem]:
+        return await self.source.breaker.call(self.source.name, lambda: self._fetch(keyword, day, since))
+
+    async def _fetch(self, keyword: str, day: date, since: Optional[datetime]) -> list[CollectedItem]:
+        async with self.source.slots.slot():
+            await self.source.limiter.acquire()
+            return await self.source.fetch(keyword, day, since=since)
+
+
+class GdeltBatchRun(SourceRun):
+    """짧은 키워드를 OR 식으로 묶어 한 번에 조회하는 GDELT 실행.
+
+    같은 since 를 가진 키워드끼리 미리 묶음을 정해 두고, 묶음 안 키워드가 처음 요청될 때
+    묶음 전체를 한 번 조회한다. 나머지 키워드는 같은 결과(또는 예외)를 기다린다.
+    동시 요청 한도·속도 제한·서킷 브레이커는 키워드가 아니라 업스트림 요청 단위로 적용된다.
+    """
+
+    def __init__(self, source: CollectorSource, keywords: Sequence[str], since_list: Sequence[Optional[datetime]]) -> None:
+        from .collect import pack_gdelt_batches
+
+        super().__init__(source)
+        groups: dict[Optional[datetime], list[str]] = {}
+        for kw, since in zip(keywords, since_list):
+            if len(kw) <= settings.gdelt_batch_max_keyword_chars:
+                groups.setdefault(since, []).append(kw)
+        self._batches: list[tuple[list[str], Optional[datetime]]] = []
+        self._batch_of: dict[tuple[str, Optional[datetime]], int] = {}
+        for since, group in groups.items():
+            for batch in pack_gdelt_batches(list(dict.fromkeys(group)), settings.gdelt_batch_max_keywords):
+                if len(batch) < 2:
+                    continue
+                for kw in batch:
+                    self._batch_of[(kw, since)] = len(self._batches)
+                self._batches.append((batch, since))
+        self._tasks: dict[int, asyncio.Task] = {}
+
+    def cache_name(self, keyword: str, since: Optional[datetime]) -> str:
+        """묶음 결과를 나눈 것은 단독 조회 결과와 다르므로(묶음 전체가 max_records 를 나눠 씀) 키를 따로 둔다."""
+        name = super().cache_name(keyword, since)
+        return f"{name}+batch" if (keyword, since) in self._batch_of else name
+
+    async def _run_batch(self, index: int, day: date) -> dict[str, list[CollectedItem]]:
+        from . import collect
+
+        keywords, since = self._batches[index]
+
+        async def _request() -> dict[str, list[CollectedItem]]:
+            async with self.source.slots.slot():
+                await self.source.limiter.acquire()
+                return await collect.search_gdelt_batch(keywords=keywords, day=day, since=since)
+
+        return await self.source.breaker.call(self.source.name, _request)
+
+    async def fetch(self, keyword: str, day: date, since: Optional[datetime]) -> list[CollectedItem]:
+        index = self._batch_of.get((keyword, since))
+        if index is None:
+            return await super().fetch(keyword, day, since)
+        task = self._tasks.get(index)
+        if task is None:
+            task = self._tasks[index] = asyncio.ensure_future(self._run_batch(index, day))
+        # 한 키워드가 취소돼도 같은 묶음을 기다리는 다른 키워드에는 영향이 없도록
+        return list((await asyncio.shield(task))[keyword])
+
+
+class GdeltSource(CollectorSource):
+    name = "gdelt"
+    kind = "search_api"
+    order = 10
+    supports_since = True
+
+    @property
+    def concurrency(self) -> int:
+        return settings.collect_gdelt_concurrency
+
+    @property
+    def rate_per_sec(self) -> float:
+        return settings.collect_gdelt_rate_per_sec
+
+    def start_run(self, keywords: Sequence[str], since_list: Sequence[Optional[datetime]]) -> SourceRun:
+        if settings.gdelt_batch_enabled and len(keywords) > 1:
+            return GdeltBatchRun(self, keywords, since_list)
+        return SourceRun(self)
+
+    async def fetch(self, keyword: str, day: date, *, since: Optional[datetime] = None) -> list[CollectedItem]:
+        from . import collect
+
+        return await collect.search_gdelt(keyword=keyword, day=day, since=since)
+
+
+class GoogleNewsRssSource(CollectorSource):
+    name = "rss"
+    kind = "rss"
+    order = 20
+
+    @property
+    def concurrency(self) -> int:
+        return settings.collect_rss_concurrency
+
+    @property
+    def rate_per_sec(self) -> float:
+        return settings.collect_rss_rate_per_sec
+
+    async def fetch(self, keyword: str, day: date, *, since: Optional[datetime] = None) -> list[CollectedItem]:
+        from . import collect
+
+        return await collect.rss_google_news(keyword=keyword, day=day)
+
+
+class MockSearchSource(CollectorSource):
+    """외부 호출 없는 개발용 검색 소스. 키워드에 force_rss 가 있으면 빈 결과(→ RSS 폴백)."""
+
+    name = "mock_search"
+    kind = "search_api"
+    mode = "mock"
+    order = 10
+    supports_since = True
+
+    async def fetch(self, keyword: str, day: date, *, since: Optional[datetime] = None) -> list[CollectedItem]:
+        from .collect import CollectedItem
+
+        if "force_rss" in keyword.lower():
+            return []
+        return [
+            CollectedItem(
+                url="https://example.com/mock/search/1",
+                canonical_url="https://example.com/mock/search/1",
+                title=f"[MOCK] {keyword} 검색 결과 1",
+                snippet="Mock snippet",
+                source_name="MockSearch",
+                source_type="search_api",
+                language="en",
+                published_at=datetime.now().astimezone(),
+            )
+        ]
+
+
+class MockRssSource(CollectorSource):
+    name = "mock_rss"
+    kind = "rss"
+    mode = "mock"
+    order = 20
+
+    async def fetch(self, keyword: str, day: date, *, since: Optional[datetime] = None) -> list[CollectedItem]:
+        from .collect import CollectedItem
+
+        return [
+            CollectedItem(
+                url="https://example.com/mock/rss/1",
+                canonical_url="https://example.com/mock/rss/1",
+                title=f"[MOCK] {keyword} RSS 결과 1",
+                snippet="Mock RSS summary",
+                source_name="MockRSS",
+                source_type="rss",
+                language="ko",
+                published_at=datetime.now().astimezone(),
+            )
+        ]
+
+
+class SourceRegistry:
+    def __init__(self) -> None:
+        self._sources: dict[str, CollectorSource] = {}
+
+    def register(self, source: CollectorSource) -> CollectorSource:
+        self._sources[source.name] = source
+        return source
+
+    def get(self, name: str) -> Optional[CollectorSource]:
+        return self._sources.get(name)
+
+    def chain(self, mode: Optional[str] = None) -> list[CollectorSource]:
+        """해당 모드(기본 settings.collector_mode)의 소스를 폴백 순서대로."""
+        mode = (mode or settings.collector_mode or "live").lower()
+        return sorted((s for s in self._sources.values() if s.mode == mode), key=lambda s: s.order)
+
+    def stats(self) -> dict:
+        return {name: s.stats() for name, s in self._sources.items()}
+
+    def reset(self) -> None:
+        """브레이커·속도 제한 상태 초기화 (테스트·운영 수동 복구용)."""
+        for s in self._sources.values():
+            s.breaker = CircuitBreaker()
+            s.limiter = RateLimiter(s.rate_per_sec, settings.collect_rate_burst)
+
+
+source_registry = SourceRegistry()
+for _source in (GdeltSource(), GoogleNewsRssSource(), MockSearchSource(), MockRssSource()):
+    source_registry.register(_source)
@@ -0,0 +1,36 @@
+"""번역 제공자 레지스트리 (settings.translator_mode).
+
+처리기는 한국어가 아닌 요약을 translation_status="pending" 으로 두고, 번역은 process_day 가
+번역 메모(domains/content/translation_memo.py)를 거쳐 메모에 없는 문장만 묶어 제공자에 보낸다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from .settings import settings
+
+
+@dataclass(frozen=True)
+class Translator:
+    """translate(texts, source_lang, target_lang) → 같은 순서의 번역문.
+    version 은 번역 품질이 바뀌면(모델·프롬프트 변경) 올린다. 번역 메모 키에 들어간다."""
+
+    name: str
+    version: str
+    translate: Callable[[Sequence[str], str, str], list[str]]
+
+
+def translate_mock(texts: Sequence[str], source_lang: str, target_lang: str) -> list[str]:
+    # 번역 표시라는 형태만 유지
+    return [f"(번역) {t}" for t in texts]
+
+
+TRANSLATORS: dict[str, Translator] = {
+    "mock": Translator("mock", "1", translate_mock),
+}
+
+
+def get_translator(mode: Optional[str] = None) -> Translator:
+    mode = (mode or settings.translator_mode or "mock").lower()
+    return TRANSLATORS.get(mode) or TRANSLATORS["mock"]
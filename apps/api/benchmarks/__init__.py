@@ -0,0 +1 @@
+"""성능 측정 스크립트 모음. apps/api 에서 `python -m benchmarks.<name>` 으로 실행."""
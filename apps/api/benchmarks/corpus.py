@@ -0,0 +1,210 @@
+r"""
+시드 고정 합성 데이터셋 생성기. 기존 SQLModel 모델 그대로 SQLite/Postgres 에 대량 적재한다.
+
+사용자 N명 × 키워드 K개, 사용자당 기사 M건(여러 날짜에 분산), 기사마다 키워드 1~3개 연결,
+일부 기사에 처리 결과, 일부는 유사 기사 묶음(cluster_id)을 만든다.
+같은 seed 는 같은 id·텍스트를 만든다.
+
+사용법 (단독 실행 시 적재만):
+  cd apps/api
+  python -m benchmarks.corpus --database-url sqlite:///./data/bench.db --users 1000 --articles-per-user 100
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.db import _ensure_sqlite_dir, _normalize_database_url
+from app.models import Article, ArticleKeyword, Keyword, NotificationSetting, ProcessingResult, User
+from app.security import hash_password
+
+PASSWORD = "benchpass123"
+BATCH = 1000
+
+_WORDS = (
+    "반도체 수출 금리 환율 배터리 전기차 인공지능 클라우드 실적 발표 규제 투자 성장 둔화 회복 "
+    "chip export rate battery cloud earnings policy growth market launch merger supply demand "
+    "samsung hyundai nvidia apple tesla kakao naver sk lg posco"
+).split()
+
+
+@dataclass
+class Corpus:
+    user_ids: list[uuid.UUID] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)
+    keyword_ids: dict[uuid.UUID, list[uuid.UUID]] = field(default_factory=dict)  # user → keywords
+    sample_article_ids: dict[uuid.UUID, uuid.UUID] = field(default_factory=dict)  # user → 기사 하나
+    days: list[str] = field(default_factory=list)
+    articles: int = 0
+    links: int = 0
+    results: int = 0
+    build_sec: float = 0.0
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _chunks(rows: list[dict], size: int = BATCH) -> Iterator[list[dict]]:
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def _flush(session: Session, model, rows: list[dict]) -> None:
+    for part in _chunks(rows):
+        session.exec(insert(model), params=part)
+    rows.clear()
+
+
+def build_corpus(
+    engine,
+    *,
+    users: int = 100,
+    keywords_per_user: int = 10,
+    articles_per_user: int = 200,
+    days: int = 7,
+    end_day: date = date(2026, 1, 31),
+    processed_ratio: float = 0.8,
+    duplicate_ratio: float = 0.1,
+    seed: int = 42,
+) -> Corpus:
+    """데이터셋을 적재하고 요약을 반환. 스키마는 없으면 만든다."""
+    started = time.perf_counter()
+    SQLModel.metadata.create_all(engine)
+    rng = random.Random(seed)
+    corpus = Corpus(days=[(end_day - timedelta(days=i)).isoformat() for i in range(days)][::-1])
+    password_hash = hash_password(PASSWORD)  # bcrypt 는 느리므로 한 번만
+    now = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    user_rows: list[dict] = []
+    kw_rows: list[dict] = []
+    ns_rows: list[dict] = []
+    article_rows: list[dict] = []
+    link_rows: list[dict] = []
+    result_rows: list[dict] = []
+
+    with Session(engine) as session:
+        for u in range(users):
+            user_id = _uuid(rng)
+            email = f"bench{seed}-{u}@example.com"
+            corpus.user_ids.append(user_id)
+            corpus.emails.append(email)
+            user_rows.append(
+                {"id": user_id, "email": email, "password_hash": password_hash, "auth_provider": "email",
+                 "created_at": now, "updated_at": now}
+            )
+            ns_rows.append(
+                {"id": _uuid(rng), "user_id": user_id, "daily_report_time_hhmm": f"{rng.randint(6, 10):02d}:00",
+                 "is_enabled": True, "updated_at": now}
+            )
+            kws = []
+            for k in range(keywords_per_user):
+                kw_id = _uuid(rng)
+                kws.append(kw_id)
+                kw_rows.append(
+                    {"id": kw_id, "user_id": user_id, "text": f"{rng.choice(_WORDS)} {k}", "is_active": True,
+                     "is_pinned": k < 2, "last_used_at": None, "created_at": now, "updated_at": now}
+                )
+            corpus.keyword_ids[user_id] = kws
+
+            prev_id = None
+            for n in range(articles_per_user):
+                a_id = _uuid(rng)
+                day = corpus.days[n % days]
+                published = datetime.fromisoformat(day).replace(tzinfo=timezone.utc) + timedelta(minutes=rng.randint(0, 1439))
+                title = " ".join(rng.choices(_WORDS, k=rng.randint(5, 10)))
+                duplicate = prev_id is not None and rng.random() < duplicate_ratio
+                article_rows.append(
+                    {
+                        "id": a_id, "user_id": user_id, "date_kst": day,
+                        "canonical_url": f"https://news{n % 50}.example.com/{u}/{n}",
+                        "original_url": f"https://news{n % 50}.example.com/{u}/{n}?utm_source=bench",
+                        "source_type": "search_api" if n % 4 else "rss",
+                        "source_name": f"Source{n % 50}", "published_at": published, "fetched_at": published,
+                        "title_original": title, "snippet_original": f"{title} …",
+                        "language_original": "ko" if n % 3 else "en",
+                        "title_simhash": None, "simhash_b0": None, "simhash_b1": None, "simhash_b2": None,
+                        "simhash_b3": None, "cluster_id": prev_id if duplicate else a_id,
+                    }
+                )
+                if n == 0:
+                    corpus.sample_article_ids[user_id] = a_id
+                for kw_id in rng.sample(kws, k=min(len(kws), rng.randint(1, 3))):
+                    link_rows.append({"id": _uuid(rng), "article_id": a_id, "keyword_id": kw_id})
+                if not duplicate and rng.random() < processed_ratio:
+                    result_rows.append(
+                        {
+                            "id": _uuid(rng), "user_id": user_id, "article_id": a_id,
+                            "sentiment": rng.choice(("positive", "neutral", "negative")),
+                            "sentiment_confidence": round(rng.random(), 3),
+                            "summary_original": title, "summary_ko": f"(번역) {title}",
+                            "translated_from": None, "translation_status": "not_needed", "created_at": published,
+                        }
+                    )
+                if not duplicate:
+                    prev_id = a_id
+            corpus.articles += articles_per_user
+
+            # 메모리를 일정하게 유지하도록 적재 단위마다 비움 (FK 순서: user → keyword → article → 나머지)
+            if len(article_rows) >= 20 * BATCH or u == users - 1:
+                corpus.links += len(link_rows)
+                corpus.results += len(result_rows)
+                _flush(session, User, user_rows)
+                _flush(session, NotificationSetting, ns_rows)
+                _flush(session, Keyword, kw_rows)
+                _flush(session, Article, article_rows)
+                _flush(session, ArticleKeyword, link_rows)
+                _flush(session, ProcessingResult, result_rows)
+                session.commit()
+
+    corpus.build_sec = time.perf_counter() - started
+    return corpus
+
+
+def make_engine(database_url: str):
+    """app.db 와 같은 규칙으로 엔진 생성 (postgres:// 정규화, SQLite 디렉터리 생성)."""
+    url = _normalize_database_url(database_url)
+    _ensure_sqlite_dir(url)
+    kwargs: dict = {"connect_args": {"check_same_thread": False}} if url.startswith("sqlite") else {"pool_pre_ping": True}
+    return create_engine(url, **kwargs)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="touch 합성 데이터셋 적재")
+    ap.add_argument("--database-url", default="sqlite:///./data/bench.db")
+    ap.add_argument("--users", type=int, default=1000)
+    ap.add_argument("--keywords-per-user", type=int, default=10)
+    ap.add_argument("--articles-per-user", type=int, default=100)
+    ap.add_argument("--days", type=int, default=7)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args(argv)
+
+    engine = make_engine(args.database_url)
+    corpus = build_corpus(
+        engine,
+        users=args.users,
+        keywords_per_user=args.keywords_per_user,
+        articles_per_user=args.articles_per_user,
+        days=args.days,
+        seed=args.seed,
+    )
+    print(
+        f"users={len(corpus.user_ids)} articles={corpus.articles} links={corpus.links} "
+        f"results={corpus.results} in {corpus.build_sec:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+r"""
+호출마다 새 클라이언트를 만드는 방식(before)과 공용 레지스트리(after)의
+TCP 커넥션(= 실서비스에서는 TCP+TLS 핸드셰이크) 수를 로컬 스텁 서버로 비교한다.
+
+사용법:
+  cd apps/api
+  python -m benchmarks.http_handshakes --calls 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from app.http_clients import HostConfig, HttpClientRegistry
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+        self._count_lock = threading.Lock()
+
+    def process_request(self, request, client_address) -> None:
+        with self._count_lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def reset(self) -> None:
+        with self._count_lock:
+            self.connections = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps({"articles": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        return
+
+
+def _sync_before(url: str, calls: int) -> None:
+    for _ in range(calls):
+        with httpx.Client(timeout=15.0) as client:
+            client.get(url).raise_for_status()
+
+
+def _sync_after(registry: HttpClientRegistry, url: str, calls: int) -> None:
+    for _ in range(calls):
+        registry.sync_client(url).get(url).raise_for_status()
+
+
+async def _async_before(url: str, calls: int, concurrency: int) -> None:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                (await client.get(url)).raise_for_status()
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+
+
+async def _async_after(registry: HttpClientRegistry, url: str, calls: int, concurrency: int) -> None:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            (await registry.async_client(url).get(url)).raise_for_status()
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    await registry.aclose()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--calls", type=int, default=50)
+    ap.add_argument("--concurrency", type=int, default=4)
+    args = ap.parse_args()
+
+    server = _CountingServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_address[1]}"
+    url = f"http://{host}/api/v2/doc/doc"
+    registry = HttpClientRegistry({host: HostConfig(timeout=15.0, max_connections=args.concurrency)})
+
+    cases = [
+        ("sync  before (client per call)", lambda: _sync_before(url, args.calls)),
+        ("sync  after  (shared registry)", lambda: _sync_after(registry, url, args.calls)),
+        ("async before (client per call)", lambda: asyncio.run(_async_before(url, args.calls, args.concurrency))),
+        ("async after  (shared registry)", lambda: asyncio.run(_async_after(registry, url, args.calls, args.concurrency))),
+    ]
+    print(f"{'case':<32} {'calls':>6} {'connections':>12} {'elapsed_ms':>11}")
+    try:
+        for name, fn in cases:
+            server.reset()
+            started = time.perf_counter()
+            fn()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"{name:<32} {args.calls:>6} {server.connections:>12} {elapsed_ms:>11.1f}")
+    finally:
+        registry.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+r"""
+오프라인 감성 사전(app/sentiment.py)의 정확도와 처리량을 함께 잰다.
+
+정확도는 수작업 라벨 데이터(benchmarks/data/sentiment_labelled.tsv), 처리량은 같은 문장을
+--articles 건까지 반복해 하루치 묶음 하나로 점수 계산(score_texts)·처리기(processor_mode=lexicon) 전체를 돌린다.
+
+사용법:
+  cd apps/api
+  python -m benchmarks.sentiment --articles 20000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.process import ArticleInput, process_articles_lexicon
+from app.sentiment import score_texts, token_weight
+
+FIXTURE = Path(__file__).resolve().parent / "data" / "sentiment_labelled.tsv"
+LABELS = ("positive", "neutral", "negative")
+
+
+def load_fixture(path: Path = FIXTURE) -> list[tuple[str, str, str]]:
+    """(label, lang, text) 목록."""
+    rows = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        label, lang, text = line.split("\t", 2)
+        rows.append((label, lang, text))
+    return rows
+
+
+def accuracy(rows: list[tuple[str, str, str]]) -> dict:
+    preds = [s.label for s in score_texts([text for _, _, text in rows])]
+    by_lang: dict[str, list[bool]] = {}
+    confusion: Counter = Counter()
+    for (label, lang, _), pred in zip(rows, preds):
+        by_lang.setdefault(lang, []).append(label == pred)
+        confusion[(label, pred)] += 1
+    correct = sum(label == pred for (label, _, _), pred in zip(rows, preds))
+    return {
+        "total": len(rows),
+        "accuracy": correct / len(rows),
+        "by_lang": {lang: sum(v) / len(v) for lang, v in by_lang.items()},
+        "confusion": confusion,
+    }
+
+
+def _rate(n: int, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - started)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="감성 사전 정확도·처리량")
+    ap.add_argument("--articles", type=int, default=20000, help="처리량 측정 묶음 크기")
+    args = ap.parse_args()
+
+    rows = load_fixture()
+    acc = accuracy(rows)
+    print(f"accuracy: {acc['accuracy']:.1%} ({acc['total']} labelled)")
+    for lang, value in sorted(acc["by_lang"].items()):
+        print(f"  {lang}: {value:.1%}")
+    print("confusion (rows=label, cols=predicted):")
+    print(f"  {'':<9}" + "".join(f"{p:>10}" for p in LABELS))
+    for label in LABELS:
+        print(f"  {label:<9}" + "".join(f"{acc['confusion'][(label, p)]:>10}" for p in LABELS))
+
+    texts = [rows[i % len(rows)][2] for i in range(args.articles)]
+    articles = [ArticleInput(i, text, None, rows[i % len(rows)][1]) for i, text in enumerate(texts)]
+    token_weight.cache_clear()
+    cold = _rate(len(texts), lambda: score_texts(texts))
+    warm = _rate(len(texts), lambda: score_texts(texts))
+    full = _rate(len(articles), lambda: process_articles_lexicon(articles))
+    print(f"\nthroughput ({len(texts)} articles, one core):")
+    print(f"  score_texts (cold token cache): {cold:,.0f} articles/s")
+    print(f"  score_texts (warm token cache): {warm:,.0f} articles/s")
+    print(f"  lexicon processor (with summaries): {full:,.0f} articles/s")
+
+
+if __name__ == "__main__":
+    main()
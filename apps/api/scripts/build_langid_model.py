@@ -0,0 +1,43 @@
+r"""
+언어 판별 모델(app/data/langid.npz)을 학습 문장(scripts/data/langid_corpus.tsv)으로 다시 만든다.
+
+언어별 특징 칸 빈도에 라플라스 평활을 더한 로그 확률(나이브 베이즈)을 float16 으로 저장한다.
+
+사용법:
+  cd apps/api
+  python -m scripts.build_langid_model
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from app.langid import MODEL_PATH, N_BUCKETS, features, normalize
+
+CORPUS = Path(__file__).resolve().parent / "data" / "langid_corpus.tsv"
+ALPHA = 0.5
+
+
+def main() -> None:
+    counts: dict[str, np.ndarray] = {}
+    for line in CORPUS.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        lang, text = line.split("\t", 1)
+        row = counts.setdefault(lang, np.zeros(N_BUCKETS, dtype=np.float64))
+        np.add.at(row, np.asarray(features(normalize(text)), dtype=np.int64), 1.0)
+
+    langs = sorted(counts)
+    matrix = np.stack([counts[lang] for lang in langs]) + ALPHA
+    log_probs = np.log(matrix / matrix.sum(axis=1, keepdims=True)).astype(np.float16)
+    MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(MODEL_PATH, langs=np.asarray(langs), log_probs=log_probs)
+    print(f"{MODEL_PATH}: {len(langs)} languages x {N_BUCKETS} buckets, {MODEL_PATH.stat().st_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -41,19 +41,29 @@ def main() -> None:
         AppSetting,
         Article,
         ArticleKeyword,
+        BackfillRun,
+        CollectJob,
+        CollectLedger,
+        CollectWatermark,
         CorpCodeCache,
+        FeedCacheEntry,
         Keyword,
         MemberAccessLog,
         MemberActionLog,
         MemberProfile,
         NotificationSetting,
         PointAdjustmentRequest,
+        ProcessingCache,
         ProcessingResult,
+        ProviderUsageLog,
         PushToken,
+        ReportSnapshot,
+        ReportVersion,
         ServiceModule,
         SignalEventLog,
         SignalRuleConfig,
         StockApiUsageLog,
+        TranslationMemo,
         User,
         WatchItem,
     )
@@ -84,6 +94,10 @@ def main() -> None:
     print("DB 연결:", "SQLite" if is_sqlite else "Postgres")
     print("스키마 배포 중...")
     SQLModel.metadata.create_all(engine)
+    from app.db import add_missing_columns
+
+    for name in add_missing_columns(engine):
+        print("컬럼 추가:", name)
     print("스키마 배포 완료.")
 
 
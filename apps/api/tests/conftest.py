@@ -5,11 +5,15 @@
 """
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Optional
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+from app.collect import CollectedItem
 from app.db import get_session
 from app.main import app
 
@@ -23,23 +27,64 @@ ADMIN_ID = "admin"
 ADMIN_PASSWORD = "1234"
 
 
+# ---------------------------------------------------------------------------
+# 수집 결과 헬퍼
+# ---------------------------------------------------------------------------
+
+
+def collected_item(
+    title: str,
+    *,
+    url: Optional[str] = None,
+    source_type: str = "search_api",
+    language: Optional[str] = "en",
+    published_at: Optional[datetime] = None,
+) -> CollectedItem:
+    """가짜 업스트림이 돌려줄 수집 결과 한 건. url 이 없으면 제목으로, published_at 이 없으면 지금 시각."""
+    url = url or f"https://example.com/{title}"
+    return CollectedItem(
+        url=url,
+        canonical_url=url,
+        title=title,
+        snippet=None,
+        source_name="Stub",
+        source_type=source_type,
+        language=language,
+        published_at=published_at or datetime.now().astimezone(),
+    )
+
+
 # ---------------------------------------------------------------------------
 # 기본 픽스처
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(name="client")
-def client_fixture():
-    """테스트마다 새 인메모리 DB + TestClient 를 생성합니다."""
+@pytest.fixture(name="db_engine")
+def db_engine_fixture():
+    """테스트마다 새 인메모리 DB 엔진(스키마 생성 완료)을 만듭니다."""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(db_engine):
+    """db_engine 세션. client 와 같이 쓰면 같은 DB 를 봅니다."""
+    with Session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture(name="client")
+def client_fixture(db_engine):
+    """db_engine 을 쓰는 TestClient 를 생성합니다."""
 
     def override_session():
-        with Session(engine) as session:
+        with Session(db_engine) as session:
             yield session
 
     app.dependency_overrides[get_session] = override_session
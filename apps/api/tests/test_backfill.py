@@ -0,0 +1,206 @@
+"""과거 수집(backfill) E2E 테스트.
+
+커버리지:
+  POST   /collect/backfill
+  GET    /collect/backfill/{id}
+  POST   /collect/backfill/{id}/resume
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import collect as collect_mod
+from app.domains.content.models import BackfillRun
+from app.fetch_cache import fetch_cache
+from app.settings import settings
+from app.sources import source_registry
+from tests.conftest import collected_item
+
+
+@pytest.fixture(autouse=True)
+def fake_upstream(monkeypatch):
+    """live 소스를 쓰되 GDELT 는 (키워드, 날짜)마다 2건을 돌려주는 가짜, RSS 는 빈 결과."""
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    fetch_cache.clear()
+    source_registry.reset()
+    calls: list[tuple[str, date]] = []
+    failing: set[date] = set()
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        calls.append((keyword, day))
+        if day in failing:
+            raise RuntimeError("upstream down")
+        return [
+            collected_item(f"{keyword} {day} {n}", published_at=datetime(day.year, day.month, day.day, 3, tzinfo=timezone.utc))
+            for n in range(2)
+        ]
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        if day in failing:
+            raise RuntimeError("upstream down")
+        return []
+
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    monkeypatch.setattr(collect_mod, "rss_google_news", fake_rss)
+    yield calls, failing
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+def _keyword(client: TestClient, headers: dict, text: str) -> str:
+    resp = client.post("/keywords", json={"text": text, "is_active": True}, headers=headers)
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"]
+
+
+def _backfill(client: TestClient, headers: dict, **body) -> dict:
+    resp = client.post("/collect/backfill", json=body, headers=headers)
+    assert resp.status_code == 202, resp.text
+    # TestClient 는 백그라운드 작업까지 끝낸 뒤 응답을 돌려준다
+    status = client.get(f"/collect/backfill/{resp.json()['id']}", headers=headers)
+    assert status.status_code == 200
+    return status.json()
+
+
+# ---------------------------------------------------------------------------
+# 실행·완료 장부
+# ---------------------------------------------------------------------------
+
+
+def test_backfill_collects_range_and_skips_ledger(client: TestClient, auth_headers: dict, fake_upstream):
+    calls, _ = fake_upstream
+    kw_a = _keyword(client, auth_headers, "alpha")
+    _keyword(client, auth_headers, "beta")
+
+    run = _backfill(client, auth_headers, start_date="2025-01-01", end_date="2025-01-03")
+    assert run["status"] == "done"
+    assert run["units_total"] == 6
+    assert run["units_done"] == 6 and run["units_skipped"] == 0
+    assert run["inserted_articles"] == 12
+    assert run["units_per_sec"] > 0
+    assert len(calls) == 6
+
+    # 겹치는 범위 + 키워드 일부: 이미 끝난 (키워드, 날짜)는 업스트림을 부르지 않음
+    calls.clear()
+    run = _backfill(client, auth_headers, start_date="2025-01-02", end_date="2025-01-04", keyword_ids=[kw_a])
+    assert run["units_total"] == 3
+    assert run["units_skipped"] == 2
+    assert calls == [("alpha", date(2025, 1, 4))]
+
+    report = client.get("/report", params={"date_kst": "2025-01-02"}, headers=auth_headers).json()
+    assert report["total_articles"] == 4
+
+
+def test_backfill_resume_after_failure(client: TestClient, auth_headers: dict, fake_upstream):
+    calls, failing = fake_upstream
+    _keyword(client, auth_headers, "alpha")
+    failing.add(date(2025, 1, 2))
+
+    run = _backfill(client, auth_headers, start_date="2025-01-01", end_date="2025-01-03")
+    assert run["status"] == "failed"
+    assert run["units_done"] == 2 and run["units_failed"] == 1
+
+    failing.clear()
+    calls.clear()
+    resp = client.post(f"/collect/backfill/{run['id']}/resume", headers=auth_headers)
+    assert resp.status_code == 202
+    run = client.get(f"/collect/backfill/{run['id']}", headers=auth_headers).json()
+    assert run["status"] == "done"
+    assert run["units_skipped"] == 2 and run["units_done"] == 3
+    assert calls == [("alpha", date(2025, 1, 2))]
+
+    resp = client.post(f"/collect/backfill/{run['id']}/resume", headers=auth_headers)
+    assert resp.status_code == 409
+
+
+def test_backfill_rss_fallback_is_not_complete(client: TestClient, auth_headers: dict, fake_upstream, monkeypatch):
+    """검색 API 가 실패해 RSS 로 폴백한 단위는 실패로 세고 장부에 남기지 않는다."""
+    calls, _ = fake_upstream
+    _keyword(client, auth_headers, "alpha")
+    search_gdelt = collect_mod.search_gdelt
+
+    async def gdelt_down(*, keyword: str, day: date, max_records: int = 25, since=None):
+        if day == date(2025, 1, 2):
+            raise RuntimeError("search down")
+        return await search_gdelt(keyword=keyword, day=day, max_records=max_records, since=since)
+
+    async def rss_recent(*, keyword: str, day: date, max_records: int = 25):
+        return [
+            collected_item(
+                f"{keyword} recent",
+                url="https://example.com/rss/recent",
+                source_type="rss",
+                published_at=datetime(2025, 1, 2, 3, tzinfo=timezone.utc),
+            )
+        ]
+
+    monkeypatch.setattr(collect_mod, "search_gdelt", gdelt_down)
+    monkeypatch.setattr(collect_mod, "rss_google_news", rss_recent)
+    run = _backfill(client, auth_headers, start_date="2025-01-01", end_date="2025-01-03")
+    assert run["status"] == "failed"
+    assert run["units_done"] == 2 and run["units_failed"] == 1
+    assert run["inserted_articles"] == 4
+
+    monkeypatch.setattr(collect_mod, "search_gdelt", search_gdelt)
+    fetch_cache.clear()
+    calls.clear()
+    client.post(f"/collect/backfill/{run['id']}/resume", headers=auth_headers)
+    run = client.get(f"/collect/backfill/{run['id']}", headers=auth_headers).json()
+    assert run["status"] == "done"
+    assert run["units_skipped"] == 2
+    assert calls == [("alpha", date(2025, 1, 2))]
+
+
+def test_backfill_resume_rejected_while_running(
+    client: TestClient, auth_headers: dict, session: Session, fake_upstream, monkeypatch
+):
+    """실행 중인 작업은 409, 진행 기록이 backfill_stale_sec 보다 오래되면(죽은 실행) 재개 허용."""
+    calls, failing = fake_upstream
+    _keyword(client, auth_headers, "alpha")
+    failing.add(date(2025, 1, 1))
+    run = _backfill(client, auth_headers, start_date="2025-01-01", end_date="2025-01-01")
+
+    row = session.get(BackfillRun, UUID(run["id"]))
+    row.status = "running"
+    row.updated_at = datetime.now().astimezone()
+    session.add(row)
+    session.commit()
+
+    failing.clear()
+    calls.clear()
+    resp = client.post(f"/collect/backfill/{run['id']}/resume", headers=auth_headers)
+    assert resp.status_code == 409
+    assert calls == []
+
+    monkeypatch.setattr(settings, "backfill_stale_sec", 0.0)
+    resp = client.post(f"/collect/backfill/{run['id']}/resume", headers=auth_headers)
+    assert resp.status_code == 202
+    assert client.get(f"/collect/backfill/{run['id']}", headers=auth_headers).json()["status"] == "done"
+    assert calls == [("alpha", date(2025, 1, 1))]
+
+
+# ---------------------------------------------------------------------------
+# 검증
+# ---------------------------------------------------------------------------
+
+
+def test_backfill_validation(client: TestClient, auth_headers: dict):
+    _keyword(client, auth_headers, "alpha")
+    bad = [
+        {"start_date": "2025-01-03", "end_date": "2025-01-01"},
+        {"start_date": "2099-01-01", "end_date": "2099-01-02"},
+        {"start_date": "2024-01-01", "end_date": "2024-12-31"},
+    ]
+    for body in bad:
+        assert client.post("/collect/backfill", json=body, headers=auth_headers).status_code == 400
+    resp = client.post(
+        "/collect/backfill",
+        json={"start_date": "2025-01-01", "end_date": "2025-01-01", "keyword_ids": ["00000000-0000-0000-0000-000000000000"]},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 404
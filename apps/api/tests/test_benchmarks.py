@@ -0,0 +1,68 @@
+"""벤치마크 스크립트(benchmarks/corpus.py, benchmarks/e2e.py) 스모크 테스트. 아주 작은 합성 데이터셋을 SQLite 에 적재한다.
+
+커버리지:
+  build_corpus (같은 seed → 같은 데이터)
+  python -m benchmarks.e2e (--out, --compare 기준 JSON)
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from sqlmodel import Session, func, select
+
+from app.models import Article
+from app.settings import settings
+from benchmarks import e2e
+from benchmarks.corpus import build_corpus, make_engine
+
+BASELINE = Path(__file__).resolve().parent.parent / "benchmarks" / "baselines" / "sqlite.json"
+TINY = ["--users", "3", "--keywords-per-user", "2", "--articles-per-user", "6", "--days", "2", "--seed", "7"]
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터셋
+# ---------------------------------------------------------------------------
+
+
+def test_corpus_is_deterministic(tmp_path):
+    corpora = []
+    for name in ("a", "b"):
+        engine = make_engine(f"sqlite:///{tmp_path / name}.db")
+        corpora.append(build_corpus(engine, users=3, keywords_per_user=2, articles_per_user=6, days=2, seed=7))
+        with Session(engine) as session:
+            assert session.exec(select(func.count()).select_from(Article)).one() == 18
+        engine.dispose()
+    a, b = corpora
+    assert a.user_ids == b.user_ids and a.keyword_ids == b.keyword_ids
+    assert (a.articles, a.links, a.results) == (b.articles, b.links, b.results)
+
+
+# ---------------------------------------------------------------------------
+# 엔드투엔드 실행·기준 비교
+# ---------------------------------------------------------------------------
+
+
+def test_e2e_runs_and_compares_with_baseline(tmp_path, monkeypatch, capsys):
+    # run_benchmark 가 바꾸는 전역 설정은 테스트가 끝나면 되돌린다
+    monkeypatch.setattr(settings, "collector_mode", settings.collector_mode)
+    monkeypatch.setattr(settings, "processor_mode", settings.processor_mode)
+    out = tmp_path / "result.json"
+
+    e2e.main([*TINY, "--requests", "2", "--memory-requests", "1", "--out", str(out), "--compare", str(BASELINE)])
+
+    result = json.loads(out.read_text(encoding="utf-8"))
+    assert result["corpus"]["articles"] == 18
+    baseline = json.loads(BASELINE.read_text(encoding="utf-8"))
+    assert set(result["endpoints"]) == set(baseline["endpoints"])
+    for name, r in result["endpoints"].items():
+        assert r["errors"] == 0, name
+        assert r["queries_mean"] > 0
+    printed = capsys.readouterr().out
+    assert "vs baseline" in printed and "corpus size differs" in printed
+
+
+def test_compare_flags_regressions():
+    base = {"meta": {}, "corpus": {"articles": 1}, "endpoints": {"GET /x": {"p95_ms": 10.0, "queries_mean": 4.0, "peak_mem_kb": 100.0}}}
+    cur = {"meta": {}, "corpus": {"articles": 1}, "endpoints": {"GET /x": {"p95_ms": 11.0, "queries_mean": 6.0, "peak_mem_kb": 100.0}}}
+    assert e2e.compare(cur, base, tolerance=0.2) == ["GET /x queries_mean"]
@@ -0,0 +1,82 @@
+"""사용자별 canonical_url 블룸 필터(app/bloom.py) 테스트."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+
+from app.bloom import BloomFilter, url_filters
+from app.domains.content.service import ArticleIngestService
+from app.models import Keyword, User
+from app.settings import settings
+from tests.conftest import collected_item
+
+
+@pytest.fixture(autouse=True)
+def clean_filters():
+    url_filters.clear()
+    yield
+    url_filters.clear()
+
+
+def test_false_positive_rate_near_target():
+    flt = BloomFilter(capacity=5000, fp_rate=0.01)
+    for n in range(5000):
+        flt.add(f"https://a.example.com/{n}")
+    assert all(f"https://a.example.com/{n}" in flt for n in range(5000))
+    false_hits = sum(f"https://b.example.com/{n}" in flt for n in range(20000))
+    assert false_hits / 20000 < 0.02
+    assert flt.size_bytes < 7000  # 1% 기준 원소당 약 9.6비트
+    assert flt.estimated_fp_rate() == pytest.approx(0.01, abs=0.005)
+
+
+def test_ingest_skips_lookup_for_definitely_new_urls(db_engine, session):
+    """필터가 만들어진 뒤 새 URL 만 저장할 때는 존재 확인 SELECT 가 없고, id 는 INSERT ... RETURNING 으로 받는다."""
+    statements: list[str] = []
+    event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    def lookups() -> int:
+        return sum(1 for s in statements if s.startswith("SELECT article.id, article.canonical_url"))
+
+    user = User(email="bloom@test.com", password_hash="x")
+    session.add(user)
+    kw = Keyword(user_id=user.id, text="kw")
+    session.add(kw)
+    session.commit()
+    user_id, kw_id = user.id, kw.id
+
+    ArticleIngestService.ingest(session, user_id, "2026-01-02", [(kw_id, [collected_item(f"news {n}") for n in range(50)])])
+
+    statements.clear()
+    result = ArticleIngestService.ingest(session, user_id, "2026-01-02", [(kw_id, [collected_item(f"news {n}") for n in range(50, 100)])])
+    assert result.inserted == 50
+    assert lookups() == 0
+    inserts = [s for s in statements if s.startswith("INSERT INTO article ")]
+    assert len(inserts) == 1 and "RETURNING" in inserts[0]
+
+    statements.clear()
+    again = ArticleIngestService.ingest(session, user_id, "2026-01-02", [(kw_id, [collected_item(f"news {n}") for n in range(100)])])
+    assert again.inserted == 0 and again.linked == 100
+    assert lookups() == 1
+
+    stats = url_filters.stats()
+    assert stats["users"] == 1
+    assert stats["builds"] == 1
+    assert stats["definitely_new"] >= 100
+    assert stats["probable_hits"] - stats["false_positives"] == 100
+    assert stats["memory_bytes"] > 0
+
+
+def test_saturated_filter_rebuilds_with_more_capacity(monkeypatch, session):
+    monkeypatch.setattr(settings, "url_bloom_min_capacity", 16)
+    user = User(email="grow@test.com", password_hash="x")
+    session.add(user)
+    kw = Keyword(user_id=user.id, text="kw")
+    session.add(kw)
+    session.commit()
+    user_id, kw_id = user.id, kw.id
+
+    # 최소 용량 16 을 넘겨 저장 → 다음 조회 때 두 배 이상 용량으로 다시 만든다
+    ArticleIngestService.ingest(session, user_id, "2026-01-02", [(kw_id, [collected_item(f"news {n}") for n in range(40)])])
+    flt = url_filters.get(session, user_id)
+    assert flt.capacity >= 80
+    assert url_filters.stats()["builds"] == 2
@@ -0,0 +1,445 @@
+"""수집(Collect) 엔드포인트 E2E 테스트.
+
+커버리지:
+  POST   /collect
+  POST   /collect/stream
+  GET    /collect/metrics
+  POST   /process (anti-join·일괄 저장)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import col, delete, func, select
+
+from app import collect as collect_mod
+from app.domains.content.service import ArticleIngestService, ProcessService
+from app.fetch_cache import FetchCache, fetch_cache
+from app.models import Article, ArticleKeyword, CollectWatermark, Keyword, ProcessingResult, User
+from app.settings import settings
+from app.sources import source_registry
+from tests.conftest import collected_item
+
+
+# ---------------------------------------------------------------------------
+# 헬퍼
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def mock_collector(monkeypatch):
+    """외부 호출 없이 mock 수집기를 사용."""
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    source_registry.reset()
+    yield
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+def _use_fake_upstreams(monkeypatch, gdelt, rss=None) -> None:
+    """live 소스(GDELT → RSS)를 쓰되 업스트림 호출은 가짜 함수로."""
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    monkeypatch.setattr(collect_mod, "search_gdelt", gdelt)
+    if rss is not None:
+        monkeypatch.setattr(collect_mod, "rss_google_news", rss)
+
+
+def _create_keyword(client: TestClient, headers: dict, text: str) -> dict:
+    resp = client.post("/keywords", json={"text": text, "is_active": True}, headers=headers)
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+# ---------------------------------------------------------------------------
+# POST /collect
+# ---------------------------------------------------------------------------
+
+
+def test_collect_requires_auth(client: TestClient):
+    """토큰 없이 POST /collect → 401."""
+    resp = client.post("/collect")
+    assert resp.status_code == 401
+
+
+def test_collect_counts(client: TestClient, auth_headers: dict):
+    """mock 수집: 키워드마다 GDELT 1건, force_rss 키워드는 RSS 폴백."""
+    _create_keyword(client, auth_headers, "삼성전자")
+    _create_keyword(client, auth_headers, "force_rss")
+
+    resp = client.post("/collect?date_kst=2026-01-02", headers=auth_headers)
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["date_kst"] == "2026-01-02"
+    assert body["keywords_processed"] == 2
+    assert body["search_items"] == 1
+    assert body["rss_items"] == 1
+    # mock URL은 키워드와 무관하게 고정이므로 소스별 1건만 새로 저장
+    assert body["inserted_articles"] == 2
+    assert body["linked_existing_articles"] == 0
+
+    # 재수집: 키워드별 기준점에 있는 URL은 DB 조회 없이 건너뜀
+    again = client.post("/collect?date_kst=2026-01-02", headers=auth_headers).json()
+    assert again["inserted_articles"] == 0
+    assert again["linked_existing_articles"] == 0
+    assert again["skipped_seen"] == 2
+    # force_rss 는 공유 캐시에서 응답(gdelt 빈 결과 + rss), 삼성전자는 증분 구간으로 새로 조회
+    assert again["fetch_cache_hits"] == 2
+    assert again["fetch_cache_misses"] == 1
+
+
+def test_collect_invalid_date(client: TestClient, auth_headers: dict):
+    """잘못된 날짜 형식 → 400."""
+    resp = client.post("/collect?date_kst=2026/01/02", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# POST /collect/stream
+# ---------------------------------------------------------------------------
+
+
+def test_collect_stream_emits_keyword_records_then_summary(client: TestClient, auth_headers: dict, monkeypatch):
+    """키워드가 끝나는 순서대로 한 줄씩, 마지막 줄은 POST /collect 와 같은 요약."""
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        await asyncio.sleep(0.1 if keyword == "slow" else 0)
+        return [] if keyword == "force_rss" else [collected_item(f"{keyword} {n}") for n in range(3)]
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return [collected_item(f"{keyword} 0", source_type="rss")]
+
+    _use_fake_upstreams(monkeypatch, fake_gdelt, fake_rss)
+    _create_keyword(client, auth_headers, "slow")
+    _create_keyword(client, auth_headers, "fast")
+    _create_keyword(client, auth_headers, "force_rss")
+
+    with client.stream("POST", "/collect/stream?date_kst=2026-01-02", headers=auth_headers) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in resp.iter_lines() if line]
+
+    assert [r["type"] for r in records] == ["keyword", "keyword", "keyword", "summary"]
+    assert records[2]["keyword"] == "slow"
+    by_kw = {r["keyword"]: r for r in records[:3]}
+    assert by_kw["fast"]["source"] == "gdelt"
+    assert by_kw["fast"]["items_found"] == 3 and by_kw["fast"]["inserted"] == 3
+    assert by_kw["force_rss"]["source"] == "rss"
+    summary = records[-1]
+    assert summary["keywords_processed"] == 3
+    assert summary["inserted_articles"] == sum(r["inserted"] for r in records[:3]) == 7
+
+    # 스트리밍으로 저장한 결과는 일반 수집과 같은 기준점을 공유
+    again = client.post("/collect?date_kst=2026-01-02", headers=auth_headers).json()
+    assert again["inserted_articles"] == 0
+    assert again["skipped_seen"] == 7
+
+
+# ---------------------------------------------------------------------------
+# 동시 수집 엔진
+# ---------------------------------------------------------------------------
+
+
+def test_collect_keywords_runs_concurrently(monkeypatch):
+    """키워드별 수집이 병렬 실행되어 전체 시간이 가장 느린 키워드에 수렴."""
+    monkeypatch.setattr(settings, "collect_max_concurrency", 16)
+    monkeypatch.setattr(settings, "collect_gdelt_concurrency", 16)
+    in_flight = 0
+    peak = 0
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return [collected_item(f"{keyword} 1")]
+
+    _use_fake_upstreams(monkeypatch, fake_gdelt)
+    keywords = [f"kw{i}" for i in range(10)]
+
+    started = time.perf_counter()
+    results = asyncio.run(collect_mod.collect_keywords(keywords, date(2026, 1, 2)))
+    elapsed = time.perf_counter() - started
+
+    assert [r.keyword for r in results] == keywords
+    assert all(r.search_items == 1 and not r.used_rss for r in results)
+    assert peak == 10
+    assert elapsed < 0.3
+
+
+def test_keyword_limit_shared_across_concurrent_collects(monkeypatch):
+    """동시 키워드 한도는 수집 호출마다가 아니라 프로세스 전체에 적용된다."""
+    monkeypatch.setattr(settings, "collect_max_concurrency", 2)
+    monkeypatch.setattr(settings, "collect_gdelt_concurrency", 16)
+    monkeypatch.setattr(settings, "gdelt_batch_enabled", False)
+    in_flight = 0
+    peak = 0
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [collected_item(f"{keyword} 1")]
+
+    _use_fake_upstreams(monkeypatch, fake_gdelt)
+
+    async def _two_users():
+        return await asyncio.gather(
+            collect_mod.collect_keywords([f"a{i}" for i in range(4)], date(2026, 1, 2)),
+            collect_mod.collect_keywords([f"b{i}" for i in range(4)], date(2026, 1, 2)),
+        )
+
+    first, second = asyncio.run(_two_users())
+    assert peak == 2
+    assert all(r.search_items == 1 for r in first + second)
+
+
+def test_collect_keywords_respects_source_cap(monkeypatch):
+    """소스별 동시 요청 한도를 넘지 않음. 빈 결과는 RSS로 폴백."""
+    monkeypatch.setattr(settings, "collect_max_concurrency", 16)
+    monkeypatch.setattr(settings, "collect_gdelt_concurrency", 2)
+    in_flight = 0
+    peak = 0
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return [collected_item(f"{keyword} 1", source_type="rss")]
+
+    _use_fake_upstreams(monkeypatch, fake_gdelt, fake_rss)
+
+    results = asyncio.run(collect_mod.collect_keywords([f"kw{i}" for i in range(6)], date(2026, 1, 2)))
+    assert peak <= 2
+    assert all(r.used_rss and r.rss_items == 1 for r in results)
+
+    # 동시에 도는 두 수집도 소스 한도를 나눠 쓴다
+    peak = 0
+
+    async def _two_users():
+        return await asyncio.gather(
+            collect_mod.collect_keywords([f"a{i}" for i in range(4)], date(2026, 1, 2)),
+            collect_mod.collect_keywords([f"b{i}" for i in range(4)], date(2026, 1, 2)),
+        )
+
+    asyncio.run(_two_users())
+    assert peak == 2
+
+
+# ---------------------------------------------------------------------------
+# 사용자 간 공유 수집 캐시
+# ---------------------------------------------------------------------------
+
+
+def test_fetch_cache_shared_across_users(client: TestClient, auth_headers: dict):
+    """다른 사용자가 같은 키워드(공백·대소문자 차이)를 수집하면 캐시 적중."""
+    _create_keyword(client, auth_headers, "AI")
+    first = client.post("/collect?date_kst=2026-01-02", headers=auth_headers).json()
+    assert first["fetch_cache_misses"] == 1
+
+    tok = client.post("/auth/signup", json={"email": "b@test.com", "password": "passB1234"}).json()["access_token"]
+    headers_b = {"Authorization": f"Bearer {tok}"}
+    _create_keyword(client, headers_b, "ai")
+    second = client.post("/collect?date_kst=2026-01-02", headers=headers_b).json()
+    assert second["fetch_cache_hits"] == 1
+    assert second["fetch_cache_misses"] == 0
+    assert second["inserted_articles"] == 1
+
+    stats = client.get("/collect/metrics", headers=headers_b).json()["fetch_cache"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_fetch_cache_single_flight_and_ttl():
+    """동시 동일 요청은 업스트림 1회, 예외는 캐시하지 않음, TTL 경과 시 재조회."""
+    cache = FetchCache(ttl_sec=60, max_entries=10)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["x"]
+
+    async def boom():
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        key = ("ai", "2026-01-02", "gdelt")
+        results = await asyncio.gather(*(cache.get_or_fetch(key, fetch) for _ in range(5)))
+        assert all(r == ["x"] for r, _hit in results)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch(("other", "2026-01-02", "gdelt"), boom)
+        cache.ttl_sec = 0.001
+        cache._put(key, ["x"])
+        await asyncio.sleep(0.01)
+        cache.ttl_sec = 60
+        await cache.get_or_fetch(key, fetch)
+
+    asyncio.run(scenario())
+    assert calls == 2
+    assert cache.hits == 4
+
+
+# ---------------------------------------------------------------------------
+# 일괄 저장
+# ---------------------------------------------------------------------------
+
+
+def test_bulk_ingest_statement_count(db_engine, session):
+    """30 키워드 × 25건 저장이 소수의 SQL 문으로 끝나고, 재실행은 모두 linked."""
+    statements: list[str] = []
+    event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    user = User(email="bulk@test.com", password_hash="x")
+    session.add(user)
+    kws = [Keyword(user_id=user.id, text=f"kw{i}") for i in range(30)]
+    session.add_all(kws)
+    session.commit()
+    user_id = user.id
+    # 키워드마다 25건, 그중 5건은 모든 키워드가 공유하는 기사
+    batches = [
+        (kw.id, [collected_item(f"kw{i} {n}") for n in range(20)] + [collected_item(f"shared {n}") for n in range(5)])
+        for i, kw in enumerate(kws)
+    ]
+
+    statements.clear()
+    result = ArticleIngestService.ingest(session, user_id, "2026-01-02", batches)
+    # 유사 기사 후보 조회는 지문 200개 단위 청크(605건 → 4회)
+    lookups = [s for s in statements if "simhash_b0 IN" in s]
+    assert len(lookups) <= 4
+    # URL 필터 생성 + Article INSERT ... RETURNING + ArticleKeyword + 리포트 버전 (저장 후 id 재조회 없음)
+    assert len(statements) - len(lookups) <= 4
+    assert result.inserted == 30 * 20 + 5
+    assert result.linked == 29 * 5
+    assert session.exec(select(func.count()).select_from(Article)).one() == 605
+    assert session.exec(select(func.count()).select_from(ArticleKeyword)).one() == 750
+
+    again = ArticleIngestService.ingest(session, user_id, "2026-01-02", batches)
+    assert again.inserted == 0
+    assert again.linked == 750
+    assert session.exec(select(func.count()).select_from(ArticleKeyword)).one() == 750
+
+
+def test_process_day_statement_count(db_engine, session):
+    """1,000건 처리: 집계·anti-join 조회 각 1번 + 묶음 INSERT. 처리된 기사·유사 기사 묶음 멤버는 건너뜀."""
+    statements: list[str] = []
+    event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    user = User(email="process@test.com", password_hash="x")
+    session.add(user)
+    articles = [
+        Article(
+            user_id=user.id,
+            date_kst="2026-01-02",
+            canonical_url=f"https://example.com/{n}",
+            original_url=f"https://example.com/{n}",
+            source_type="search_api",
+            title_original=f"news {n}",
+            language_original="en",
+        )
+        for n in range(1000)
+    ]
+    for a in articles[:50]:
+        a.cluster_id = articles[999].id  # 묶음 멤버
+    session.add_all(articles)
+    session.commit()
+    user_id = user.id
+    # 대표 기사 100건만 처리된 상태로 만든다
+    ProcessService.process_day(session, user_id, "2026-01-02")
+    session.exec(delete(ProcessingResult).where(col(ProcessingResult.article_id).in_([a.id for a in articles[50:900]])))
+    session.commit()
+
+    statements.clear()
+    summary = ProcessService.process_day(session, user_id, "2026-01-02")
+    assert summary.articles_total == 1000
+    assert summary.skipped_near_duplicates == 50
+    assert summary.skipped_existing == 100
+    assert summary.processed_new == 850
+    # 대기열 묶음(process_queue_chunk)마다 공용 처리 캐시(processingcache) 조회·저장 1번씩,
+    # 결과 INSERT 1번, 리포트 버전(reportversion) UPSERT 1번
+    chunks = -(-850 // settings.process_queue_chunk)
+    cache = [s for s in statements if "processingcache" in s]
+    assert len(cache) <= 2 * chunks
+    selects = [s for s in statements if s.startswith("SELECT") and s not in cache]
+    assert len(selects) == 2
+    assert len([s for s in statements if "reportversion" in s]) == chunks
+    assert len(statements) - len(cache) <= 2 * chunks + 5
+    assert session.exec(select(func.count()).select_from(ProcessingResult)).one() == 950
+
+    again = ProcessService.process_day(session, user_id, "2026-01-02")
+    assert again.processed_new == 0 and again.skipped_existing == 950
+
+
+# ---------------------------------------------------------------------------
+# 증분 수집 기준점
+# ---------------------------------------------------------------------------
+
+
+def test_watermark_narrows_gdelt_and_skips_seen(client: TestClient, auth_headers: dict, monkeypatch):
+    """두 번째 수집은 GDELT 조회 시작을 좁히고, 새 기사가 없으면 RSS 폴백 없이 끝남."""
+    published = datetime(2026, 1, 2, 3, 7, tzinfo=timezone.utc)
+    calls: list[datetime | None] = []
+    rss_calls = 0
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        calls.append(since)
+        if since is not None:
+            return []
+        return [collected_item(f"{keyword} 1", published_at=published)]
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        nonlocal rss_calls
+        rss_calls += 1
+        return []
+
+    _use_fake_upstreams(monkeypatch, fake_gdelt, fake_rss)
+    _create_keyword(client, auth_headers, "반도체")
+
+    first = client.post("/collect?date_kst=2026-01-02", headers=auth_headers).json()
+    assert first["inserted_articles"] == 1
+    second = client.post("/collect?date_kst=2026-01-02", headers=auth_headers).json()
+    assert second["inserted_articles"] == 0
+    assert second["search_items"] == 0
+
+    # 03:07 - 30분 overlap = 02:37 → 15분 버킷으로 내림 02:30
+    assert calls == [None, datetime(2026, 1, 2, 2, 30, tzinfo=timezone.utc)]
+    assert rss_calls == 0
+
+
+def test_keyword_delete_removes_watermarks(client: TestClient, auth_headers: dict, session, monkeypatch):
+    """워터마크는 키워드와 함께 지워진다 (Postgres 는 FK CASCADE, SQLite 는 서비스에서 직접)."""
+    fk = next(iter(CollectWatermark.__table__.c.keyword_id.foreign_keys))
+    assert fk.column.table.name == "keyword" and fk.ondelete == "CASCADE"
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        return [collected_item(f"{keyword} 1")]
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return []
+
+    _use_fake_upstreams(monkeypatch, fake_gdelt, fake_rss)
+    kept = _create_keyword(client, auth_headers, "반도체")
+    gone = _create_keyword(client, auth_headers, "배터리")
+    client.post("/collect?date_kst=2026-01-02", headers=auth_headers)
+
+    def marked() -> set[str]:
+        return {str(k) for k in session.exec(select(CollectWatermark.keyword_id)).all()}
+
+    assert marked() == {kept["id"], gone["id"]}
+    assert client.delete(f"/keywords/{gone['id']}", headers=auth_headers).status_code == 204
+    assert marked() == {kept["id"]}
@@ -0,0 +1,406 @@
+"""수집 소스(GDELT, Google News RSS)·소스 레지스트리 단위 테스트. 외부 호출 대신 httpx.MockTransport 사용."""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date, datetime, timezone
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+
+from app import collect as collect_mod
+from app.db import get_session
+from app.feed_cache import CachedFeed, DbFeedCache, FeedCache, FeedEntry, MemoryFeedCache, feed_cache
+from app.fetch_cache import fetch_cache
+from app.main import app
+from app.settings import settings
+from app.sources import RateLimiter, source_registry
+from tests.conftest import collected_item
+
+DAY = date(2026, 1, 2)
+# 2026-01-02 KST 정오 = 03:00 UTC
+PUB = "Fri, 02 Jan 2026 03:00:00 GMT"
+
+
+def _rss(*titles: str) -> str:
+    items = "".join(
+        f"<item><title>{t}</title><link>https://news.example.com/{i}?utm_source=x</link>"
+        f"<pubDate>{PUB}</pubDate><description>{t} summary</description></item>"
+        for i, t in enumerate(titles)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'
+
+
+@pytest.fixture(autouse=True)
+def live_collector(monkeypatch):
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    feed_cache.clear()
+    yield
+    feed_cache.clear()
+
+
+def _use_transport(monkeypatch, handler) -> None:
+    monkeypatch.setattr(
+        collect_mod.http_clients,
+        "async_client",
+        lambda _url: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+# ---------------------------------------------------------------------------
+# RSS 조건부 GET
+# ---------------------------------------------------------------------------
+
+
+def test_rss_conditional_get_reuses_entries(monkeypatch):
+    """두 번째 호출은 If-None-Match를 보내고 304 응답 시 재파싱 없이 캐시 항목 사용."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        etag = f'"{request.url.params["hl"]}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, text=_rss("Alpha", "Beta"), headers={"ETag": etag})
+
+    _use_transport(monkeypatch, handler)
+    parses = 0
+    real_parse = collect_mod._parse_feed_entries
+
+    def counting_parse(text: str):
+        nonlocal parses
+        parses += 1
+        return real_parse(text)
+
+    monkeypatch.setattr(collect_mod, "_parse_feed_entries", counting_parse)
+
+    first = asyncio.run(collect_mod.rss_google_news(keyword="AI", day=DAY))
+    second = asyncio.run(collect_mod.rss_google_news(keyword="AI", day=DAY))
+
+    assert [it.title for it in first] == ["Alpha", "Beta"]
+    assert [it.canonical_url for it in first] == ["https://news.example.com/0", "https://news.example.com/1"]
+    assert second == first
+    assert parses == 2  # ko/en 피드 각 1회, 304 이후에는 재파싱 없음
+    assert all("If-None-Match" in r.headers for r in requests[2:])
+    assert feed_cache.stats()["not_modified"] == 2
+
+
+def test_memory_feed_cache_lru_bound():
+    """피드 URL 기준 LRU: 한도를 넘으면 가장 오래 안 쓴 항목 제거."""
+    cache = MemoryFeedCache(max_entries=2)
+    feed = CachedFeed(etag='"x"', last_modified=None, entries=())
+    cache.put("a", feed)
+    cache.put("b", feed)
+    assert cache.get("a") is feed
+    cache.put("c", feed)
+    assert cache.get("b") is None
+    assert cache.get("a") is feed and cache.get("c") is feed
+
+
+def test_db_feed_cache_shared_between_instances(db_engine):
+    """db 백엔드: 다른 FeedCache 인스턴스(워커)도 같은 validator·항목을 읽음."""
+    entry = FeedEntry(
+        link="https://news.example.com/0",
+        title="Alpha",
+        summary=None,
+        published_at=datetime(2026, 1, 2, 3, tzinfo=timezone.utc),
+    )
+    worker_a = FeedCache(max_entries=8, shared=DbFeedCache(db_engine))
+    worker_b = FeedCache(max_entries=8, shared=DbFeedCache(db_engine))
+    worker_a.put("https://feed", CachedFeed(etag='"v1"', last_modified="Fri, 02 Jan 2026 03:00:00 GMT", entries=(entry,)))
+    assert worker_b.get("https://feed") is None  # 저장은 실행이 끝날 때 한 번에
+    asyncio.run(worker_a.flush())
+    asyncio.run(worker_b.preload(["https://feed", "https://other"]))
+
+    got = worker_b.get("https://feed")
+    assert got is not None
+    assert got.validator_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Fri, 02 Jan 2026 03:00:00 GMT",
+    }
+    assert got.entries == (entry,)
+
+
+def test_db_feed_cache_inside_collect_request(tmp_path, monkeypatch):
+    """db 백엔드를 POST /collect 안에서: 커넥션 1개 풀을 요청 세션과 같이 써도 막히지 않고,
+    메모리 캐시가 비어도 두 번째 수집은 DB 의 validator 로 304 를 받음."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'feeds.db'}", pool_size=1, max_overflow=0, pool_timeout=2)
+    SQLModel.metadata.create_all(engine)
+
+    def override_session():
+        with Session(engine) as session:
+            yield session
+
+    shared = FeedCache(max_entries=8, shared=DbFeedCache(engine))
+    monkeypatch.setattr(collect_mod, "feed_cache", shared)
+    monkeypatch.setitem(app.dependency_overrides, get_session, override_session)
+
+    async def no_gdelt(**kwargs):
+        return []
+
+    monkeypatch.setattr(collect_mod, "search_gdelt", no_gdelt)
+    fetch_cache.clear()
+    source_registry.reset()
+    statuses: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        etag = f'"{request.url.params["hl"]}-v1"'
+        status = 304 if request.headers.get("If-None-Match") == etag else 200
+        statuses.append(status)
+        if status == 304:
+            return httpx.Response(304)
+        return httpx.Response(200, text=_rss("Alpha", "Beta"), headers={"ETag": etag})
+
+    _use_transport(monkeypatch, handler)
+    client = TestClient(app)
+    token = client.post("/auth/signup", json={"email": "feeds@test.com", "password": "testpass123"}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    client.post("/keywords", json={"text": "AI", "is_active": True}, headers=headers)
+
+    started = time.monotonic()
+    first = client.post("/collect", params={"date_kst": DAY.isoformat()}, headers=headers)
+    shared.memory.clear()  # 다른 워커처럼 메모리 캐시 없이
+    fetch_cache.clear()
+    second = client.post("/collect", params={"date_kst": DAY.isoformat()}, headers=headers)
+    assert time.monotonic() - started < 2
+    assert first.status_code == second.status_code == 200
+    assert first.json()["rss_items"] == 2
+    assert statuses == [200, 200, 304, 304]
+    fetch_cache.clear()
+    source_registry.reset()
+    engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# RSS 로케일 병렬 수집
+# ---------------------------------------------------------------------------
+
+
+def test_rss_locales_fetched_concurrently(monkeypatch):
+    """설정된 로케일(ja 추가)을 동시에 받아 로케일 순서대로 병합·dedup."""
+    monkeypatch.setattr(settings, "rss_locales", "ko:KR, en:US, ja:jp")
+    seen_ceids: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen_ceids.append(request.url.params["ceid"])
+        await asyncio.sleep(0.1)
+        hl = request.url.params["hl"]
+        # 모든 로케일에 공통 기사(Shared, link 0)가 있고, 로케일 고유 기사가 하나씩
+        return httpx.Response(200, text=_rss("Shared", f"Only-{hl}"))
+
+    _use_transport(monkeypatch, handler)
+
+    started = time.perf_counter()
+    items = asyncio.run(collect_mod.rss_google_news(keyword="AI", day=DAY))
+    elapsed = time.perf_counter() - started
+
+    assert sorted(seen_ceids) == ["JP:ja", "KR:ko", "US:en"]
+    assert elapsed < 0.25
+    # link 1은 로케일마다 같은 URL이므로 첫 로케일(ko) 것만 남는다
+    assert [it.title for it in items] == ["Shared", "Only-ko"]
+
+
+# ---------------------------------------------------------------------------
+# 소스 레지스트리·서킷 브레이커
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def fresh_sources():
+    fetch_cache.clear()
+    source_registry.reset()
+    yield
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+def test_registry_chain_by_mode():
+    assert [s.name for s in source_registry.chain("live")] == ["gdelt", "rss"]
+    assert [s.name for s in source_registry.chain("mock")] == ["mock_search", "mock_rss"]
+
+
+def test_breaker_skips_failing_source_until_probe_succeeds(monkeypatch, fresh_sources):
+    """GDELT 가 연속 실패하면 호출을 멈추고 곧장 RSS 로, 쿨다운 뒤 시험 요청 성공 시 복구."""
+    monkeypatch.setattr(settings, "source_breaker_failures", 3)
+    monkeypatch.setattr(settings, "source_breaker_cooldown_sec", 0.2)
+    gdelt_calls = 0
+    gdelt_down = True
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        nonlocal gdelt_calls
+        gdelt_calls += 1
+        if gdelt_down:
+            raise httpx.ConnectTimeout("down")
+        return [collected_item(f"{keyword} via gdelt")]
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return [collected_item(f"{keyword} via rss", source_type="rss")]
+
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    monkeypatch.setattr(collect_mod, "rss_google_news", fake_rss)
+
+    results = asyncio.run(collect_mod.collect_keywords([f"kw{i}" for i in range(8)], DAY))
+    assert all(r.used_rss and r.rss_items == 1 for r in results)
+    assert gdelt_calls <= settings.collect_gdelt_concurrency + 3  # 열린 뒤로는 호출 안 함
+    assert source_registry.get("gdelt").breaker.state == "open"
+
+    gdelt_down = False
+    time.sleep(0.25)
+    fetch_cache.clear()
+    results = asyncio.run(collect_mod.collect_keywords(["after"], DAY))
+    assert results[0].search_items == 1 and not results[0].used_rss
+    assert source_registry.get("gdelt").breaker.state == "closed"
+
+
+def test_query_errors_do_not_open_breaker(monkeypatch, fresh_sources):
+    """키워드 하나에 대한 파싱·쿼리 오류(비 JSON 응답, 4xx)는 소스 장애로 세지 않는다."""
+    monkeypatch.setattr(settings, "source_breaker_failures", 2)
+    monkeypatch.setattr(settings, "gdelt_batch_enabled", False)
+
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        request = httpx.Request("GET", "https://api.gdeltproject.org/api/v2/doc/doc")
+        if keyword.startswith("short"):
+            raise ValueError("Expecting value: line 1 column 1 (char 0)")  # 오류 문구가 온 응답의 r.json()
+        if keyword.startswith("bad"):
+            raise httpx.HTTPStatusError("400", request=request, response=httpx.Response(400, request=request))
+        raise httpx.HTTPStatusError("503", request=request, response=httpx.Response(503, request=request))
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return [collected_item(f"{keyword} via rss", source_type="rss")]
+
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    monkeypatch.setattr(collect_mod, "rss_google_news", fake_rss)
+    breaker = source_registry.get("gdelt").breaker
+
+    results = asyncio.run(collect_mod.collect_keywords([f"short{i}" for i in range(3)] + ["bad1", "bad2"], DAY))
+    assert all(r.used_rss for r in results)
+    assert breaker.state == "closed" and breaker.failures == 0
+
+    fetch_cache.clear()
+    asyncio.run(collect_mod.collect_keywords(["down1", "down2"], DAY))
+    assert breaker.state == "open"
+
+
+def test_cancelled_probe_reopens_breaker(monkeypatch, fresh_sources):
+    """half-open 시험 요청이 취소되면 half_open 에 머물지 않고 다시 열려, 쿨다운 뒤 새 시험 요청을 받는다."""
+    monkeypatch.setattr(settings, "source_breaker_failures", 1)
+    monkeypatch.setattr(settings, "source_breaker_cooldown_sec", 0.05)
+    breaker = source_registry.get("gdelt").breaker
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    async def probe_cancelled() -> None:
+        task = asyncio.ensure_future(breaker.call("gdelt", lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0.01)
+        assert breaker.state == "half_open"
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(probe_cancelled())
+    assert breaker.state == "open" and breaker.failures == 1
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == "half_open"
+
+
+def test_rate_limiter_spaces_requests_beyond_burst():
+    limiter = RateLimiter(rate_per_sec=50, burst=2)
+
+    async def run() -> float:
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+        return time.perf_counter() - started
+
+    # 버킷 2개는 즉시, 나머지 4개는 1/50초 간격
+    assert 0.07 <= asyncio.run(run()) < 0.2
+
+
+# ---------------------------------------------------------------------------
+# GDELT 묶음 조회
+# ---------------------------------------------------------------------------
+
+
+def test_keyword_matcher_demultiplexes_overlapping_keywords():
+    matcher = collect_mod.KeywordMatcher(["삼성", "삼성전자", "AI chip", "Nvidia"])
+    assert matcher.match("삼성전자, 새 AI 반도체 chip 공개") == ["삼성", "삼성전자", "AI chip"]
+    assert matcher.match("NVIDIA earnings beat") == ["Nvidia"]
+    assert matcher.match("AI 규제 법안") == []
+
+
+def test_pack_gdelt_batches_respects_limits():
+    batches = collect_mod.pack_gdelt_batches([f"keyword{i}" for i in range(30)], max_keywords=10, max_chars=60)
+    assert all(len(collect_mod.gdelt_or_query(b)) <= 60 and len(b) <= 10 for b in batches)
+    assert [kw for b in batches for kw in b] == [f"keyword{i}" for i in range(30)]
+    assert collect_mod.gdelt_or_query(["a b", 'c"']) == '("a b" OR c)'
+
+
+def test_gdelt_batch_mode_cuts_upstream_requests(monkeypatch, fresh_sources):
+    """짧은 키워드 20개 → OR 식 2번 요청, 결과는 제목 매칭으로 키워드별 배정."""
+    monkeypatch.setattr(settings, "gdelt_batch_enabled", True)
+    monkeypatch.setattr(settings, "gdelt_batch_max_keywords", 10)
+    queries: list[str] = []
+
+    async def fake_articles(query: str, day: date, max_records: int, since):
+        queries.append(query)
+        terms = query.strip("()").split(" OR ")
+        # 키워드마다 제목에 키워드가 든 기사 1건 + 어느 키워드와도 안 맞는 기사 1건
+        return [collected_item(f"{t} via gdelt") for t in terms] + [collected_item("unrelated via gdelt")]
+
+    monkeypatch.setattr(collect_mod, "_gdelt_articles", fake_articles)
+    keywords = [f"kw{i:02d}" for i in range(20)]
+    results = asyncio.run(collect_mod.collect_keywords(keywords, DAY))
+
+    assert len(queries) == 2
+    assert queries[0].startswith("(kw00 OR kw01")
+    for kw, r in zip(keywords, results):
+        assert [it.title for it in r.items] == [f"{kw} via gdelt"]
+        assert not r.used_rss
+
+
+def test_gdelt_batch_results_cached_apart_from_single_fetch(monkeypatch, fresh_sources):
+    """묶음 조회를 나눈 결과는 단독 조회 캐시 키와 섞이지 않는다."""
+    monkeypatch.setattr(settings, "gdelt_batch_enabled", True)
+    monkeypatch.setattr(settings, "gdelt_batch_max_keywords", 10)
+    queries: list[str] = []
+
+    async def fake_articles(query: str, day: date, max_records: int, since):
+        queries.append(query)
+        return [collected_item(f"{t} via gdelt") for t in query.strip("()").split(" OR ")]
+
+    monkeypatch.setattr(collect_mod, "_gdelt_articles", fake_articles)
+    asyncio.run(collect_mod.collect_keywords(["kw00", "kw01"], DAY))
+    assert queries == ["(kw00 OR kw01)"]
+
+    # 같은 묶음을 다시 수집하면 캐시 적중, 단독 조회는 따로 요청
+    again = asyncio.run(collect_mod.collect_keywords(["kw00", "kw01"], DAY))
+    assert all(r.cache_hits == 1 for r in again)
+    single = asyncio.run(collect_mod.collect_keywords(["kw00"], DAY))
+    assert queries == ["(kw00 OR kw01)", "kw00"]
+    assert single[0].cache_misses == 1
+
+
+def test_failed_gdelt_batch_counts_one_breaker_failure(monkeypatch, fresh_sources):
+    """묶음 요청 하나가 실패하면 기다리던 키워드 수와 관계없이 브레이커 실패 1번."""
+    monkeypatch.setattr(settings, "gdelt_batch_enabled", True)
+    monkeypatch.setattr(settings, "gdelt_batch_max_keywords", 10)
+    monkeypatch.setattr(settings, "source_breaker_failures", 3)
+    queries: list[str] = []
+
+    async def failing_articles(query: str, day: date, max_records: int, since):
+        queries.append(query)
+        raise httpx.ConnectTimeout("down")
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return [collected_item(f"{keyword} via rss", source_type="rss")]
+
+    monkeypatch.setattr(collect_mod, "_gdelt_articles", failing_articles)
+    monkeypatch.setattr(collect_mod, "rss_google_news", fake_rss)
+    results = asyncio.run(collect_mod.collect_keywords([f"kw{i:02d}" for i in range(8)], DAY))
+
+    assert len(queries) == 1
+    assert all(r.used_rss and r.rss_items == 1 for r in results)
+    breaker = source_registry.get("gdelt").breaker
+    assert breaker.failures == 1 and breaker.state == "closed"
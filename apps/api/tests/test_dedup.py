@@ -0,0 +1,89 @@
+"""유사(신디케이션) 기사 묶기 테스트.
+
+커버리지:
+  app/domains/content/dedup.py
+  POST   /collect, POST /process, GET /report (묶음 처리·접기)
+"""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import collect as collect_mod
+from app.domains.content.dedup import bands, hamming, normalize_text, simhash
+from app.fetch_cache import fetch_cache
+from app.settings import settings
+from tests.conftest import collected_item
+
+SYNDICATED = [
+    ("https://a.example.com/1", "Samsung unveils new foldable phone at Seoul event - Yonhap"),
+    ("https://b.example.com/2", "Samsung unveils new foldable phone at Seoul event - Reuters"),
+    ("https://c.example.com/3", "Samsung unveils new foldable phone at Seoul event!"),
+]
+OTHER = ("https://d.example.com/4", "Bank of Korea holds interest rate steady")
+
+
+@pytest.fixture(autouse=True)
+def mock_collector(monkeypatch):
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    yield
+    fetch_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# 지문
+# ---------------------------------------------------------------------------
+
+
+def test_normalize_strips_publisher_suffix():
+    assert normalize_text("Hello World - Yonhap") == normalize_text("hello, world!")
+    # 짧은 제목은 요약문으로 보강
+    assert normalize_text("속보", "<b>코스피</b> 급등") == "속보 코스피 급등"
+
+
+def test_syndicated_titles_within_band_distance():
+    """같은 기사 변형은 해밍 거리 3 이하 → 적어도 한 밴드 일치, 다른 기사는 멀다."""
+    fps = [simhash(normalize_text(t)) for _, t in SYNDICATED]
+    other = simhash(normalize_text(OTHER[1]))
+    for fp in fps[1:]:
+        assert hamming(fps[0], fp) <= 3
+        assert set(enumerate(bands(fps[0]))) & set(enumerate(bands(fp)))
+    assert hamming(fps[0], other) > 10
+
+
+# ---------------------------------------------------------------------------
+# 수집 → 처리 → 리포트
+# ---------------------------------------------------------------------------
+
+
+def test_near_duplicates_processed_once_and_collapsed(client: TestClient, auth_headers: dict, monkeypatch):
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        return [collected_item(title, url=url) for url, title in [*SYNDICATED, OTHER]]
+
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    resp = client.post("/keywords", json={"text": "삼성", "is_active": True}, headers=auth_headers)
+    assert resp.status_code == 201, resp.text
+
+    collected = client.post("/collect", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert collected["inserted_articles"] == 4
+    assert collected["near_duplicates"] == 2
+
+    processed = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert processed["processed_new"] == 2
+    assert processed["skipped_near_duplicates"] == 2
+
+    report = client.get("/report", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert report["total_articles"] == 2
+    by_count = sorted(report["items"], key=lambda it: it["similar_count"])
+    assert [it["similar_count"] for it in by_count] == [0, 2]
+    assert all(it["summary_ko"] for it in report["items"])  # 묶음 대표 결과 공유
+
+    expanded = client.get(
+        "/report", params={"date_kst": "2026-01-02", "collapse": "false"}, headers=auth_headers
+    ).json()
+    assert expanded["total_articles"] == 4
+    assert all(it["summary_ko"] for it in expanded["items"])
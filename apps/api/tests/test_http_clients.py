@@ -0,0 +1,35 @@
+"""공용 HTTP 클라이언트 레지스트리 단위 테스트."""
+from __future__ import annotations
+
+import asyncio
+
+from app.http_clients import DEFAULT_HOST_CONFIG, HostConfig, HttpClientRegistry
+
+
+def test_sync_client_reused_per_host():
+    """같은 호스트는 같은 클라이언트, 다른 호스트는 별도 클라이언트."""
+    reg = HttpClientRegistry({"a.example": HostConfig(timeout=5.0, max_connections=2)})
+    try:
+        c1 = reg.sync_client("https://a.example/x?y=1")
+        assert reg.sync_client("https://a.example/other") is c1
+        assert reg.sync_client("https://b.example/") is not c1
+        assert c1.timeout.read == 5.0
+        assert reg.config_for("b.example") == DEFAULT_HOST_CONFIG
+    finally:
+        reg.close()
+    assert c1.is_closed
+
+
+def test_async_client_rebuilt_per_event_loop():
+    """루프 안에서는 재사용, 이벤트 루프가 바뀌면 새 클라이언트."""
+    reg = HttpClientRegistry()
+
+    async def get_pair():
+        return reg.async_client("https://a.example/"), reg.async_client("https://a.example/z")
+
+    first, same = asyncio.run(get_pair())
+    assert first is same
+    second, _ = asyncio.run(get_pair())
+    assert second is not first
+
+    asyncio.run(reg.aclose())
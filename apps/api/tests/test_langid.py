@@ -0,0 +1,71 @@
+"""오프라인 언어 판별(app/langid.py) 테스트.
+
+커버리지:
+  detect_languages (번들 모델)
+  POST   /collect → POST /process (RSS 한국어 기사는 번역하지 않음)
+"""
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app import collect as collect_mod
+from app.fetch_cache import fetch_cache
+from app.langid import detect_languages, get_identifier
+from app.settings import settings
+from app.sources import source_registry
+from tests.conftest import collected_item
+
+LABELLED = [
+    ("ko", "삼성전자, 2분기 영업이익 10조 돌파"),
+    ("ko", "SK하이닉스 HBM 공급 확대"),
+    ("ko", "OpenAI CEO 방한"),
+    ("ko", "Microsoft 365 Copilot 국내 출시"),
+    ("en", "Samsung posts record quarterly profit"),
+    ("en", "Nvidia CEO Jensen Huang to visit Seoul"),
+    ("en", "Kospi ends lower on chip selloff"),
+    ("ja", "ソニー、新型PS発表"),
+    ("ja", "日銀、金融緩和を維持"),
+    ("zh", "英伟达发布新款芯片"),
+    ("fr", "Le chômage recule en France"),
+    ("de", "Die Börse schließt im Plus"),
+    ("es", "La inflación baja en octubre"),
+]
+
+
+def test_detects_bundled_languages():
+    assert set(get_identifier().langs) == {"de", "en", "es", "fr", "ja", "ko", "zh"}
+    got = detect_languages([text for _, text in LABELLED])
+    assert got == [lang for lang, _ in LABELLED]
+
+
+def test_no_letters_is_unknown():
+    assert detect_languages(["", None, "123 456", "!!!"]) == [None, None, None, None]
+
+
+def test_rss_korean_items_not_translated(client: TestClient, auth_headers: dict, monkeypatch):
+    async def fake_gdelt(*, keyword: str, day: date, max_records: int = 25, since=None):
+        return []
+
+    async def fake_rss(*, keyword: str, day: date, max_records: int = 25):
+        return [
+            collected_item(title, url=f"https://news.example.com/{n}", source_type="rss", language=None)
+            for n, title in enumerate(["반도체 수출 석 달 연속 증가", "Chip exports rise for third month"])
+        ]
+
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    monkeypatch.setattr(collect_mod, "rss_google_news", fake_rss)
+    fetch_cache.clear()
+    source_registry.reset()
+    client.post("/keywords", json={"text": "반도체", "is_active": True}, headers=auth_headers)
+    client.post("/collect", params={"date_kst": "2026-01-02"}, headers=auth_headers)
+
+    body = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert body["translated_new"] == 1
+    report = client.get("/report", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    statuses = {it["title"]: it["translation_status"] for it in report["items"]}
+    assert statuses == {"반도체 수출 석 달 연속 증가": "not_needed", "Chip exports rise for third month": "completed"}
+    fetch_cache.clear()
+    source_registry.reset()
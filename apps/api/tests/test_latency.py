@@ -0,0 +1,170 @@
+"""지연 인지 요청 계층(app/latency.py) 테스트. 로컬 느린 스텁(httpx.MockTransport) 사용."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.latency import LatencyTracker, backoff_delay, latency_tracker, resilient_get
+from app.settings import settings
+
+URL = "https://stub.local/api"
+FAST = 0.002
+SLOW = 0.2
+
+
+@pytest.fixture(autouse=True)
+def clean_tracker():
+    latency_tracker.clear()
+    yield
+    latency_tracker.clear()
+
+
+def _tail_stub() -> httpx.AsyncClient:
+    """요청 25개 중 1개(4%)만 느린 업스트림. p95 는 빠르고 p99 는 느리다."""
+    n = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal n
+        n += 1
+        await asyncio.sleep(SLOW if n % 25 == 0 else FAST)
+        return httpx.Response(200, json={"ok": True})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _p99(samples: list[float]) -> float:
+    return sorted(samples)[int(0.99 * (len(samples) - 1))]
+
+
+async def _measure(hedge: bool, requests: int = 100) -> list[float]:
+    durations: list[float] = []
+    async with _tail_stub() as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            if hedge:
+                resp = await resilient_get(client, URL, upstream="stub")
+            else:
+                resp = await client.get(URL)
+            assert resp.status_code == 200
+            durations.append(time.perf_counter() - started)
+    return durations
+
+
+# ---------------------------------------------------------------------------
+# hedge
+# ---------------------------------------------------------------------------
+
+
+def test_hedging_cuts_p99_on_slow_stub():
+    """느린 4% 요청은 p95 후 보낸 두 번째 요청이 대신 응답 → p99 가 크게 준다."""
+    baseline = asyncio.run(_measure(hedge=False))
+    hedged = asyncio.run(_measure(hedge=True))
+
+    assert _p99(baseline) >= SLOW
+    assert _p99(hedged) < SLOW / 2
+    stats = latency_tracker.stats()["stub"]
+    assert stats["hedged"] >= 2
+    assert stats["hedge_wins"] >= 2
+
+
+# ---------------------------------------------------------------------------
+# 타임아웃·재시도
+# ---------------------------------------------------------------------------
+
+
+def test_timeout_follows_p95_within_bounds(monkeypatch):
+    monkeypatch.setattr(settings, "latency_min_samples", 5)
+    tracker = LatencyTracker(window=10)
+    assert tracker.timeout_for("x", 30.0) == 30.0  # 표본 부족 → 기본값
+    for _ in range(10):
+        tracker.record("x", 1.5)
+    assert tracker.timeout_for("x", 30.0) == pytest.approx(1.5 * settings.latency_timeout_multiplier)
+    for _ in range(10):
+        tracker.record("x", 0.01)
+    assert tracker.timeout_for("x", 30.0) == settings.latency_min_timeout_sec
+
+
+def test_retries_5xx_and_429_with_backoff(monkeypatch):
+    """503 → 429 → 200: 두 번 재시도 후 성공."""
+    monkeypatch.setattr(settings, "latency_backoff_base_sec", 0.0)
+    statuses = iter([503, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+    async def run() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await resilient_get(client, URL, upstream="stub")
+
+    assert asyncio.run(run()).status_code == 200
+    assert latency_tracker.stats()["stub"]["retries"] == 2
+
+
+def test_gives_up_with_last_response(monkeypatch):
+    monkeypatch.setattr(settings, "latency_backoff_base_sec", 0.0)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(502)
+
+    async def run() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await resilient_get(client, URL, upstream="stub")
+
+    assert asyncio.run(run()).status_code == 502
+    assert calls == settings.latency_max_attempts
+
+
+def test_timed_out_requests_recorded_at_timeout(monkeypatch):
+    """타임아웃된 요청은 표본에서 빠지지 않고 타임아웃 값으로 기록 → p95 가 줄어들지 않는다."""
+    monkeypatch.setattr(settings, "latency_max_attempts", 1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("slow", request=request)
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.ReadTimeout):
+                await resilient_get(client, URL, upstream="stub", default_timeout=7.0)
+
+    asyncio.run(run())
+    stats = latency_tracker.stats()["stub"]
+    assert stats["samples"] == 1 and stats["p95_ms"] == 7000.0
+    assert stats["timeouts"] == 1
+
+
+def test_total_budget_caps_retries(monkeypatch):
+    """재시도 횟수가 남아도 전체 시간 예산을 넘기면 마지막 응답으로 끝낸다."""
+    monkeypatch.setattr(settings, "latency_max_attempts", 50)
+    monkeypatch.setattr(settings, "latency_backoff_base_sec", 0.05)
+    monkeypatch.setattr(settings, "latency_backoff_max_sec", 0.05)
+    monkeypatch.setattr(settings, "latency_min_timeout_sec", 0.01)
+    monkeypatch.setattr(settings, "latency_total_budget_sec", 0.3)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    async def run() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await resilient_get(client, URL, upstream="stub")
+
+    started = time.monotonic()
+    assert asyncio.run(run()).status_code == 503
+    assert time.monotonic() - started < 0.5
+    assert 1 < calls < 50
+
+
+def test_backoff_delay_bounds():
+    retry_after = httpx.Response(429, headers={"Retry-After": "120"})
+    assert backoff_delay(1, retry_after) == settings.latency_backoff_max_sec
+    for attempt in range(1, 6):
+        cap = min(settings.latency_backoff_max_sec, settings.latency_backoff_base_sec * 2 ** (attempt - 1))
+        assert 0 <= backoff_delay(attempt) <= cap
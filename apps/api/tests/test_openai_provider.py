@@ -0,0 +1,202 @@
+"""묶음 요청 제공자(app/openai_provider.py, processor_mode=openai) 테스트. 로컬 스텁 서버를 제공자로 쓴다.
+
+커버리지:
+  pack_batches (토큰 예산·기사 수·순서)
+  ProcessEngine.run (묶음 요청, 동시 전송, 빠진 기사만 재시도, 사용량)
+  POST   /process (제공자 사용량 응답, 키 없으면 mock)
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.fetch_cache import fetch_cache
+from app.openai_provider import estimate_tokens, pack_batches
+from app.process import ArticleInput, ProcessUsage, get_processor
+from app.process_engine import ProcessEngine
+from app.settings import settings
+from app.sources import source_registry
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.batch_sizes: list[int] = []
+        self.seen: set[str] = set()
+        self.active = 0
+        self.peak = 0
+        self.status = 200
+        self.delay = 0.0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """OpenAI chat completions 흉내. 제목에 flaky 가 있으면 처음 한 번 응답에서 빼고, bad 는 항상 잘못된 값."""
+
+    protocol_version = "HTTP/1.1"
+    server: _StubServer
+
+    def do_POST(self) -> None:  # noqa: N802
+        srv = self.server
+        req = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        articles = json.loads(req["messages"][1]["content"])["articles"]
+        with srv.lock:
+            srv.active += 1
+            srv.peak = max(srv.peak, srv.active)
+            srv.batch_sizes.append(len(articles))
+        time.sleep(srv.delay)
+        results = []
+        for a in articles:
+            with srv.lock:
+                first = a["title"] not in srv.seen
+                srv.seen.add(a["title"])
+            if "flaky" in a["title"] and first:
+                continue
+            sentiment = "sideways" if "bad" in a["title"] else ("positive" if "rises" in a["title"] else "neutral")
+            results.append({"id": a["id"], "sentiment": sentiment, "confidence": 0.9, "summary": f"S: {a['title']}"})
+        payload = {
+            "choices": [{"message": {"role": "assistant", "content": json.dumps({"results": results})}}],
+            "usage": {"prompt_tokens": 10 * len(articles), "completion_tokens": 5 * len(articles)},
+        }
+        body = json.dumps(payload).encode() if srv.status == 200 else b'{"error": "nope"}'
+        with srv.lock:
+            srv.active -= 1
+        self.send_response(srv.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        return
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    srv = _StubServer(("127.0.0.1", 0), _Handler)
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    monkeypatch.setattr(settings, "openai_base_url", f"http://127.0.0.1:{srv.server_address[1]}/v1")
+    monkeypatch.setattr(settings, "openai_retry_backoff_sec", 0.0)
+    monkeypatch.setattr(settings, "openai_input_usd_per_mtok", 1.0)
+    monkeypatch.setattr(settings, "openai_output_usd_per_mtok", 2.0)
+    monkeypatch.setattr(settings, "processor_executor", "")
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def engine():
+    eng = ProcessEngine()
+    yield eng
+    eng.shutdown()
+
+
+def _input(n: int, title: str | None = None, lang: str = "en") -> ArticleInput:
+    return ArticleInput(id=n, title_original=title or f"news {n}", snippet_original=None, language_original=lang)
+
+
+# ---------------------------------------------------------------------------
+# 묶기
+# ---------------------------------------------------------------------------
+
+
+def test_pack_batches_token_budget():
+    sizes = [100, 100, 100, 900, 50, 50, 50, 50]
+    batches = pack_batches(sizes, max_tokens=380, max_items=3)  # 시스템 프롬프트 몫을 빼면 300
+    assert batches == [[0, 1, 2], [3], [4, 5, 6], [7]]
+    assert [i for b in batches for i in b] == list(range(len(sizes)))
+    assert estimate_tokens("가나다") > estimate_tokens("abc")
+
+
+# ---------------------------------------------------------------------------
+# 묶음 요청·재시도·사용량
+# ---------------------------------------------------------------------------
+
+
+def test_batched_requests_retry_only_missing(stub: _StubServer, engine: ProcessEngine, monkeypatch):
+    monkeypatch.setattr(settings, "openai_batch_max_articles", 10)
+    monkeypatch.setattr(settings, "openai_max_retries", 2)
+    articles = [_input(n) for n in range(40)]
+    articles[3] = _input(3, "flaky one")
+    articles[25] = _input(25, "flaky two")
+    articles[31] = _input(31, "bad one")
+    articles[5] = _input(5, "국내 반도체 수출 rises", lang="ko")
+
+    usage = ProcessUsage()
+    results = engine.run(articles, mode="openai", usage=usage)
+
+    assert len(results) == 40
+    assert results[0].summary_original == "S: news 0" and results[0].translation_status == "pending"
+    assert results[5].sentiment == "positive" and results[5].translation_status == "not_needed"
+    assert results[3].summary_original == "S: flaky one"
+    assert results[31].translation_status == "failed"
+    # 첫 회차 4묶음, 재시도는 빠진 기사(flaky 2 + bad 1)만 한 묶음, 다시 bad 1
+    assert stub.batch_sizes[:4] == [10, 10, 10, 10]
+    assert sorted(stub.batch_sizes[4:]) == [1, 3]
+    assert usage.requests == 6
+    assert usage.retried_items == 4
+    assert usage.failed_items == 1
+    assert usage.prompt_tokens == 10 * sum(stub.batch_sizes)
+    assert usage.completion_tokens == 5 * sum(stub.batch_sizes)
+    assert usage.cost_usd == pytest.approx((usage.prompt_tokens + 2 * usage.completion_tokens) / 1_000_000)
+
+
+def test_concurrent_batches_limited(stub: _StubServer, engine: ProcessEngine, monkeypatch):
+    stub.delay = 0.05
+    monkeypatch.setattr(settings, "openai_batch_max_articles", 5)
+    monkeypatch.setattr(settings, "openai_concurrency", 3)
+    results = engine.run([_input(n) for n in range(40)], mode="openai")
+    assert all(r.translation_status == "pending" for r in results)
+    assert len(stub.batch_sizes) == 8
+    assert stub.peak == 3
+
+
+def test_client_error_not_retried(stub: _StubServer, engine: ProcessEngine, monkeypatch):
+    stub.status = 401
+    monkeypatch.setattr(settings, "openai_max_retries", 3)
+    usage = ProcessUsage()
+    results = engine.run([_input(n) for n in range(5)], mode="openai", usage=usage)
+    assert all(r.translation_status == "failed" for r in results)
+    assert usage.requests == 1 and usage.failed_items == 5
+
+
+# ---------------------------------------------------------------------------
+# POST /process
+# ---------------------------------------------------------------------------
+
+
+def test_process_reports_provider_usage(client: TestClient, auth_headers: dict, stub: _StubServer, monkeypatch):
+    monkeypatch.setattr(settings, "processor_mode", "openai")
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    source_registry.reset()
+    client.post("/keywords", json={"text": "반도체", "is_active": True}, headers=auth_headers)
+    client.post("/collect", params={"date_kst": "2026-01-02"}, headers=auth_headers)
+
+    body = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert body["processed_new"] > 0 and body["failed"] == 0
+    assert body["provider_requests"] == len(stub.batch_sizes) > 0
+    assert body["provider_cost_usd"] > 0
+
+    # 다시 처리할 기사가 없으면 제공자를 부르지 않는다
+    again = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert again["processed_new"] == 0 and again["provider_requests"] == 0
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+def test_openai_without_key_falls_back_to_mock(monkeypatch):
+    monkeypatch.setattr(settings, "openai_api_key", None)
+    assert get_processor("openai").name == "mock"
+    monkeypatch.setattr(settings, "openai_api_key", "k")
+    assert get_processor("openai").name == "openai"
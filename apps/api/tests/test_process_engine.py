@@ -0,0 +1,279 @@
+"""기사 처리 실행기(app/process_engine.py) 테스트.
+
+커버리지:
+  ProcessEngine.run (inline·thread·process·async)
+  POST   /process (처리 실패 기사 기록, 사용자 공용 처리 캐시, 고정 키워드·최신 기사 우선 증분 커밋)
+  GET    /process/queue
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+from app import collect as collect_mod
+from app import process as process_mod
+from app import translate as translate_mod
+from app.domains.content.models import Article, ArticleKeyword, Keyword, ProcessingResult
+from app.domains.content.processing_cache import content_hash
+from app.domains.content.service import ProcessService
+from app.fetch_cache import fetch_cache
+from app.process import ArticleInput, Processed, Processor, process_article_mock
+from app.process_engine import ProcessEngine
+from app.settings import settings
+from app.models import User
+from app.sources import source_registry
+from app.translate import Translator, translate_mock
+from tests.conftest import collected_item
+
+
+def _input(n: int, title: str | None = None) -> ArticleInput:
+    return ArticleInput(id=n, title_original=title if title is not None else f"news {n}", snippet_original=None, language_original="en")
+
+
+def _slow(article) -> Processed:
+    time.sleep(random.uniform(0, 0.01))  # 끝나는 순서를 섞는다
+    if article.title_original == "boom":
+        raise RuntimeError("model error")
+    return process_article_mock(article)
+
+
+async def _aslow(article) -> Processed:
+    await asyncio.sleep(random.uniform(0, 0.01))
+    return _slow(article)
+
+
+@pytest.fixture
+def engine():
+    eng = ProcessEngine()
+    yield eng
+    eng.shutdown()
+
+
+@pytest.fixture
+def slow_processor(monkeypatch):
+    monkeypatch.setitem(process_mod.PROCESSORS, "slow", Processor("slow", "thread", func=_slow, afunc=_aslow))
+    monkeypatch.setattr(settings, "processor_mode", "slow")
+
+
+# ---------------------------------------------------------------------------
+# 실행 방식·순서·실패 격리
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("kind", ["inline", "thread", "async"])
+def test_results_ordered_and_failures_isolated(engine: ProcessEngine, slow_processor, monkeypatch, kind: str):
+    monkeypatch.setattr(settings, "processor_executor", kind)
+    articles = [_input(n) for n in range(30)]
+    articles[7] = _input(7, "boom")
+
+    results = engine.run(articles)
+    assert len(results) == 30
+    assert [r.summary_original for r in results] == [f"Summary: news {n}" if n != 7 else "boom" for n in range(30)]
+    assert results[7].translation_status == "failed"
+    assert all(r.translation_status == "pending" for i, r in enumerate(results) if i != 7)  # 번역은 process_day 가 채움
+
+
+def test_process_pool(engine: ProcessEngine, monkeypatch):
+    """CPU 처리기용 프로세스 풀. 작업자 예외(제목 없음)도 그 기사만 실패."""
+    monkeypatch.setattr(settings, "processor_executor", "process")
+    monkeypatch.setattr(settings, "processor_concurrency", 2)
+    articles = [_input(n) for n in range(10)]
+    articles[3] = ArticleInput(id=3, title_original=None, snippet_original=None, language_original="en")
+
+    results = engine.run(articles, mode="mock")
+    assert [r.translation_status for r in results].count("failed") == 1
+    assert results[3].translation_status == "failed"
+    assert results[9].summary_original == "Summary: news 9"
+
+
+def test_concurrency_limit(engine: ProcessEngine, monkeypatch):
+    active = 0
+    peak = 0
+
+    async def _track(article) -> Processed:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.005)
+        active -= 1
+        return process_article_mock(article)
+
+    monkeypatch.setitem(process_mod.PROCESSORS, "track", Processor("track", "async", afunc=_track))
+    monkeypatch.setattr(settings, "processor_concurrency", 3)
+    results = engine.run([_input(n) for n in range(20)], mode="track")
+    assert len(results) == 20
+    assert peak == 3
+
+
+# ---------------------------------------------------------------------------
+# POST /process
+# ---------------------------------------------------------------------------
+
+
+def test_process_records_failed_articles(client: TestClient, auth_headers: dict, slow_processor, monkeypatch):
+    async def fake_gdelt(*, keyword: str, day, max_records: int = 25, since=None):
+        return [collected_item(title) for title in ("alpha rises", "boom", "gamma falls")]
+
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    fetch_cache.clear()
+    source_registry.reset()
+    client.post("/keywords", json={"text": "kw", "is_active": True}, headers=auth_headers)
+    client.post("/collect", params={"date_kst": "2026-01-02"}, headers=auth_headers)
+
+    body = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert body["processed_new"] == 3
+    assert body["failed"] == 1
+
+    report = client.get("/report", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    statuses = {it["title"]: it["translation_status"] for it in report["items"]}
+    assert statuses["boom"] == "failed"
+    assert statuses["alpha rises"] == "completed"
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+# ---------------------------------------------------------------------------
+# 사용자 공용 처리 캐시
+# ---------------------------------------------------------------------------
+
+
+def test_processing_cache_shared_across_users(client: TestClient, auth_headers: dict, monkeypatch):
+    """두 번째 사용자의 같은 기사는 처리기를 부르지 않고 캐시 결과를 복사."""
+    calls: list[str] = []
+
+    def _counting(article) -> Processed:
+        calls.append(article.title_original)
+        return process_article_mock(article)
+
+    monkeypatch.setitem(process_mod.PROCESSORS, "counting", Processor("counting", "inline", func=_counting))
+    monkeypatch.setattr(settings, "processor_mode", "counting")
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    source_registry.reset()
+
+    resp = client.post("/auth/signup", json={"email": "second@test.com", "password": "testpass123"})
+    other = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    for headers in (auth_headers, other):
+        client.post("/keywords", json={"text": "반도체", "is_active": True}, headers=headers)
+        client.post("/collect", params={"date_kst": "2026-01-02"}, headers=headers)
+
+    first = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert first["processed_new"] > 0 and first["cache_hits"] == 0
+    assert len(calls) == first["processed_new"]
+
+    calls.clear()
+    second = client.post("/process", params={"date_kst": "2026-01-02"}, headers=other).json()
+    assert second["processed_new"] == first["processed_new"]
+    assert second["cache_hits"] == second["processed_new"]
+    assert calls == []
+
+    # 처리기 버전, 원문 언어, 번역기 버전이 바뀌면 캐시 키도 바뀐다
+    article = _input(1)
+    counting = Processor("counting", "inline", func=_counting)
+    key = content_hash(counting, article)
+    assert key != content_hash(Processor("counting", "inline", version="2", func=_counting), article)
+    assert key != content_hash(counting, replace(article, language_original="ko"))
+    monkeypatch.setitem(translate_mod.TRANSLATORS, "mock", Translator("mock", "2", translate_mock))
+    assert key != content_hash(counting, article)
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+# ---------------------------------------------------------------------------
+# 처리 대기열: 고정 키워드·최신 기사 우선, 묶음마다 커밋
+# ---------------------------------------------------------------------------
+
+
+def test_process_queue_priority_and_depth(client: TestClient, auth_headers: dict, monkeypatch):
+    base = datetime(2026, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+    async def fake_gdelt(*, keyword: str, day, max_records: int = 25, since=None):
+        # 첫 기사는 발행 시각 없음
+        return [
+            replace(collected_item(f"{keyword} story {n}"), published_at=base + timedelta(hours=n) if n != 0 else None)
+            for n in range(3)
+        ]
+
+    order: list[str] = []
+
+    def _recording(article) -> Processed:
+        order.append(article.title_original)
+        return process_article_mock(article)
+
+    monkeypatch.setitem(process_mod.PROCESSORS, "recording", Processor("recording", "inline", func=_recording))
+    monkeypatch.setattr(settings, "processor_mode", "recording")
+    monkeypatch.setattr(settings, "process_queue_chunk", 2)
+    monkeypatch.setattr(settings, "collector_mode", "live")
+    monkeypatch.setattr(collect_mod, "search_gdelt", fake_gdelt)
+    fetch_cache.clear()
+    source_registry.reset()
+    client.post("/keywords", json={"text": "alpha", "is_active": True}, headers=auth_headers)
+    pinned = client.post("/keywords", json={"text": "bravo", "is_active": True}, headers=auth_headers).json()
+    client.patch(f"/keywords/{pinned['id']}", json={"is_pinned": True}, headers=auth_headers)
+    client.post("/collect", params={"date_kst": "2026-01-02"}, headers=auth_headers)
+
+    depth = client.get("/process/queue", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert depth["pending"] == 6 and depth["pending_pinned"] == 3 and depth["processed"] == 0
+
+    body = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert body["queued"] == 6 and body["processed_new"] == 6
+    # 고정 키워드 먼저, 그 안에서 최신 published_at 순(없는 기사는 뒤)
+    assert order == [
+        "bravo story 2", "bravo story 1", "bravo story 0",
+        "alpha story 2", "alpha story 1", "alpha story 0",
+    ]
+    depth = client.get("/process/queue", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    assert depth["pending"] == 0 and depth["processed"] == 6
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+def test_process_commits_each_chunk(tmp_path, monkeypatch):
+    """앞 묶음의 결과는 뒤 묶음을 처리하는 동안 다른 연결에서 보인다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    seen: list[int] = []
+
+    def _peek(article) -> Processed:
+        with Session(engine) as other:
+            seen.append(other.exec(select(func.count()).select_from(ProcessingResult)).one())
+        return process_article_mock(article)
+
+    monkeypatch.setitem(process_mod.PROCESSORS, "peek", Processor("peek", "inline", func=_peek))
+    monkeypatch.setattr(settings, "processor_mode", "peek")
+    monkeypatch.setattr(settings, "process_queue_chunk", 3)
+    monkeypatch.setattr(settings, "processing_cache_enabled", False)
+
+    with Session(engine) as session:
+        user = User(email="queue@test.com", password_hash="x")
+        kw = Keyword(user_id=user.id, text="kw", is_pinned=True)
+        articles = [
+            Article(
+                user_id=user.id,
+                date_kst="2026-01-02",
+                canonical_url=f"https://example.com/{n}",
+                original_url=f"https://example.com/{n}",
+                source_type="search_api",
+                title_original=f"news {n}",
+                language_original="ko",
+            )
+            for n in range(7)
+        ]
+        session.add_all([user, kw, *articles])
+        session.add(ArticleKeyword(article_id=articles[6].id, keyword_id=kw.id))
+        session.commit()
+        user_id = user.id
+
+        summary = ProcessService.process_day(session, user_id, "2026-01-02")
+        assert summary.processed_new == 7
+        assert seen == [0, 0, 0, 3, 3, 3, 6]
+        assert summary.queued == 7
+    engine.dispose()
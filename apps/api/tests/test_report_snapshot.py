@@ -0,0 +1,189 @@
+"""리포트 스냅샷(domains/content/report_snapshot.py) 테스트.
+
+커버리지:
+  GET    /report (스냅샷 재사용, ETag·If-None-Match 304, 키워드 필터별 저장)
+  POST   /collect, POST /process, PATCH /keywords/{id} (해당 날짜만 무효화, 스냅샷을 끈 동안에도)
+  ReportSnapshotService.put (옛 버전은 덮어쓰지 않음)
+"""
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.domains.content.report_snapshot import ReportSnapshotService, filter_key
+from app.fetch_cache import fetch_cache
+from app.routers import report as report_mod
+from app.settings import settings
+from app.sources import source_registry
+
+DAY = "2026-01-02"
+OTHER_DAY = "2026-01-03"
+
+
+@pytest.fixture
+def builds(monkeypatch) -> list[tuple[str, object]]:
+    """리포트를 새로 만든 (날짜, 키워드 필터) 기록."""
+    calls: list[tuple[str, object]] = []
+    original = report_mod.build_report
+
+    def _counting(session, user, day_str, keyword_id, collapse):
+        calls.append((day_str, keyword_id))
+        return original(session, user, day_str, keyword_id, collapse)
+
+    monkeypatch.setattr(report_mod, "build_report", _counting)
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    source_registry.reset()
+    yield calls
+    fetch_cache.clear()
+    source_registry.reset()
+
+
+def _report(client: TestClient, headers: dict, day: str = DAY, **params):
+    return client.get("/report", params={"date_kst": day, **params}, headers=headers)
+
+
+def _setup(client: TestClient, headers: dict) -> dict:
+    kw = client.post("/keywords", json={"text": "반도체", "is_active": True}, headers=headers).json()
+    for day in (DAY, OTHER_DAY):
+        client.post("/collect", params={"date_kst": day}, headers=headers)
+    return kw
+
+
+# ---------------------------------------------------------------------------
+# 스냅샷 재사용·ETag
+# ---------------------------------------------------------------------------
+
+
+def test_snapshot_reused_until_invalidated(client: TestClient, auth_headers: dict, builds):
+    _setup(client, auth_headers)
+    first = _report(client, auth_headers)
+    second = _report(client, auth_headers)
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.json()["total_articles"] > 0
+    assert first.headers["etag"] == second.headers["etag"]
+    assert builds == [(DAY, None)]
+
+    resp = client.get(
+        "/report", params={"date_kst": DAY}, headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+    )
+    assert resp.status_code == 304
+    assert builds == [(DAY, None)]
+
+    # 캐시가 여러 버전을 갖고 있으면 목록으로 보낸다
+    stale = 'W/"0-0000000000000000"'
+    for header in (f"{stale}, {first.headers['etag']}", first.headers["etag"].removeprefix("W/"), "*"):
+        resp = client.get("/report", params={"date_kst": DAY}, headers={**auth_headers, "If-None-Match": header})
+        assert resp.status_code == 304, header
+    resp = client.get("/report", params={"date_kst": DAY}, headers={**auth_headers, "If-None-Match": stale})
+    assert resp.status_code == 200
+    assert builds == [(DAY, None)]
+
+
+def test_keyword_filter_and_collapse_are_separate_entries(client: TestClient, auth_headers: dict, builds):
+    kw = _setup(client, auth_headers)
+    _report(client, auth_headers)
+    _report(client, auth_headers, keyword_id=kw["id"])
+    _report(client, auth_headers, collapse="false")
+    _report(client, auth_headers, keyword_id=kw["id"])
+    assert len(builds) == 3
+    tags = {
+        _report(client, auth_headers).headers["etag"],
+        _report(client, auth_headers, keyword_id=kw["id"]).headers["etag"],
+    }
+    assert len(tags) == 2
+
+
+# ---------------------------------------------------------------------------
+# 무효화
+# ---------------------------------------------------------------------------
+
+
+def test_process_invalidates_only_that_day(client: TestClient, auth_headers: dict, builds):
+    _setup(client, auth_headers)
+    before = _report(client, auth_headers).json()
+    other = _report(client, auth_headers, OTHER_DAY)
+    assert all(it["sentiment"] is None for it in before["items"])
+
+    client.post("/process", params={"date_kst": DAY}, headers=auth_headers)
+    after = _report(client, auth_headers).json()
+    assert after["version"] > before["version"]
+    assert all(it["sentiment"] is not None for it in after["items"])
+    assert _report(client, auth_headers, OTHER_DAY).headers["etag"] == other.headers["etag"]
+    assert builds == [(DAY, None), (OTHER_DAY, None), (DAY, None)]
+
+
+def test_collect_invalidates(client: TestClient, auth_headers: dict, builds):
+    _setup(client, auth_headers)
+    version = _report(client, auth_headers).json()["version"]
+    client.post("/keywords", json={"text": "배터리", "is_active": True}, headers=auth_headers)
+    client.post("/collect", params={"date_kst": DAY}, headers=auth_headers)
+    report = _report(client, auth_headers).json()
+    assert report["version"] > version
+    assert {k["text"] for k in report["keywords"]} == {"반도체", "배터리"}
+
+
+def test_keyword_pin_invalidates_its_days(client: TestClient, auth_headers: dict, builds):
+    kw = _setup(client, auth_headers)
+    assert _report(client, auth_headers).json()["keywords"][0]["is_pinned"] is False
+    _report(client, auth_headers, OTHER_DAY)
+
+    # 기사가 없는 키워드 변경은 어떤 날짜도 무효화하지 않는다
+    empty = client.post("/keywords", json={"text": "없는키워드", "is_active": True}, headers=auth_headers).json()
+    client.patch(f"/keywords/{empty['id']}", json={"is_pinned": True}, headers=auth_headers)
+    _report(client, auth_headers)
+    assert len(builds) == 2
+
+    # 같은 URL 은 먼저 수집한 날짜에만 저장되므로 OTHER_DAY 에는 이 키워드 기사가 없다
+    assert _report(client, auth_headers, OTHER_DAY).json()["total_articles"] == 0
+    client.patch(f"/keywords/{kw['id']}", json={"is_pinned": True}, headers=auth_headers)
+    assert _report(client, auth_headers).json()["keywords"][0]["is_pinned"] is True
+    _report(client, auth_headers, OTHER_DAY)
+    assert builds == [(DAY, None), (OTHER_DAY, None), (DAY, None)]
+
+
+def test_versions_bumped_while_disabled(client: TestClient, auth_headers: dict, builds, monkeypatch):
+    """스냅샷을 끈 동안의 수집도 버전을 올려, 다시 켰을 때 옛 스냅샷·ETag 를 쓰지 않는다."""
+    _setup(client, auth_headers)
+    before = _report(client, auth_headers)
+
+    monkeypatch.setattr(settings, "report_snapshot_enabled", False)
+    client.post("/keywords", json={"text": "배터리", "is_active": True}, headers=auth_headers)
+    client.post("/collect", params={"date_kst": DAY}, headers=auth_headers)
+    monkeypatch.setattr(settings, "report_snapshot_enabled", True)
+
+    resp = client.get(
+        "/report", params={"date_kst": DAY}, headers={**auth_headers, "If-None-Match": before.headers["etag"]}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != before.headers["etag"]
+    assert resp.json()["version"] > before.json()["version"]
+    assert {k["text"] for k in resp.json()["keywords"]} == {"반도체", "배터리"}
+
+
+def test_older_put_does_not_replace_newer_snapshot(session: Session):
+    """버전 N 으로 만든 느린 요청이 N+1 저장 뒤에 끝나도 새 스냅샷을 덮어쓰지 않는다."""
+    user_id = uuid4()
+    key = filter_key(None, True)
+    ReportSnapshotService.put(session, user_id, DAY, key, 2, '{"v": 2}')
+    ReportSnapshotService.put(session, user_id, DAY, key, 1, '{"v": 1}')
+    session.commit()
+    assert ReportSnapshotService.get(session, user_id, DAY, key, 2) == '{"v": 2}'
+    assert ReportSnapshotService.get(session, user_id, DAY, key, 1) is None
+
+    ReportSnapshotService.put(session, user_id, DAY, key, 3, '{"v": 3}')
+    session.commit()
+    assert ReportSnapshotService.get(session, user_id, DAY, key, 3) == '{"v": 3}'
+
+
+def test_disabled_builds_every_time(client: TestClient, auth_headers: dict, builds, monkeypatch):
+    monkeypatch.setattr(settings, "report_snapshot_enabled", False)
+    _setup(client, auth_headers)
+    resp = _report(client, auth_headers)
+    _report(client, auth_headers)
+    assert "etag" not in resp.headers
+    assert len(builds) == 2
@@ -0,0 +1,189 @@
+"""백그라운드 수집 스케줄러(app/scheduler.py) 테스트."""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+from app.domains.content import service as service_mod
+from app.domains.content.service import CollectService
+from app.fetch_cache import fetch_cache
+from app.models import Article, CollectJob, Keyword, NotificationSetting, ProcessingResult, User
+from app.scheduler import CollectScheduler
+from app.settings import settings
+
+# 2026-01-02 09:00 KST
+NOW = datetime(2026, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(name="engine")
+def engine_fixture(db_engine, monkeypatch):
+    """공용 인메모리 DB(conftest db_engine) + mock 수집, 공유 수집 캐시는 비운 상태로."""
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    yield db_engine
+    fetch_cache.clear()
+
+
+def _user(session: Session, email: str, *, keyword: bool = True, report_time: str | None = None, enabled: bool = True) -> User:
+    user = User(email=email, password_hash="x")
+    session.add(user)
+    if keyword:
+        session.add(Keyword(user_id=user.id, text=f"{email}-kw"))
+    if report_time is not None:
+        session.add(NotificationSetting(user_id=user.id, daily_report_time_hhmm=report_time, is_enabled=enabled))
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+def test_plan_creates_jobs_before_report_time(engine):
+    """활성 키워드가 있고 알림이 켜진 사용자만, 리포트 시각 - 선행 시간에 작업 생성."""
+    with Session(engine) as session:
+        default_user = _user(session, "a@test.com")
+        early_user = _user(session, "b@test.com", report_time="07:00")
+        _user(session, "c@test.com", report_time="07:00", enabled=False)
+        _user(session, "d@test.com", keyword=False)
+        default_id, early_id = default_user.id, early_user.id
+
+    scheduler = CollectScheduler(engine)
+    assert scheduler.plan(NOW) == 2
+    assert scheduler.plan(NOW) == 0  # 재실행해도 중복 생성 없음
+
+    with Session(engine) as session:
+        jobs = {j.user_id: j for j in session.exec(select(CollectJob)).all()}
+    assert set(jobs) == {default_id, early_id}
+    assert all(j.date_kst == "2026-01-02" for j in jobs.values())
+    # 09:00 KST - 30분 = 전날 23:30 UTC
+    assert jobs[default_id].run_at.replace(tzinfo=timezone.utc) == datetime(2026, 1, 1, 23, 30, tzinfo=timezone.utc)
+    assert jobs[early_id].run_at.replace(tzinfo=timezone.utc) == datetime(2026, 1, 1, 21, 30, tzinfo=timezone.utc)
+
+
+def test_lease_prevents_double_run_until_expiry(engine):
+    """한 워커가 리스한 작업은 다른 워커가 못 가져가고, 리스 만료 후에는 가져감."""
+    with Session(engine) as session:
+        _user(session, "a@test.com")
+        _user(session, "b@test.com")
+    worker_a = CollectScheduler(engine, worker_id="a")
+    worker_b = CollectScheduler(engine, worker_id="b")
+    worker_a.plan(NOW)
+
+    assert len(worker_a.claim(10, NOW)) == 2
+    assert worker_b.claim(10, NOW) == []
+
+    expired = NOW + timedelta(seconds=settings.scheduler_lease_sec + 1)
+    reclaimed = worker_b.claim(10, expired)
+    assert len(reclaimed) == 2
+    with Session(engine) as session:
+        jobs = session.exec(select(CollectJob)).all()
+    assert all(j.lease_owner == "b" and j.attempts == 2 for j in jobs)
+
+
+def test_tick_precomputes_collect_and_process(engine):
+    """tick 한 번으로 수집·처리까지 끝나 리포트는 저장된 결과만 읽으면 됨."""
+    with Session(engine) as session:
+        user = _user(session, "a@test.com", report_time="00:00")
+        user_id = user.id
+
+    scheduler = CollectScheduler(engine)
+    assert asyncio.run(scheduler.tick()) == 1
+    assert asyncio.run(scheduler.tick()) == 0
+
+    with Session(engine) as session:
+        job = session.exec(select(CollectJob)).one()
+        assert job.status == "done"
+        assert job.lease_owner is None
+        articles = session.exec(select(func.count()).select_from(Article).where(Article.user_id == user_id)).one()
+        results = session.exec(select(func.count()).select_from(ProcessingResult)).one()
+    assert articles == 1
+    assert results == 1
+
+
+def test_failed_job_is_retried_later(engine, monkeypatch):
+    """실패한 작업은 error 기록 후 백오프 시각으로 재예약."""
+    with Session(engine) as session:
+        _user(session, "a@test.com", report_time="00:00")
+
+    async def boom(*args, **kwargs):
+        raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(CollectService, "collect_day", boom)
+    scheduler = CollectScheduler(engine)
+    assert asyncio.run(scheduler.tick()) == 1
+
+    with Session(engine) as session:
+        job = session.exec(select(CollectJob)).one()
+    assert job.status == "failed"
+    assert "upstream down" in (job.last_error or "")
+    assert job.attempts == 1
+    assert job.run_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+
+
+def test_backpressure_halves_and_recovers_concurrency(engine, monkeypatch):
+    """느린 작업이 있으면 동시 실행 수를 절반으로, 빠르면 하나씩 회복."""
+    monkeypatch.setattr(settings, "scheduler_slow_job_sec", 1.0)
+    scheduler = CollectScheduler(engine)
+    scheduler.max_concurrency = scheduler.concurrency = 4
+    scheduler._adjust_concurrency([0.1, 2.5])
+    assert scheduler.concurrency == 2
+    scheduler._adjust_concurrency([2.0])
+    assert scheduler.concurrency == 1
+    scheduler._adjust_concurrency([0.1])
+    assert scheduler.concurrency == 2
+
+
+def test_concurrent_jobs_do_not_hold_connection_while_fetching(tmp_path, monkeypatch):
+    """커넥션 1개 풀에서도 동시 작업이 외부 수집을 기다리는 동안 서로를 막지 않음."""
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    fetch_cache.clear()
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", pool_size=1, max_overflow=0, pool_timeout=2)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        _user(session, "a@test.com", report_time="00:00")
+        _user(session, "b@test.com", report_time="00:00")
+
+    original = service_mod.collect_keywords
+
+    async def slow_collect(*args, **kwargs):
+        await asyncio.sleep(0.2)
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(service_mod, "collect_keywords", slow_collect)
+    scheduler = CollectScheduler(engine)
+    monkeypatch.setattr(scheduler, "_process", lambda user_id, date_kst: None)
+    started = time.monotonic()
+    assert asyncio.run(scheduler.tick()) == 2
+    assert time.monotonic() - started < 1.5
+
+    with Session(engine) as session:
+        jobs = session.exec(select(CollectJob)).all()
+        articles = session.exec(select(func.count()).select_from(Article)).one()
+    assert [j.status for j in jobs] == ["done", "done"]
+    assert articles == 2
+    engine.dispose()
+    fetch_cache.clear()
+
+
+def test_lease_renewed_while_job_runs(engine, monkeypatch):
+    """처리가 리스 시간보다 오래 걸려도 실행 중 연장되어 다른 워커가 가져가지 못함."""
+    monkeypatch.setattr(settings, "scheduler_lease_sec", 0.3)
+    with Session(engine) as session:
+        _user(session, "a@test.com", report_time="00:00")
+    scheduler = CollectScheduler(engine, worker_id="a")
+    other = CollectScheduler(engine, worker_id="b")
+    stolen: list = []
+
+    def slow_process(user_id, date_kst) -> None:
+        for _ in range(4):
+            time.sleep(0.15)
+            stolen.extend(other.claim(1))
+
+    monkeypatch.setattr(scheduler, "_process", slow_process)
+    assert asyncio.run(scheduler.tick()) == 1
+    assert stolen == []
+    with Session(engine) as session:
+        job = session.exec(select(CollectJob)).one()
+    assert job.status == "done" and job.attempts == 1
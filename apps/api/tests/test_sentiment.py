@@ -0,0 +1,42 @@
+"""오프라인 감성 사전(app/sentiment.py, processor_mode=lexicon) 테스트."""
+from __future__ import annotations
+
+from app.process import ArticleInput
+from app.process_engine import ProcessEngine
+from app.sentiment import score_text, score_texts
+from benchmarks.sentiment import accuracy, load_fixture
+
+
+def test_labelled_fixture_accuracy():
+    acc = accuracy(load_fixture())
+    assert acc["total"] >= 100
+    assert acc["accuracy"] >= 0.9
+    assert all(value >= 0.85 for value in acc["by_lang"].values())
+
+
+def test_korean_stems_and_negation():
+    assert score_text("삼성전자 주가 급등했다").label == "positive"
+    assert score_text("실적 개선되지 못했다").label == "negative"
+    assert score_text("sales did not improve").label == "negative"
+    assert score_text("정기 주주총회 개최").label == "neutral"
+
+
+def test_batch_matches_single_and_keeps_order():
+    texts = ["Tesla stock plunges on recall", "", "코스피 반등", "회의 개최"] * 50
+    batch = score_texts(texts)
+    assert [s.label for s in batch[:4]] == ["negative", "neutral", "positive", "neutral"]
+    assert batch[2] == score_text("코스피 반등")
+    assert all(0.0 <= s.confidence <= 1.0 for s in batch)
+
+
+def test_lexicon_processor_via_engine():
+    engine = ProcessEngine()
+    articles = [
+        ArticleInput(1, "Apple shares surge after record sales", None, "en"),
+        ArticleInput(2, "배터리 공장 화재로 생산 중단", None, "ko"),
+    ]
+    results = engine.run(articles, mode="lexicon")
+    assert [r.sentiment for r in results] == ["positive", "negative"]
+    assert results[0].translation_status == "pending"
+    assert results[1].translation_status == "not_needed"
+    engine.shutdown()
@@ -0,0 +1,113 @@
+"""번역 메모(domains/content/translation_memo.py) 테스트.
+
+커버리지:
+  TranslationMemoService.translate_many (LRU → DB → 제공자)
+  POST   /process (번역 메모 적중)
+"""
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, func, select
+
+from app import translate as translate_mod
+from app.domains.content.translation_memo import TranslationMemoService, translation_lru
+from app.fetch_cache import fetch_cache
+from app.models import TranslationMemo
+from app.settings import settings
+from app.sources import source_registry
+from app.translate import Translator
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """호출된 (원문 묶음, 원문 언어)를 기록하는 번역 제공자."""
+    calls: list[tuple[list[str], str]] = []
+
+    def _translate(texts, source_lang, target_lang):
+        calls.append((list(texts), source_lang))
+        if "boom" in texts:
+            raise RuntimeError("provider down")
+        return [f"[{source_lang}>{target_lang}] {t}" for t in texts]
+
+    monkeypatch.setitem(translate_mod.TRANSLATORS, "recording", Translator("recording", "1", _translate))
+    monkeypatch.setattr(settings, "translator_mode", "recording")
+    translation_lru.clear()
+    yield calls
+    translation_lru.clear()
+
+
+# ---------------------------------------------------------------------------
+# 메모 조회·번역
+# ---------------------------------------------------------------------------
+
+
+def test_translates_only_unique_misses_grouped_by_language(session: Session, provider):
+    items = [("hello", "en"), ("bonjour", "fr"), ("hello", "en"), ("world", "en")]
+    stats: dict[str, int] = {}
+    out = TranslationMemoService.translate_many(session, items, stats=stats)
+    session.commit()
+    assert out == ["[en>ko] hello", "[fr>ko] bonjour", "[en>ko] hello", "[en>ko] world"]
+    assert sorted(provider) == [(["bonjour"], "fr"), (["hello", "world"], "en")]
+    assert stats == {"lru": 0, "db": 0, "translated": 3}
+    assert session.exec(select(func.count()).select_from(TranslationMemo)).one() == 3
+
+    # 같은 프로세스: LRU 적중, 제공자 호출 없음
+    provider.clear()
+    stats = {}
+    assert TranslationMemoService.translate_many(session, [("hello", "en")], stats=stats) == ["[en>ko] hello"]
+    assert provider == [] and stats["lru"] == 1
+
+    # 다른 프로세스(LRU 비움): DB 적중. 원문 언어가 다르면 다른 메모
+    translation_lru.clear()
+    stats = {}
+    out = TranslationMemoService.translate_many(session, [("hello", "en"), ("hello", "de")], stats=stats)
+    assert out == ["[en>ko] hello", "[de>ko] hello"]
+    assert stats == {"lru": 0, "db": 1, "translated": 1}
+    assert provider == [(["hello"], "de")]
+
+
+def test_failed_batch_not_memoized(session: Session, provider):
+    out = TranslationMemoService.translate_many(session, [("boom", "en"), ("fine", "ja")])
+    session.commit()
+    assert out == [None, "[ja>ko] fine"]
+    assert session.exec(select(TranslationMemo.source_lang)).all() == ["ja"]
+
+
+def test_provider_version_change_misses_memo(session: Session, provider, monkeypatch):
+    TranslationMemoService.translate_many(session, [("hello", "en")])
+    recording = translate_mod.TRANSLATORS["recording"]
+    monkeypatch.setitem(translate_mod.TRANSLATORS, "recording", Translator("recording", "2", recording.translate))
+    provider.clear()
+    TranslationMemoService.translate_many(session, [("hello", "en")])
+    assert provider == [(["hello"], "en")]
+
+
+# ---------------------------------------------------------------------------
+# POST /process
+# ---------------------------------------------------------------------------
+
+
+def test_process_uses_memo_across_users(client: TestClient, auth_headers: dict, provider, monkeypatch):
+    """같은 영문 요약은 두 번째 사용자 처리 때 번역하지 않는다(처리 캐시를 꺼도)."""
+    monkeypatch.setattr(settings, "collector_mode", "mock")
+    monkeypatch.setattr(settings, "processing_cache_enabled", False)
+    fetch_cache.clear()
+    source_registry.reset()
+    resp = client.post("/auth/signup", json={"email": "second@test.com", "password": "testpass123"})
+    other = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    for headers in (auth_headers, other):
+        client.post("/keywords", json={"text": "chip", "is_active": True}, headers=headers)
+        client.post("/collect", params={"date_kst": "2026-01-02"}, headers=headers)
+
+    first = client.post("/process", params={"date_kst": "2026-01-02"}, headers=auth_headers).json()
+    second = client.post("/process", params={"date_kst": "2026-01-02"}, headers=other).json()
+    assert first["translated_new"] > 0 and first["translation_memo_hits"] == 0
+    assert second["translated_new"] == 0
+    assert second["translation_memo_hits"] == first["translated_new"]
+
+    report = client.get("/report", params={"date_kst": "2026-01-02"}, headers=other).json()
+    translated = [it for it in report["items"] if it["translation_status"] == "completed"]
+    assert translated and all(it["summary_ko"].startswith("[") for it in translated)
+    fetch_cache.clear()
+    source_registry.reset()